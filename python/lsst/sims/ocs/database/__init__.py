@@ -2,4 +2,9 @@
 Module for classes that handle the interaction with the simulation database.
 """
 from .tables import *
+from .column_buffer import *
+from .flush_policy import *
+from .parquet_writer import *
 from .socs_db import *
+from .session_merger import *
+from .session_loader import *
@@ -0,0 +1,162 @@
+from builtins import object
+from builtins import range
+import array
+
+from sqlalchemy import Float, Integer
+
+__all__ = ["ColumnBuffer"]
+
+class ColumnBuffer(object):
+    """Hold the collected rows of a table as columns.
+
+    Each non-nullable Integer and Float column of the table is stored in an :class:`array.array`,
+    all other columns are stored in a list. Appended rows are kept as tuples until a chunk of them
+    is collected and then transposed into the columns at once. This keeps the memory footprint of
+    a night's information small and predictable without paying a per-value cost on every append.
+
+    Attributes
+    ----------
+    table : sqlalchemy.Table
+        The table the information is collected for.
+    names : list[str]
+        The column names in table order.
+    columns : list[array.array or list]
+        The storage for each column in table order.
+    chunk_size : int
+        The number of staged rows that triggers the transposition into the columns.
+    """
+
+    def __init__(self, table, chunk_size=1024):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        table : sqlalchemy.Table
+            The table the information is collected for.
+        chunk_size : int, optional
+            The number of staged rows that triggers the transposition into the columns.
+        """
+        self.table = table
+        self.names = [column.name for column in table.columns]
+        self.typecodes = []
+        for column in table.columns:
+            typecode = None
+            if not column.nullable:
+                if isinstance(column.type, Integer):
+                    typecode = 'l'
+                elif isinstance(column.type, Float):
+                    typecode = 'd'
+            self.typecodes.append(typecode)
+        self.chunk_size = chunk_size
+        self.columns = []
+        self.staged_rows = []
+        self.clear()
+
+    def __len__(self):
+        """int: The number of rows in the buffer.
+        """
+        num_rows = len(self.columns[0]) if len(self.columns) else 0
+        return num_rows + len(self.staged_rows)
+
+    def _transpose(self):
+        """Move the staged rows into the columns.
+
+        A column receiving values that cannot be stored in its array, like a float in an Integer
+        column, is turned into a list.
+        """
+        if not len(self.staged_rows):
+            return
+        for i, values in enumerate(zip(*self.staged_rows)):
+            column = self.columns[i]
+            if isinstance(column, array.array):
+                try:
+                    values = array.array(column.typecode, values)
+                except TypeError:
+                    column = self.columns[i] = list(column)
+            column.extend(values)
+        self.staged_rows = []
+
+    def append(self, values):
+        """Append a row to the buffer.
+
+        Parameters
+        ----------
+        values : dict
+            The row information keyed by column name. Missing columns are stored as None.
+        """
+        self.append_row(tuple(values.get(name) for name in self.names))
+
+    def append_row(self, row):
+        """Append a row given in table column order to the buffer.
+
+        Parameters
+        ----------
+        row : tuple
+            The row information in table column order.
+        """
+        self.staged_rows.append(row)
+        if len(self.staged_rows) >= self.chunk_size:
+            self._transpose()
+
+    def clear(self):
+        """Remove all rows from the buffer.
+        """
+        self.columns = [array.array(typecode) if typecode is not None else []
+                        for typecode in self.typecodes]
+        self.staged_rows = []
+
+    def column(self, name):
+        """Get the stored values of a column.
+
+        Parameters
+        ----------
+        name : str
+            The column name.
+
+        Returns
+        -------
+        array.array or list
+        """
+        self._transpose()
+        return self.columns[self.names.index(name)]
+
+    def rows(self):
+        """Get the rows of the buffer as tuples in table column order.
+
+        Returns
+        -------
+        iterator(tuple)
+        """
+        self._transpose()
+        return zip(*self.columns)
+
+    def update(self, name, indexes, values):
+        """Replace stored values of a column.
+
+        Parameters
+        ----------
+        name : str
+            The column name.
+        indexes : list[int]
+            The row indexes to replace.
+        values : list
+            The new values in the order of the row indexes.
+        """
+        self._transpose()
+        i = self.names.index(name)
+        for index, value in zip(indexes, values):
+            try:
+                self.columns[i][index] = value
+            except TypeError:
+                self.columns[i] = list(self.columns[i])
+                self.columns[i][index] = value
+
+    def items(self):
+        """Get the column names and stored values.
+
+        Returns
+        -------
+        list[tuple(str, array.array or list)]
+        """
+        self._transpose()
+        return [(self.names[i], self.columns[i]) for i in range(len(self.names))]
@@ -0,0 +1,132 @@
+from builtins import object
+from builtins import str
+
+__all__ = ["FlushPolicy"]
+
+class FlushPolicy(object):
+    """Decide when the collected simulation information is written to the database.
+
+    The default policy writes the information once at the end of every night. The information can
+    also be written part way through a night once a number of rows, an estimated number of bytes
+    or an interval of simulated time is reached. Several nights can be collected before writing.
+
+    Attributes
+    ----------
+    max_rows : int
+        The number of collected rows that triggers a write. Zero turns the check off.
+    max_bytes : int
+        The estimated size (bytes) of the collected rows that triggers a write. Zero turns the check off.
+    interval : float
+        The simulated time (seconds) since the last write that triggers a write. Zero turns the
+        check off.
+    nights : int
+        The number of nights to collect before writing at the end of a night.
+    rows : int
+        The number of rows collected since the last write.
+    bytes : int
+        The estimated size (bytes) of the rows collected since the last write.
+    last_timestamp : float
+        The simulated time of the last write. None until the first check.
+    nights_collected : int
+        The number of nights ended since the last write.
+    """
+
+    def __init__(self, max_rows=0, max_bytes=0, interval=0.0, nights=1):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        max_rows : int, optional
+            The number of collected rows that triggers a write. Default is 0 (off).
+        max_bytes : int, optional
+            The estimated size (bytes) of the collected rows that triggers a write. Default is 0 (off).
+        interval : float, optional
+            The simulated time (seconds) between writes. Default is 0 (off).
+        nights : int, optional
+            The number of nights to collect before writing. Default is 1.
+        """
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.nights = max(nights, 1)
+        self.last_timestamp = None
+        self.reset()
+
+    @staticmethod
+    def estimate_bytes(values):
+        """Estimate the size of a row.
+
+        Numbers are counted as 8 bytes and strings by their length.
+
+        Parameters
+        ----------
+        values : tuple or dict
+            The row information in column order or keyed by column name.
+
+        Returns
+        -------
+        int
+        """
+        if isinstance(values, dict):
+            values = values.values()
+        return sum(len(value) if isinstance(value, str) else 8 for value in values)
+
+    def add(self, values):
+        """Account for a newly collected row.
+
+        Parameters
+        ----------
+        values : tuple or dict
+            The row information in column order or keyed by column name.
+        """
+        self.rows += 1
+        if self.max_bytes:
+            self.bytes += self.estimate_bytes(values)
+
+    def end_night(self):
+        """Account for the end of a night.
+
+        Returns
+        -------
+        bool
+            True if the collected information should be written.
+        """
+        self.nights_collected += 1
+        return self.nights_collected >= self.nights
+
+    def reset(self, timestamp=None):
+        """Start collecting after a write.
+
+        Parameters
+        ----------
+        timestamp : float, optional
+            The simulated time of the write.
+        """
+        self.rows = 0
+        self.bytes = 0
+        self.nights_collected = 0
+        if timestamp is not None:
+            self.last_timestamp = timestamp
+
+    def should_write(self, timestamp=None):
+        """Check if the collected information should be written part way through a night.
+
+        Parameters
+        ----------
+        timestamp : float, optional
+            The current simulated time. The interval check is skipped if not provided.
+
+        Returns
+        -------
+        bool
+        """
+        if self.max_rows and self.rows >= self.max_rows:
+            return True
+        if self.max_bytes and self.bytes >= self.max_bytes:
+            return True
+        if self.interval and timestamp is not None:
+            if self.last_timestamp is None:
+                self.last_timestamp = timestamp
+            elif timestamp - self.last_timestamp >= self.interval:
+                return True
+        return False
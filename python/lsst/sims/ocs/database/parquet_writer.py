@@ -0,0 +1,147 @@
+from builtins import object
+import logging
+import os
+
+from sqlalchemy import Float, Integer, String
+
+from lsst.sims.ocs.setup import LoggingLevel
+from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
+from .column_buffer import ColumnBuffer
+
+__all__ = ["ParquetWriter"]
+
+class ParquetWriter(object):
+    """Write simulation tables into Parquet files.
+
+    Each table is written into its own Parquet file within the output directory. Every call to
+    :meth:`write` adds one row group to the table's file, so a night's information ends up in
+    a single row group. The Parquet schema is created from the table definition. When a file stem
+    is given, each table is written into its own directory instead, so files from several writers
+    form one Parquet dataset per table.
+
+    Attributes
+    ----------
+    output_dir : str
+        The directory holding the Parquet files.
+    file_stem : str or None
+        The file name (without extension) used within each table directory.
+    writers : dict(str, pyarrow.parquet.ParquetWriter)
+        The open file writers keyed by table name.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, output_dir, file_stem=None):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        output_dir : str
+            The directory to hold the Parquet files. It is created if necessary.
+        file_stem : str, optional
+            Write <output_dir>/<table>/<file_stem>.parquet files. Default is <output_dir>/<table>.parquet.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the pyarrow package is not available.
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SocsDatabaseError("The pyarrow package is required for the Parquet output format.")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.output_dir = output_dir
+        self.file_stem = file_stem
+        try:
+            os.makedirs(self.output_dir)
+        except OSError:
+            # Another writer may have created the directory.
+            if not os.path.isdir(self.output_dir):
+                raise
+        self.writers = {}
+        self.log = logging.getLogger("database.ParquetWriter")
+
+    def _arrow_type(self, column):
+        """Get the Arrow type for a table column.
+
+        Parameters
+        ----------
+        column : sqlalchemy.Column
+            The table column.
+
+        Returns
+        -------
+        pyarrow.DataType
+        """
+        if isinstance(column.type, Integer):
+            return self.pa.int64()
+        if isinstance(column.type, Float):
+            return self.pa.float64()
+        if isinstance(column.type, String):
+            return self.pa.string()
+        return self.pa.timestamp("us")
+
+    def _get_writer(self, table):
+        """Get the file writer for a table.
+
+        The writer is created the first time the table is written.
+
+        Parameters
+        ----------
+        table : sqlalchemy.Table
+            The table to write.
+
+        Returns
+        -------
+        pyarrow.parquet.ParquetWriter
+        """
+        try:
+            return self.writers[table.name]
+        except KeyError:
+            schema = self.pa.schema([self.pa.field(column.name, self._arrow_type(column),
+                                                   nullable=column.nullable) for column in table.columns])
+            if self.file_stem is None:
+                filename = os.path.join(self.output_dir, "{}.parquet".format(table.name))
+            else:
+                table_dir = os.path.join(self.output_dir, table.name)
+                try:
+                    os.makedirs(table_dir)
+                except OSError:
+                    # Another writer may have created the directory.
+                    if not os.path.isdir(table_dir):
+                        raise
+                filename = os.path.join(table_dir, "{}.parquet".format(self.file_stem))
+            self.writers[table.name] = self.pq.ParquetWriter(filename, schema)
+            return self.writers[table.name]
+
+    def close(self):
+        """Close all the file writers.
+        """
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+    def write(self, table, table_data):
+        """Write a set of rows as a row group of the table's file.
+
+        Parameters
+        ----------
+        table : sqlalchemy.Table
+            The table to write.
+        table_data : list[tuple or collections.OrderedDict] or :class:`.ColumnBuffer`
+            The information for the table. Tuples hold the values in table column order.
+        """
+        writer = self._get_writer(table)
+        if isinstance(table_data, ColumnBuffer):
+            columns = [list(values) for name, values in table_data.items()]
+        elif len(table_data) and not isinstance(table_data[0], dict):
+            columns = [list(values) for values in zip(*table_data)]
+        else:
+            columns = [[values.get(column.name) for values in table_data] for column in table.columns]
+        arrays = [self.pa.array(values, type=field.type) for values, field in zip(columns, writer.schema)]
+        writer.write_table(self.pa.Table.from_arrays(arrays, schema=writer.schema))
+        self.log.log(LoggingLevel.EXTENSIVE.value,
+                     "Wrote {} rows of {} into Parquet.".format(len(table_data), table.name))
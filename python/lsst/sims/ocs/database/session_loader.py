@@ -0,0 +1,196 @@
+import numpy
+import os
+import sqlite3
+
+from sqlalchemy import create_engine, exc, Float, Integer, MetaData, String
+
+from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
+
+__all__ = ["load_session"]
+
+"""The number of rows fetched at a time from the session database.
+"""
+CHUNK_SIZE = 100000
+
+"""The SQL used to restrict the rows of tables without a night column to a range of nights. The
+rows are matched to their observations on both the identifier and the session ID.
+"""
+NIGHT_SUBQUERIES = {
+    "ObsHistory_observationId": "EXISTS (SELECT 1 FROM ObsHistory "
+                                "WHERE ObsHistory.observationId = {table}.ObsHistory_observationId "
+                                "AND ObsHistory.Session_sessionId = {table}.Session_sessionId "
+                                "AND ObsHistory.night BETWEEN ? AND ?)",
+    "SlewHistory_slewCount": "EXISTS (SELECT 1 FROM SlewHistory JOIN ObsHistory "
+                             "ON ObsHistory.observationId = SlewHistory.ObsHistory_observationId "
+                             "AND ObsHistory.Session_sessionId = SlewHistory.Session_sessionId "
+                             "WHERE SlewHistory.slewCount = {table}.SlewHistory_slewCount "
+                             "AND SlewHistory.Session_sessionId = {table}.Session_sessionId "
+                             "AND ObsHistory.night BETWEEN ? AND ?)"
+}
+
+def _column_dtype(column):
+    """Get the NumPy type for a table column.
+
+    Nullable numeric columns and columns of other types are stored as objects.
+
+    Parameters
+    ----------
+    column : sqlalchemy.Column
+        The table column.
+
+    Returns
+    -------
+    str
+    """
+    if not column.nullable:
+        if isinstance(column.type, Integer):
+            return "i8"
+        if isinstance(column.type, Float):
+            return "f8"
+        if isinstance(column.type, String) and column.type.length:
+            return "U{}".format(column.type.length)
+    return "O"
+
+def _night_predicate(table, nights):
+    """Create the SQL restricting a table to a range of nights.
+
+    Parameters
+    ----------
+    table : sqlalchemy.Table
+        The table to restrict.
+    nights : tuple(int, int)
+        The first and last night (inclusive).
+
+    Returns
+    -------
+    tuple(str, tuple)
+        The WHERE clause and its parameters.
+
+    Raises
+    ------
+    :class:`.SocsDatabaseError`
+        If the table cannot be restricted to a range of nights.
+    """
+    if "night" in table.c:
+        return "WHERE night BETWEEN ? AND ?", tuple(nights)
+    for column_name, subquery in NIGHT_SUBQUERIES.items():
+        if column_name in table.c:
+            return "WHERE {}".format(subquery.format(table=table.name)), tuple(nights)
+    raise SocsDatabaseError("Table {} cannot be restricted to a range of nights.".format(table.name))
+
+def _load_table(conn, table, columns=None, nights=None, as_dict=False, chunk_size=CHUNK_SIZE):
+    """Load the rows of a table into a NumPy structured array.
+
+    The rows are counted first so the array can be preallocated and then fetched in chunks.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The connection to the session database.
+    table : sqlalchemy.Table
+        The table to load.
+    columns : list[str], optional
+        The columns to load. Default is all the table columns.
+    nights : tuple(int, int), optional
+        The first and last night (inclusive) to load. Default is all nights.
+    as_dict : bool, optional
+        Flag to return a dictionary of column arrays. Default is False.
+    chunk_size : int, optional
+        The number of rows fetched at a time.
+
+    Returns
+    -------
+    numpy.ndarray or dict(str, numpy.ndarray)
+    """
+    if columns is None:
+        columns = [column.name for column in table.columns]
+    for column_name in columns:
+        if column_name not in table.c:
+            raise SocsDatabaseError("Table {} has no column {}.".format(table.name, column_name))
+    dtype = [(str(column_name), _column_dtype(table.c[column_name])) for column_name in columns]
+
+    where = ""
+    params = ()
+    if nights is not None:
+        where, params = _night_predicate(table, nights)
+
+    num_rows = conn.execute("SELECT count(*) FROM {} {}".format(table.name, where), params).fetchone()[0]
+    data = numpy.empty(num_rows, dtype=dtype)
+    cursor = conn.execute("SELECT {} FROM {} {}".format(", ".join(columns), table.name, where), params)
+    start = 0
+    while start < num_rows:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        data[start:start + len(rows)] = rows
+        start += len(rows)
+
+    if as_dict:
+        return {column_name: data[column_name] for column_name in columns}
+    return data
+
+def load_session(path, tables=None, columns=None, nights=None, as_dict=False, chunk_size=CHUNK_SIZE):
+    """Load information from a session database into NumPy arrays.
+
+    The table definitions are read from the session database. Only the requested columns are
+    loaded and a night range is applied in SQL, so tables without a night column are restricted
+    through their observation or slew identifiers.
+
+    Parameters
+    ----------
+    path : str
+        The session database file.
+    tables : str or list[str], optional
+        The table name(s) to load. Default is ObsHistory.
+    columns : list[str] or dict(str, list[str]), optional
+        The columns to load for a single table or keyed by table name. Default is all columns.
+    nights : tuple(int, int), optional
+        The first and last night (inclusive) to load. Default is all nights.
+    as_dict : bool, optional
+        Flag to return a dictionary of column arrays for each table instead of a structured array.
+        Default is False.
+    chunk_size : int, optional
+        The number of rows fetched at a time. Default is 100000.
+
+    Returns
+    -------
+    numpy.ndarray or dict
+        The information for the table if a single table name was given, otherwise the information
+        keyed by table name.
+
+    Raises
+    ------
+    :class:`.SocsDatabaseError`
+        If the session database, a table or a column does not exist.
+    """
+    if not os.path.exists(path):
+        raise SocsDatabaseError("Session database {} does not exist!".format(path))
+    single_table = not isinstance(tables, (list, tuple))
+    if tables is None:
+        tables = ["ObsHistory"]
+    elif single_table:
+        tables = [tables]
+    if columns is not None and not isinstance(columns, dict):
+        if len(tables) != 1:
+            raise SocsDatabaseError("Columns must be given per table when loading several tables.")
+        columns = {tables[0]: columns}
+    columns = columns or {}
+
+    metadata = MetaData()
+    try:
+        metadata.reflect(bind=create_engine("sqlite:///{}".format(path)), only=tables, views=True)
+    except exc.InvalidRequestError as err:
+        raise SocsDatabaseError(str(err))
+
+    conn = sqlite3.connect(path)
+    try:
+        results = {}
+        for table_name in tables:
+            results[table_name] = _load_table(conn, metadata.tables[table_name],
+                                              columns.get(table_name), nights, as_dict, chunk_size)
+    finally:
+        conn.close()
+
+    if single_table:
+        return results[tables[0]]
+    return results
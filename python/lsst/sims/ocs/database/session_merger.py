@@ -0,0 +1,262 @@
+from __future__ import division
+from builtins import object
+from builtins import range
+import logging
+import multiprocessing
+import os
+import sqlite3
+
+from sqlalchemy import create_engine, MetaData
+
+from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
+from .parquet_writer import ParquetWriter
+
+__all__ = ["SessionMerger", "merge_session_dbs", "write_session_parquet"]
+
+"""The number of rows read at a time from a session database for the Parquet output.
+"""
+PARQUET_BATCH_SIZE = 100000
+
+def _get_schema(sqlite_db):
+    """Get the schema statements from a session database.
+
+    Parameters
+    ----------
+    sqlite_db : str
+        The session database file.
+
+    Returns
+    -------
+    dict(str, list[tuple(str, str)])
+        The table, index and view names and CREATE statements keyed by type.
+    """
+    conn = sqlite3.connect(sqlite_db)
+    try:
+        schema = {"table": [], "index": [], "view": []}
+        result = conn.execute("SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL AND "
+                              "name NOT LIKE 'sqlite_%' ORDER BY rowid")
+        for obj_type, name, sql in result:
+            if obj_type in schema:
+                schema[obj_type].append((name, sql))
+    finally:
+        conn.close()
+    return schema
+
+def merge_session_dbs(output_db, session_dbs, create_tables=True):
+    """Merge session databases into a single SQLite database.
+
+    Each session database is attached in turn and every table is copied with a bulk
+    INSERT ... SELECT in one transaction. The composite keys containing Session_sessionId keep the
+    rows of different sessions apart. The output tables must already exist unless they are created
+    from the schema of the first session database.
+
+    Parameters
+    ----------
+    output_db : str
+        The database file to merge into.
+    session_dbs : list[str]
+        The session database files to merge.
+    create_tables : bool, optional
+        Flag to create the output tables. Default is True.
+
+    Returns
+    -------
+    int
+        The number of merged session databases.
+    """
+    if not len(session_dbs):
+        return 0
+    conn = sqlite3.connect(output_db, isolation_level=None)
+    try:
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA journal_mode=OFF")
+        if create_tables:
+            for name, sql in _get_schema(session_dbs[0])["table"]:
+                conn.execute(sql)
+        tables = {}
+        for name, in conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND "
+                                  "name NOT LIKE 'sqlite_%'").fetchall():
+            tables[name] = [row[1] for row in conn.execute("PRAGMA table_info('{}')".format(name))]
+
+        for session_db in session_dbs:
+            conn.execute("ATTACH DATABASE ? AS session", (session_db,))
+            try:
+                session_tables = set(row[0] for row in
+                                     conn.execute("SELECT name FROM session.sqlite_master "
+                                                  "WHERE type='table'"))
+                conn.execute("BEGIN")
+                try:
+                    for name, columns in tables.items():
+                        if name not in session_tables:
+                            continue
+                        column_list = ", ".join(columns)
+                        conn.execute("INSERT INTO main.{0} ({1}) SELECT {1} FROM session.{0}"
+                                     .format(name, column_list))
+                except sqlite3.Error as err:
+                    conn.execute("ROLLBACK")
+                    raise SocsDatabaseError("Failed to merge {}: {}".format(session_db, str(err)))
+                conn.execute("COMMIT")
+            finally:
+                conn.execute("DETACH DATABASE session")
+    finally:
+        conn.close()
+    return len(session_dbs)
+
+def write_session_parquet(output_dir, session_db):
+    """Write the tables of a session database into a Parquet dataset.
+
+    Each table is written to <output_dir>/<table>/<session db name>.parquet in batches so the session
+    database is never fully held in memory.
+
+    Parameters
+    ----------
+    output_dir : str
+        The directory for the Parquet dataset.
+    session_db : str
+        The session database file.
+
+    Returns
+    -------
+    int
+        The number of written session databases.
+    """
+    file_stem = os.path.splitext(os.path.basename(session_db))[0]
+    writer = ParquetWriter(output_dir, file_stem=file_stem)
+    engine = create_engine("sqlite:///{}".format(session_db))
+    metadata = MetaData()
+    metadata.reflect(bind=engine)
+    conn = engine.connect()
+    try:
+        for table in metadata.sorted_tables:
+            result = conn.execute(table.select())
+            while True:
+                rows = result.fetchmany(PARQUET_BATCH_SIZE)
+                if not rows:
+                    break
+                writer.write(table, [dict(row) for row in rows])
+    finally:
+        conn.close()
+        writer.close()
+    return 1
+
+def _merge_session_dbs_star(args):
+    """Unpack the arguments for :func:`merge_session_dbs` in a worker process.
+    """
+    return merge_session_dbs(*args)
+
+def _write_session_parquet_star(args):
+    """Unpack the arguments for :func:`write_session_parquet` in a worker process.
+    """
+    return write_session_parquet(*args)
+
+class SessionMerger(object):
+    """Consolidate many session databases into one analysis database or Parquet dataset.
+
+    For the SQLite output, the session databases are split across worker processes which each
+    merge their share into a partial database. The partial databases are then merged into the
+    output database and the indexes and views are created once all the information is present.
+    For the Parquet output, every worker writes the tables of one session database at a time.
+
+    Attributes
+    ----------
+    session_dbs : list[str]
+        The session database files to merge.
+    processes : int
+        The number of worker processes.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, session_dbs, processes=1):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        session_dbs : list[str]
+            The session database files to merge.
+        processes : int, optional
+            The number of worker processes. Default is 1.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If a session database does not exist.
+        """
+        for session_db in session_dbs:
+            if not os.path.exists(session_db):
+                raise SocsDatabaseError("Session database {} does not exist!".format(session_db))
+        self.session_dbs = list(session_dbs)
+        self.processes = max(1, min(processes, len(self.session_dbs)))
+        self.log = logging.getLogger("database.SessionMerger")
+
+    def _partition(self):
+        """Split the session databases across the worker processes.
+
+        Returns
+        -------
+        list[list[str]]
+        """
+        return [self.session_dbs[i::self.processes] for i in range(self.processes)]
+
+    def merge_sqlite(self, output_db):
+        """Merge the session databases into a single SQLite database.
+
+        Parameters
+        ----------
+        output_db : str
+            The database file to create.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the output database already exists.
+        """
+        if os.path.exists(output_db):
+            raise SocsDatabaseError("Output database {} already exists!".format(output_db))
+        schema = _get_schema(self.session_dbs[0])
+
+        if self.processes == 1:
+            merge_session_dbs(output_db, self.session_dbs)
+        else:
+            part_dbs = ["{}.part{}".format(output_db, i) for i in range(self.processes)]
+            pool = multiprocessing.Pool(processes=self.processes)
+            try:
+                pool.map(_merge_session_dbs_star, list(zip(part_dbs, self._partition())))
+            finally:
+                pool.close()
+                pool.join()
+            try:
+                merge_session_dbs(output_db, part_dbs)
+            finally:
+                for part_db in part_dbs:
+                    if os.path.exists(part_db):
+                        os.remove(part_db)
+
+        conn = sqlite3.connect(output_db, isolation_level=None)
+        try:
+            for name, sql in schema["index"] + schema["view"]:
+                conn.execute(sql)
+        finally:
+            conn.close()
+        self.log.info("Merged {} session databases into {}".format(len(self.session_dbs), output_db))
+
+    def merge_parquet(self, output_dir):
+        """Write the session databases into a Parquet dataset.
+
+        Parameters
+        ----------
+        output_dir : str
+            The directory for the Parquet dataset.
+        """
+        args = [(output_dir, session_db) for session_db in self.session_dbs]
+        if self.processes == 1:
+            for arg in args:
+                _write_session_parquet_star(arg)
+        else:
+            pool = multiprocessing.Pool(processes=self.processes)
+            try:
+                pool.map(_write_session_parquet_star, args)
+            finally:
+                pool.close()
+                pool.join()
+        self.log.info("Wrote {} session databases into {}".format(len(self.session_dbs), output_dir))
@@ -5,15 +5,41 @@ from datetime import datetime
 import logging
 import numpy
 import os
-from sqlalchemy import create_engine, desc, exc, MetaData
+import sqlite3
+import threading
+import time
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+from sqlalchemy import create_engine, event, exc, MetaData
+from sqlalchemy.pool import StaticPool
 
 from lsst.sims.ocs.setup import LoggingLevel
 from . import tables
+from .column_buffer import ColumnBuffer
+from .flush_policy import FlushPolicy
+from .parquet_writer import ParquetWriter
+from .tables.view_helpers import CreateView
 from lsst.sims.ocs.utilities import expand_path, get_hostname, get_user, get_version
 from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
 
 __all__ = ["SocsDatabase"]
 
+"""The SQLite PRAGMAs applied to the session database connections for each durability setting.
+"""
+DURABILITY_PRAGMAS = {
+    "safe": ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL", "PRAGMA cache_size=-65536",
+             "PRAGMA temp_store=MEMORY"],
+    "fast": ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=OFF", "PRAGMA cache_size=-65536",
+             "PRAGMA temp_store=MEMORY"]
+}
+
+"""The busy timeout (seconds) and number of attempts for locking the session tracking database.
+"""
+SESSION_LOCK_TIMEOUT = 30.0
+SESSION_LOCK_ATTEMPTS = 5
+
 class SocsDatabase(object):
     """Main class for simulation database interaction.
 
@@ -39,9 +65,45 @@ class SocsDatabase(object):
         The instance for holding the session specific tables. SQLite only.
     session_start : int
         A new starting session Id for counting new simulations.
+    async_write : bool
+        Flag to hand the collected information to a background writer thread.
+    write_queue : queue.Queue
+        The bounded queue of collected information waiting for the background writer.
+    durability : str or None
+        The durability setting (safe or fast) for the session database. None uses the SQLite defaults.
+    session_conn : sqlalchemy.engine.Connection
+        The persistent connection to the session database.
+    fast_insert : bool
+        Flag to insert rows through the raw sqlite3 cursor instead of SQLAlchemy Core.
+    insert_statements : dict(str, tuple(str, list[str]))
+        The compiled raw INSERT statement and column order for each table.
+    row_extractors : dict(str, :class:`.RowExtractor`)
+        The instance creating the rows of each table from the collected information.
+    columnar : bool
+        Flag to collect the information in a :class:`.ColumnBuffer` per table instead of a list of rows.
+    output_format : str
+        The format for the nightly information. Options: sqlite, parquet.
+    parquet_writer : :class:`.ParquetWriter`
+        The instance writing the nightly information for the parquet output format.
+    deferred_indexes : bool
+        Flag to create the session database tables without their secondary indexes.
+    working_path : str or None
+        The location of the working session database: :memory: or a directory like a tmpfs mount.
+        None works directly on the session database in the save path.
+    backup_interval : int
+        The number of nights between backups of the working session database. Zero only backs up
+        at the end of the simulation.
+    flush_policy : :class:`.FlushPolicy`
+        The instance deciding when the collected information is written.
+    flush_callbacks : list[func]
+        The functions called before the collected information is written, like the deferred
+        computation of column values.
     """
 
-    def __init__(self, sqlite_save_path=None, session_id_start=None, sqlite_session_save_path=None):
+    def __init__(self, sqlite_save_path=None, session_id_start=None, sqlite_session_save_path=None,
+                 async_write=False, write_queue_size=2, durability=None, fast_insert=False,
+                 columnar=False, output_format="sqlite", deferred_indexes=False, working_path=None,
+                 backup_interval=0, flush_policy=None):
         """Initialize the class.
 
         Parameters
@@ -50,6 +112,32 @@ class SocsDatabase(object):
             A path to save all resulting database files for SQLite.
         session_id_start : int
             A new starting session Id for counting new simulations.
+        async_write : bool, optional
+            Flag to write the collected information from a background thread. Default is False.
+        write_queue_size : int, optional
+            The number of collected data sets allowed to wait for the background writer before
+            :meth:`write` blocks. Default is 2.
+        durability : str, optional
+            The durability setting (safe or fast) for the session database. Default is to use the
+            SQLite defaults.
+        fast_insert : bool, optional
+            Flag to insert rows through the raw sqlite3 cursor. Default is False.
+        columnar : bool, optional
+            Flag to collect the information in columns. Default is False.
+        output_format : str, optional
+            The format for the nightly information. With parquet, the session database only holds
+            the Session, Config, Field, Proposal and ProposalField information. Default is sqlite.
+        deferred_indexes : bool, optional
+            Flag to leave out the secondary indexes until :meth:`create_indexes` is called.
+            Default is False.
+        working_path : str, optional
+            Run the session database in memory (:memory:) or in the given directory and copy it to
+            the save path with :meth:`backup`. Default is to work on the saved database directly.
+        backup_interval : int, optional
+            The number of nights between backups of the working session database. Default is 0.
+        flush_policy : :class:`.FlushPolicy`, optional
+            The instance deciding when the collected information is written. Default is to write
+            at the end of every night.
         """
         self.log = logging.getLogger("database.SocsDatabase")
         self.db_dialect = "sqlite"
@@ -62,14 +150,39 @@ class SocsDatabase(object):
 
         # Parameters for SQLite operations
         self.session_engine = None
+        self.session_conn = None
         self.session_metadata = MetaData()
+        if durability is not None and durability not in DURABILITY_PRAGMAS:
+            raise SocsDatabaseError("Unknown database durability setting: {}".format(durability))
+        self.durability = durability
+        self.fast_insert = fast_insert
+        if output_format not in ("sqlite", "parquet"):
+            raise SocsDatabaseError("Unknown output format: {}".format(output_format))
+        self.output_format = output_format
+        self.parquet_writer = None
+        self.deferred_indexes = deferred_indexes
+        if working_path is not None and not hasattr(sqlite3.Connection, "backup"):
+            raise SocsDatabaseError("A working session database requires the sqlite3 backup API.")
+        self.working_path = working_path
+        self.backup_interval = backup_interval
+        self.insert_statements = {}
+        self.row_extractors = {}
 
         self.session_tracking = tables.create_session(self.metadata, autoincrement=False)
         sqlite_session_tracking_db = "{}_sessions.db".format(get_hostname())
         self.engine = self._make_engine(sqlite_session_tracking_db, self.sqlite_session_save_path)
 
         # Parameter for holding data lists
-        self.data_list = collections.defaultdict(list)
+        self.columnar = columnar
+        self.data_list = self._new_data_list()
+        self.flush_policy = flush_policy if flush_policy is not None else FlushPolicy()
+        self.flush_callbacks = []
+
+        # Parameters for background writing
+        self.async_write = async_write
+        self.write_queue = queue.Queue(maxsize=write_queue_size)
+        self.write_errors = []
+        self.writer_thread = None
 
     @property
     def data_empty(self):
@@ -104,6 +217,7 @@ class SocsDatabase(object):
         self.observation_exposures = tables.create_observation_exposures(metadata)
         self.scheduled_downtime = tables.create_scheduled_downtime(metadata)
         self.unscheduled_downtime = tables.create_unscheduled_downtime(metadata)
+        self.idle_history = tables.create_idle_history(metadata)
         self.proposal = tables.create_proposal(metadata)
         self.proposal_field = tables.create_proposal_field(metadata)
         self.observation_proposal_history = tables.create_observation_proposal_history(metadata)
@@ -115,7 +229,7 @@ class SocsDatabase(object):
                                                                  self.observation_proposal_history,
                                                                  self.field)
 
-    def _make_engine(self, sqlite_db=None, alternate_save_path=None):
+    def _make_engine(self, sqlite_db=None, alternate_save_path=None, durability=None):
         """Create the engine for database interactions.
 
         Parameters
@@ -124,6 +238,75 @@ class SocsDatabase(object):
             The name of the database file for SQLite.
         alternate_save_path : str, optional
             Specify an alternate path to save the database.
+        durability : str, optional
+            The durability setting whose PRAGMAs are applied to every new connection.
+        """
+        engine = create_engine("sqlite:///{}".format(self._make_db_path(sqlite_db, alternate_save_path)))
+        self._listen_for_pragmas(engine, durability)
+        return engine
+
+    def _listen_for_pragmas(self, engine, durability):
+        """Apply the durability PRAGMAs to every new connection of an engine.
+
+        Parameters
+        ----------
+        engine : sqlalchemy.engine.Engine
+            The engine to apply the PRAGMAs to.
+        durability : str or None
+            The durability setting. Nothing is done for None.
+        """
+        if durability is None:
+            return
+        pragmas = DURABILITY_PRAGMAS[durability]
+
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+        event.listen(engine, "connect", set_pragmas)
+
+    def _make_session_engine(self, sqlite_session_db):
+        """Create the engine for the session database.
+
+        The engine works on the saved database unless a working path is set. An in-memory database
+        uses a single connection shared by all threads so the background writer sees the same
+        information.
+
+        Parameters
+        ----------
+        sqlite_session_db : str
+            The name of the session database file for SQLite.
+
+        Returns
+        -------
+        sqlalchemy.engine.Engine
+        """
+        if self.working_path is None:
+            return self._make_engine(sqlite_session_db, durability=self.durability)
+        if self.working_path == ":memory:":
+            engine = create_engine("sqlite://", connect_args={"check_same_thread": False},
+                                   poolclass=StaticPool)
+        else:
+            working_db = self._make_db_path(sqlite_session_db, self.working_path)
+            engine = create_engine("sqlite:///{}".format(working_db))
+        self._listen_for_pragmas(engine, self.durability)
+        return engine
+
+    def _make_db_path(self, sqlite_db, alternate_save_path=None):
+        """Create the full path for a database file.
+
+        Parameters
+        ----------
+        sqlite_db : str
+            The name of the database file for SQLite.
+        alternate_save_path : str, optional
+            Specify an alternate path to save the database.
+
+        Returns
+        -------
+        str
         """
         save_path = None
         if self.sqlite_save_path is not None:
@@ -132,7 +315,7 @@ class SocsDatabase(object):
             save_path = expand_path(alternate_save_path)
         if save_path is not None:
             sqlite_db = os.path.join(save_path, sqlite_db)
-        return create_engine("sqlite:///{}".format(sqlite_db))
+        return sqlite_db
 
     def create_db(self):
         """Create the database tables.
@@ -142,7 +325,73 @@ class SocsDatabase(object):
         """
         self.metadata.create_all(self.engine)
 
-    def new_session(self, run_comment):
+    def _allocate_session_id(self, values, session_id=None):
+        """Record a session in the session tracking database.
+
+        The session ID is chosen and recorded within a single IMMEDIATE transaction, so concurrent
+        simulations on a host never receive the same session ID. Taking the write lock waits for
+        other simulations and is retried if it times out. A session ID whose session database
+        already exists is not recorded.
+
+        Parameters
+        ----------
+        values : dict
+            The Session table information without the session ID.
+        session_id : int, optional
+            The session ID to reserve. Default is the next available session ID.
+
+        Returns
+        -------
+        int
+            The allocated session ID.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the requested session ID is already taken, its session database already exists or
+            the lock cannot be acquired.
+        """
+        tracking_db = self._make_db_path("{}_sessions.db".format(get_hostname()),
+                                         self.sqlite_session_save_path)
+        statement, columns = self._insert_statement("session_tracking")
+        conn = sqlite3.connect(tracking_db, timeout=SESSION_LOCK_TIMEOUT, isolation_level=None)
+        try:
+            for attempt in range(SESSION_LOCK_ATTEMPTS):
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    break
+                except sqlite3.OperationalError as err:
+                    if attempt == SESSION_LOCK_ATTEMPTS - 1:
+                        raise SocsDatabaseError("Cannot lock {}: {}".format(tracking_db, str(err)))
+                    self.log.warning("Waiting for the session tracking database lock.")
+                    time.sleep(2 ** attempt)
+
+            try:
+                table_name = self.session_tracking.name
+                if session_id is None:
+                    row = conn.execute("SELECT max(sessionId) FROM {}".format(table_name)).fetchone()
+                    session_id = self.session_start if row[0] is None else int(row[0]) + 1
+                else:
+                    session_id = int(session_id)
+                    row = conn.execute("SELECT count(*) FROM {} WHERE sessionId = ?".format(table_name),
+                                       (session_id,)).fetchone()
+                    if row[0]:
+                        raise SocsDatabaseError("Session ID {} is already taken!".format(session_id))
+                sqlite_session_db = "{}_{}.db".format(get_hostname(), session_id)
+                if os.path.exists(self._make_db_path(sqlite_session_db)):
+                    raise SocsDatabaseError("Session database {} already exists!".format(sqlite_session_db))
+                values["sessionId"] = session_id
+                conn.execute(statement, [values[column] for column in columns])
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        return session_id
+
+    def new_session(self, run_comment, session_id=None):
         """Log a new session to the database and return the ID.
 
         This function logs a new session to the database and returns the session ID.
@@ -155,43 +404,123 @@ class SocsDatabase(object):
         ----------
         run_comment: str
             The startup comment for the simulation run.
+        session_id : int, optional
+            A specific session ID to reserve instead of the next available one.
 
         Returns
         -------
         int
             The session ID for this simulation run.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the session ID is taken or its session database already exists.
         """
         hostname = get_hostname()
         user = get_user()
         version = get_version()
         date = datetime.utcnow()
 
-        # Get the session ID from the tracking file unless it was just created.
-        conn = self.engine.connect()
-        select = self.session_tracking.select().order_by(desc(self.session_tracking.c.sessionId)).limit(1)
-        result = conn.execute(select)
-        row = result.fetchone()
-        try:
-            self.session_id = int(row[0]) + 1
-        except TypeError:
-            self.session_id = self.session_start
-
-        insert = self.session_tracking.insert()
-        result = conn.execute(insert, sessionId=self.session_id, sessionUser=user, sessionHost=hostname,
-                              sessionDate=date, version=version, runComment=run_comment)
+        # Reserve the session ID in the tracking file.
+        session_values = {"sessionUser": user, "sessionHost": hostname,
+                          "sessionDate": date.strftime("%Y-%m-%d %H:%M:%S.%f"), "version": version,
+                          "runComment": run_comment}
+        self.session_id = self._allocate_session_id(session_values, session_id)
 
         # Create the database for the given session ID.
         sqlite_session_db = "{}_{}.db".format(get_hostname(), self.session_id)
-        self.session_engine = self._make_engine(sqlite_session_db)
+        self.session_engine = self._make_session_engine(sqlite_session_db)
+        self.session_conn = None
+        self._make_parquet_writer()
+        self.session_metadata = MetaData()
         self._create_tables(self.session_metadata, use_autoincrement=False)
-        self.session_metadata.create_all(self.session_engine)
+        if self.deferred_indexes:
+            indexes = self._get_indexes()
+            for index in indexes:
+                index.table.indexes.discard(index)
+            self.session_metadata.create_all(self.session_engine)
+            for index in indexes:
+                index.table.indexes.add(index)
+        else:
+            self.session_metadata.create_all(self.session_engine)
         insert = self.session.insert()
         conn = self.session_engine.connect()
-        result = conn.execute(insert, sessionId=self.session_id, sessionUser=user, sessionHost=hostname,
-                              sessionDate=date, version=version, runComment=run_comment)
+        conn.execute(insert, sessionId=self.session_id, sessionUser=user, sessionHost=hostname,
+                     sessionDate=date, version=version, runComment=run_comment)
+        conn.close()
+        self.backup()
+
+        return self.session_id
+
+    def resume_session(self, session_id):
+        """Reattach to an existing session database.
+
+        This function is used when restarting a simulation from a checkpoint or when the session
+        was allocated by another process. The session specific database must already exist.
+
+        Parameters
+        ----------
+        session_id : int
+            The session ID of the simulation run to resume.
+
+        Returns
+        -------
+        int
+            The session ID for this simulation run.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the session database does not exist.
+        """
+        self.session_id = int(session_id)
+        sqlite_session_db = "{}_{}.db".format(get_hostname(), self.session_id)
+        if not os.path.exists(self._make_db_path(sqlite_session_db)):
+            raise SocsDatabaseError("Session database {} does not exist!".format(sqlite_session_db))
+        self.session_engine = self._make_session_engine(sqlite_session_db)
+        self.session_conn = None
+        self._make_parquet_writer()
+        self.session_metadata = MetaData()
+        self._create_tables(self.session_metadata, use_autoincrement=False)
+        if self.working_path is not None:
+            # Load the saved session database into the working one.
+            saved_conn = sqlite3.connect(self._make_db_path(sqlite_session_db))
+            try:
+                saved_conn.backup(self._get_conn().connection.connection)
+            finally:
+                saved_conn.close()
 
         return self.session_id
 
+    def truncate_session(self, limits):
+        """Remove information written after a given point in the simulation.
+
+        Parameters
+        ----------
+        limits : dict(str, tuple(str, float))
+            The attribute name holding the sqlalchemy.Table instance mapped to a column name and
+            the last value of that column to keep.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the output format is parquet.
+        """
+        if self.output_format == "parquet":
+            raise SocsDatabaseError("Removing information is not supported for the parquet output format.")
+        self.wait_for_writes()
+        conn = self._get_conn()
+        for table_name, (column_name, limit) in limits.items():
+            tbl = getattr(self, table_name)
+            result = conn.execute(tbl.delete().where(tbl.c[column_name] > limit))
+            self.log.debug("Removed {} rows from {}.".format(result.rowcount, tbl.name))
+        # A finalize before the restart may have materialized SummaryAllProps from the removed rows.
+        if self._get_schema_objects(conn).get(self.summary_all_props.name) == "table":
+            conn.execute("DROP TABLE {}".format(self.summary_all_props.name))
+            conn.execute(CreateView(self.summary_all_props.name, self._summary_all_props_select()))
+            self.log.debug("Restored the {} view.".format(self.summary_all_props.name))
+
     def append_data(self, table_name, table_data):
         """Collect information for the provided table.
 
@@ -202,9 +531,21 @@ class SocsDatabase(object):
         table_data: topic
             The Scheduler topic data instance.
         """
-        write_func = getattr(tables, "write_{}".format(table_name))
-        result = write_func(table_data, self.session_id)
-        self.data_list[table_name].append(result)
+        try:
+            extractor = self.row_extractors[table_name]
+        except KeyError:
+            extractor = tables.create_row_extractor(table_name, getattr(self, table_name))
+            self.row_extractors[table_name] = extractor
+        row = extractor(table_data, self.session_id)
+        if self.columnar:
+            try:
+                column_buffer = self.data_list[table_name]
+            except KeyError:
+                column_buffer = self.data_list[table_name] = ColumnBuffer(getattr(self, table_name))
+            column_buffer.append_row(row)
+        else:
+            self.data_list[table_name].append(row)
+        self.flush_policy.add(row)
 
     def clear_data(self):
         """Clear all stored data lists.
@@ -212,43 +553,477 @@ class SocsDatabase(object):
         self.data_list.clear()
         self.log.log(LoggingLevel.EXTENSIVE.value, "After clearing: {}".format(self.data_list))
 
+    def _dump_data(self, table_name, table_data):
+        """Dump information that failed to be inserted into a NumPy file.
+
+        Parameters
+        ----------
+        table_name : str
+            The attribute name holding the sqlalchemy.Table instance.
+        table_data : list[tuple or collections.OrderedDict] or :class:`.ColumnBuffer`
+            The information for the table.
+        """
+        output = collections.defaultdict(list)
+        if isinstance(table_data, ColumnBuffer):
+            for k, v in table_data.items():
+                output[k] = v
+        else:
+            for values in self._table_dicts(table_name, table_data):
+                for k, v in values.items():
+                    output[k].append(v)
+
+        for k, v in output.items():
+            output[k] = numpy.array(v)
+
+        filename = "{}_{}.npz".format(table_name, self.session_id)
+        numpy.savez(open(filename, 'w'), **output)
+        self.log.error("Dumping information into {}".format(filename))
+
+    def _get_indexes(self):
+        """Get the secondary indexes declared on the session database tables.
+
+        Returns
+        -------
+        list[sqlalchemy.Index]
+        """
+        return [index for table in self.session_metadata.sorted_tables for index in table.indexes]
+
+    def _get_schema_objects(self, conn):
+        """Get the objects in the session database schema.
+
+        Parameters
+        ----------
+        conn : sqlalchemy.engine.Connection
+            The DB connection.
+
+        Returns
+        -------
+        dict(str, str)
+            The object names mapped to their types (table, view, index or trigger).
+        """
+        return dict((row[0], row[1]) for row in conn.execute("SELECT name, type FROM sqlite_master"))
+
+    def _summary_all_props_select(self):
+        """Get the query for the SummaryAllProps information.
+
+        Returns
+        -------
+        sqlalchemy.sql.Select
+        """
+        return tables.summary_all_props_select(self.observation_history, self.slew_history,
+                                               self.slew_initial_state, self.proposal,
+                                               self.observation_proposal_history, self.field)
+
     def _get_conn(self):
-        """Get the DB connection.
+        """Get the persistent DB connection.
 
         Returns
         -------
         sqlalchemy.engine.Connection
             The DB connection for the associated type.
         """
-        e = self.session_engine
-        return e.connect()
+        if self.session_conn is None:
+            self.session_conn = self.session_engine.connect()
+        return self.session_conn
+
+    def _insert(self, conn, table_name, table_data):
+        """Insert a set of rows into a table.
+
+        When the fast insert path is active or the information is held in a :class:`.ColumnBuffer`,
+        the rows are handed to the executemany of the raw sqlite3 cursor as plain tuples. Otherwise,
+        the SQLAlchemy Core insert is used.
+
+        Parameters
+        ----------
+        conn : sqlalchemy.engine.Connection
+            The DB connection to write with.
+        table_name : str
+            The attribute name holding the sqlalchemy.Table instance.
+        table_data : list[tuple or collections.OrderedDict] or :class:`.ColumnBuffer`
+            The information for the table. Tuples hold the values in table column order.
+        """
+        is_columnar = isinstance(table_data, ColumnBuffer)
+        if not self.fast_insert and not is_columnar:
+            conn.execute(getattr(self, table_name).insert(), self._table_dicts(table_name, table_data))
+            return
+
+        statement, columns = self._insert_statement(table_name)
+        if is_columnar:
+            rows = table_data.rows()
+        elif len(table_data) and isinstance(table_data[0], dict):
+            rows = [tuple(values.get(column) for column in columns) for values in table_data]
+        else:
+            rows = table_data
+        cursor = conn.connection.cursor()
+        try:
+            cursor.executemany(statement, rows)
+        finally:
+            cursor.close()
+
+    def _insert_statement(self, table_name):
+        """Get the raw INSERT statement for a table.
+
+        The statement is compiled from the table schema the first time it is requested.
+
+        Parameters
+        ----------
+        table_name : str
+            The attribute name holding the sqlalchemy.Table instance.
+
+        Returns
+        -------
+        tuple(str, list[str])
+            The INSERT statement and the column order for its parameters.
+        """
+        try:
+            return self.insert_statements[table_name]
+        except KeyError:
+            tbl = getattr(self, table_name)
+            columns = [column.name for column in tbl.columns]
+            statement = "INSERT INTO {} ({}) VALUES ({})".format(tbl.name, ", ".join(columns),
+                                                                 ", ".join(["?"] * len(columns)))
+            self.insert_statements[table_name] = (statement, columns)
+            return self.insert_statements[table_name]
+
+    def _table_dicts(self, table_name, table_data):
+        """Get the rows of a table as dictionaries.
+
+        Parameters
+        ----------
+        table_name : str
+            The attribute name holding the sqlalchemy.Table instance.
+        table_data : list[tuple or collections.OrderedDict]
+            The information for the table. Tuples hold the values in table column order.
+
+        Returns
+        -------
+        list[dict]
+        """
+        if not len(table_data) or isinstance(table_data[0], dict):
+            return table_data
+        columns = [column.name for column in getattr(self, table_name).columns]
+        return [dict(zip(columns, row)) for row in table_data]
+
+    def _make_parquet_writer(self):
+        """Create the Parquet writer for the current session if the output format requires it.
+        """
+        if self.output_format == "parquet":
+            parquet_dir = "{}_{}_parquet".format(get_hostname(), self.session_id)
+            self.parquet_writer = ParquetWriter(self._make_db_path(parquet_dir))
+
+    def _new_data_list(self):
+        """Create an empty collection for the table information.
+
+        Returns
+        -------
+        dict
+        """
+        if self.columnar:
+            return {}
+        return collections.defaultdict(list)
+
+    def _raise_write_errors(self):
+        """Raise any errors collected by the background writer.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the background writer failed to insert information.
+        """
+        if len(self.write_errors):
+            db_errors = self.write_errors
+            self.write_errors = []
+            raise SocsDatabaseError(os.linesep.join(db_errors))
+
+    def _start_writer(self):
+        """Start the background writer thread.
+        """
+        self.writer_thread = threading.Thread(target=self._writer_loop, name="SocsDatabaseWriter")
+        self.writer_thread.daemon = True
+        self.writer_thread.start()
+
+    def _writer_loop(self):
+        """Drain the write queue into the database.
+
+        This runs in the background writer thread which holds its own connection.
+        """
+        conn = self.session_engine.connect()
+        while True:
+            data_list = self.write_queue.get()
+            try:
+                if data_list is None:
+                    break
+                self.write_errors.extend(self._write_data(conn, data_list))
+            except Exception as err:
+                self.log.exception("Background database write failed!")
+                self.write_errors.append(str(err))
+            finally:
+                self.write_queue.task_done()
+        conn.close()
+
+    def _write_data(self, conn, data_list):
+        """Write a set of collected information into the database.
+
+        All the tables are written within a single transaction.
+
+        Parameters
+        ----------
+        conn : sqlalchemy.engine.Connection
+            The DB connection to write with.
+        data_list : dict(str, list)
+            The attribute names holding the sqlalchemy.Table instances and the data for each.
+
+        Returns
+        -------
+        list[str]
+            The error messages for any failed insertions.
+        """
+        if self.parquet_writer is not None:
+            for table_name, table_data in data_list.items():
+                self.parquet_writer.write(getattr(self, table_name), table_data)
+            return []
+
+        db_errors = []
+        trans = conn.begin()
+        try:
+            for table_name, table_data in data_list.items():
+                try:
+                    self.log.log(LoggingLevel.EXTENSIVE.value, "Writing {} data into DB.".format(table_name))
+                    self.log.log(LoggingLevel.EXTENSIVE.value, "Length of data: {}".format(len(table_data)))
+                    self._insert(conn, table_name, table_data)
+                except (exc.IntegrityError, sqlite3.IntegrityError) as err:
+                    self.log.error("Database insertion failed for {}!".format(table_name))
+                    self._dump_data(table_name, table_data)
+                    db_errors.append(str(err))
+        except Exception:
+            trans.rollback()
+            raise
+        trans.commit()
+        return db_errors
+
+    def backup(self):
+        """Copy the working session database to the save path.
+
+        The copy is made with the SQLite online backup API into a temporary file which then
+        replaces the saved session database. Nothing is done unless a working path is set.
+        """
+        if self.working_path is None:
+            return
+        if self.writer_thread is not None:
+            self.write_queue.join()
+        sqlite_session_db = self._make_db_path("{}_{}.db".format(get_hostname(), self.session_id))
+        tmp_session_db = "{}.tmp".format(sqlite_session_db)
+        backup_conn = sqlite3.connect(tmp_session_db)
+        try:
+            self._get_conn().connection.connection.backup(backup_conn)
+        finally:
+            backup_conn.close()
+        os.rename(tmp_session_db, sqlite_session_db)
+        self.log.debug("Backed up session database to {}.".format(sqlite_session_db))
+
+    def check_flush(self, timestamp=None):
+        """Write the collected information if the flush policy asks for it part way through a night.
+
+        Parameters
+        ----------
+        timestamp : float, optional
+            The current simulated time.
+        """
+        if self.flush_policy.should_write(timestamp):
+            self.flush(timestamp)
+
+    def create_indexes(self):
+        """Create the secondary indexes left out of the session database.
+
+        All the indexes declared in the table definitions are created in a single transaction.
+        Indexes already in the database, e.g. from the finalize of a run that is later resumed, are
+        skipped. Nothing is done unless the indexes were deferred.
+        """
+        if not self.deferred_indexes:
+            return
+        self.wait_for_writes()
+        conn = self._get_conn()
+        existing = self._get_schema_objects(conn)
+        indexes = [index for index in self._get_indexes() if index.name not in existing]
+        trans = conn.begin()
+        try:
+            for index in indexes:
+                index.create(conn)
+        except Exception:
+            trans.rollback()
+            raise
+        trans.commit()
+        self.log.info("Created {} deferred indexes.".format(len(indexes)))
+
+    def end_night(self, timestamp=None):
+        """Write the collected information if the flush policy asks for it at the end of a night.
+
+        Parameters
+        ----------
+        timestamp : float, optional
+            The current simulated time.
+        """
+        if self.flush_policy.end_night():
+            self.flush(timestamp)
+
+    def finalize(self):
+        """Perform finalization steps.
+
+        This function writes any remaining collected information, waits for the background writer
+        to finish and stops it. It also closes the Parquet files.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the background writer failed to insert information.
+        """
+        if not self.data_empty:
+            self.flush()
+        if self.writer_thread is not None:
+            self.write_queue.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+        self._raise_write_errors()
+
+    def flush(self, timestamp=None):
+        """Write the collected information and start a new collection.
+
+        Parameters
+        ----------
+        timestamp : float, optional
+            The current simulated time.
+        """
+        try:
+            for callback in self.flush_callbacks:
+                callback()
+            self.write()
+        finally:
+            self.clear_data()
+            self.flush_policy.reset(timestamp)
+
+    def materialize_summary_all_props(self):
+        """Replace the SummaryAllProps view with a table holding the joined information.
+
+        The table is filled from the view query in a single transaction and the indexes are
+        created after the information is inserted. A table left by an earlier materialization, e.g.
+        from the finalize of a run that is later resumed, is rebuilt. Nothing is done for the parquet
+        output format since the session database does not hold the observation information.
+        """
+        if self.output_format == "parquet":
+            return
+        self.wait_for_writes()
+        selectable = self._summary_all_props_select()
+        summary_table, indexes = tables.create_summary_all_props_table(MetaData(), selectable)
+
+        conn = self._get_conn()
+        trans = conn.begin()
+        try:
+            object_type = self._get_schema_objects(conn).get(summary_table.name)
+            if object_type is not None:
+                # Dropping a table also drops its indexes.
+                conn.execute("DROP {} {}".format(object_type.upper(), summary_table.name))
+            summary_table.create(conn)
+            result = conn.execute(summary_table.insert().from_select([c.name for c in selectable.c],
+                                                                     selectable))
+            for index in indexes:
+                index.create(conn)
+        except Exception:
+            trans.rollback()
+            raise
+        trans.commit()
+        self.summary_all_props = summary_table
+        self.log.info("Materialized {} with {} rows.".format(summary_table.name, result.rowcount))
+
+    def row_count(self, table_name):
+        """Get the number of collected rows for the provided table.
+
+        Parameters
+        ----------
+        table_name : str
+            The attribute name holding the sqlalchemy.Table instance.
+
+        Returns
+        -------
+        int
+        """
+        table_data = self.data_list.get(table_name)
+        return len(table_data) if table_data is not None else 0
+
+    def should_backup(self, night):
+        """Check if the working session database should be backed up after the given night.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+
+        Returns
+        -------
+        bool
+        """
+        return self.working_path is not None and self.backup_interval > 0 and \
+            night % self.backup_interval == 0
+
+    def update_rows(self, table_name, indexes, values):
+        """Replace column values of collected rows for the provided table.
+
+        Parameters
+        ----------
+        table_name : str
+            The attribute name holding the sqlalchemy.Table instance.
+        indexes : list[int]
+            The indexes of the collected rows to update.
+        values : dict(str, list)
+            The new values, in the order of the row indexes, keyed by column name.
+        """
+        table_data = self.data_list[table_name]
+        if isinstance(table_data, ColumnBuffer):
+            for column_name, column_values in values.items():
+                table_data.update(column_name, indexes, column_values)
+            return
+        column_names = [column.name for column in getattr(self, table_name).columns]
+        updates = [(column_names.index(column_name), column_values)
+                   for column_name, column_values in values.items()]
+        for i, index in enumerate(indexes):
+            row = list(table_data[index])
+            for column_index, column_values in updates:
+                row[column_index] = column_values[i]
+            table_data[index] = tuple(row)
+
+    def wait_for_writes(self):
+        """Wait for the background writer to insert all the collected information.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the background writer failed to insert information.
+        """
+        if self.writer_thread is not None:
+            self.write_queue.join()
+        self._raise_write_errors()
 
     def write(self):
         """Write collected information into the database.
+
+        If asynchronous writing is active, the collected information is handed to the background
+        writer and a new, empty collection is started.
+
+        Raises
+        ------
+        :class:`.SocsDatabaseError`
+            If the insertion, or a previous background insertion, failed.
         """
-        conn = self._get_conn()
+        if self.async_write:
+            self._raise_write_errors()
+            if self.writer_thread is None:
+                self._start_writer()
+            self.write_queue.put(self.data_list)
+            self.data_list = self._new_data_list()
+            return
 
-        db_errors = []
-        for table_name, table_data in self.data_list.items():
-            try:
-                self.log.log(LoggingLevel.EXTENSIVE.value, "Writing {} data into DB.".format(table_name))
-                self.log.log(LoggingLevel.EXTENSIVE.value, "Length of data: {}".format(len(table_data)))
-                tbl = getattr(self, table_name)
-                conn.execute(tbl.insert(), table_data)
-            except exc.IntegrityError as err:
-                self.log.error("Database insertion failed for {}!".format(table_name))
-                output = collections.defaultdict(list)
-                for values in table_data:
-                    for k, v in values.items():
-                        output[k].append(v)
-
-                for k, v in output.items():
-                    output[k] = numpy.array(v)
-
-                filename = "{}_{}.npz".format(table_name, self.session_id)
-                numpy.savez(open(filename, 'w'), **output)
-                self.log.error("Dumping information into {}".format(filename))
-                db_errors.append(err.message)
+        db_errors = self._write_data(self._get_conn(), self.data_list)
         if len(db_errors):
             raise SocsDatabaseError(os.linesep.join(db_errors))
 
@@ -262,6 +1037,5 @@ class SocsDatabase(object):
         table_data : list[topic]
             A set of Scheduler topic data instances.
         """
-        conn = self._get_conn()
-        tbl = getattr(self, table_name)
-        conn.execute(tbl.insert(), table_data)
+        self.wait_for_writes()
+        self._insert(self._get_conn(), table_name, table_data)
@@ -1,4 +1,5 @@
 from .base_tbls import *
 from .view_helpers import *
 from .view_tables import *
+from .row_extractors import *
 from .write_tbls import *
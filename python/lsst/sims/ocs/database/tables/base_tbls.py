@@ -2,7 +2,7 @@ from sqlalchemy import Column, Float, Index, Integer, String, Table
 from sqlalchemy.types import DATETIME
 from sqlalchemy import DDL, event
 
-__all__ = ["create_config", "create_field", "create_observation_exposures",
+__all__ = ["create_config", "create_field", "create_idle_history", "create_observation_exposures",
            "create_observation_history", "create_observation_proposal_history", "create_proposal_field",
            "create_proposal", "create_scheduled_downtime",
            "create_session", "create_slew_activities", "create_slew_final_state",
@@ -123,6 +123,46 @@ def create_field(metadata):
 
     return table
 
+def create_idle_history(metadata):
+    """Create the IdleHistory table.
+
+    This function creates the IdleHistory table for tracking the time skipped when the Scheduler
+    offers no target.
+
+    Table Description:
+
+    This table records the time intervals skipped by the adaptive idle skipping. Each entry is one
+    skip ahead in time after a missed target, either by the time to the next observing opportunity
+    from the driver or by an exponentially growing delay.
+
+    Parameters
+    ----------
+    metadata : sqlalchemy.MetaData
+        The database object that collects the tables.
+
+    Returns
+    -------
+    sqlalchemy.Table
+        The IdleHistory table object.
+    """
+    table = Table("IdleHistory", metadata,
+                  Column("idleHistoryId", Integer, primary_key=True, autoincrement=False, nullable=False,
+                         doc="Numeric identifier for the skipped interval."),
+                  Column("Session_sessionId", Integer, primary_key=True, autoincrement=False, nullable=False,
+                         doc="The simulation run session Id."),
+                  Column("night", Integer, nullable=False,
+                         doc="The survey night of the skipped interval."),
+                  Column("startTime", Float, nullable=False,
+                         doc="The UTC time (units=seconds) of the start of the skipped interval."),
+                  Column("duration", Float, nullable=False,
+                         doc="The length (units=seconds) of the skipped interval."),
+                  Column("source", String(16), nullable=False,
+                         doc="The origin of the interval length: hint (from the driver) or backoff."))
+
+    Index("i_IdleHistory_night", table.c.night)
+
+    return table
+
 def create_observation_exposures(metadata):
     """Create ObsExposures table.
 
@@ -274,6 +314,7 @@ def create_observation_history(metadata):
                          doc="A note about the observations."),
                   )
 
+    Index("o_night", table.c.night)
     Index("o_filter", table.c.filter)
     Index("fk_ObsHistory_Session1", table.c.Session_sessionId)
     Index("fk_ObsHistory_Field1", table.c.Field_fieldId)
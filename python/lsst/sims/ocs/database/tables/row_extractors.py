@@ -0,0 +1,154 @@
+from builtins import object
+import itertools
+import operator
+
+__all__ = ["RowExtractor", "ROW_SOURCES", "create_row_extractor"]
+
+def _constant(value):
+    """Create a source that always provides the same value.
+
+    Parameters
+    ----------
+    value : object
+        The value to provide.
+
+    Returns
+    -------
+    func
+    """
+    return lambda data: value
+
+def _total_exposure_time(data):
+    """Sum the exposure times of a target or observation topic.
+
+    Parameters
+    ----------
+    data : SALPY_scheduler.targetC or SALPY_scheduler.observationC
+        The topic instance.
+
+    Returns
+    -------
+    float
+    """
+    return sum(itertools.islice(data.exposureTimes, data.numExposures))
+
+
+"""The sources of the table columns that do not come from an attribute of the same name. A source
+is an attribute name, a tuple index or a function of the data. The tables are keyed by the
+attribute name used for them in :class:`.SocsDatabase`.
+"""
+ROW_SOURCES = {
+    "config": {"configId": 0, "paramName": 1, "paramValue": 2},
+    "field": {"fieldId": 0, "fov": 1, "ra": 2, "dec": 3, "gl": 4, "gb": 5, "el": 6, "eb": 7},
+    "observation_history": {"observationStartMJD": "observationStartMjd",
+                            "observationStartLST": "observationStartLst",
+                            "TargetHistory_targetId": "targetId",
+                            "Field_fieldId": _constant(-1),
+                            "dec": "decl",
+                            "visitExposureTime": _total_exposure_time,
+                            "moonRA": "moonRa",
+                            "sunRA": "sunRa",
+                            "slew_time": "slewTime"},
+    "scheduled_downtime": {"night": 0, "duration": 1, "activity": 2},
+    "target_history": {"Field_fieldId": _constant(-1),
+                       "groupId": _constant(-1),
+                       "requestMJD": "requestMjd",
+                       "dec": "decl",
+                       "angle": "skyAngle",
+                       "requestedExpTime": _total_exposure_time,
+                       "cost": _constant(-1),
+                       "rank": _constant(-1),
+                       "propBoost": _constant(-1),
+                       "numRequestingProps": "numProposals",
+                       "moonRA": "moonRa",
+                       "sunRA": "sunRa"},
+    "unscheduled_downtime": {"night": 0, "duration": 1, "activity": 2}
+}
+
+class RowExtractor(object):
+    """Create the rows of a table from the simulation information.
+
+    The extractor is built once from the table columns. The columns taken from the information are
+    gathered by a single :func:`operator.attrgetter` (or :func:`operator.itemgetter` for plain
+    tuples) and the session ID and computed columns are placed around them, so each row is a
+    tuple in table column order.
+
+    Attributes
+    ----------
+    columns : list[str]
+        The column names in table order.
+    getter : operator.attrgetter or operator.itemgetter
+        The instance gathering the columns taken from the information.
+    specials : list[tuple(int, func)]
+        The column index and the function providing the value for each computed column. The session
+        ID column has no function.
+    """
+
+    def __init__(self, table, sources=None):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        table : sqlalchemy.Table
+            The table to create rows for.
+        sources : dict, optional
+            The source of each column not coming from an attribute of the same name.
+        """
+        sources = sources if sources is not None else {}
+        self.columns = [column.name for column in table.columns]
+        self.specials = []
+        keys = []
+        for index, column_name in enumerate(self.columns):
+            source = sources.get(column_name, column_name)
+            if column_name == "Session_sessionId":
+                self.specials.append((index, None))
+            elif callable(source):
+                self.specials.append((index, source))
+            else:
+                keys.append(source)
+        if all(isinstance(key, int) for key in keys):
+            self.getter = operator.itemgetter(*keys)
+        else:
+            self.getter = operator.attrgetter(*keys)
+        self.single_key = len(keys) == 1
+
+    def __call__(self, data, sid):
+        """Create a row for the table.
+
+        Parameters
+        ----------
+        data : object
+            The topic instance or tuple containing the information.
+        sid : int
+            The current session ID.
+
+        Returns
+        -------
+        tuple
+            The column values in table order.
+        """
+        values = self.getter(data)
+        if self.single_key:
+            values = (values,)
+        if not self.specials:
+            return values
+        values = list(values)
+        for index, func in self.specials:
+            values.insert(index, sid if func is None else func(data))
+        return tuple(values)
+
+def create_row_extractor(table_name, table):
+    """Create the row extractor for a table.
+
+    Parameters
+    ----------
+    table_name : str
+        The attribute name used for the table in :class:`.SocsDatabase`.
+    table : sqlalchemy.Table
+        The table to create rows for.
+
+    Returns
+    -------
+    :class:`.RowExtractor`
+    """
+    return RowExtractor(table, ROW_SOURCES.get(table_name))
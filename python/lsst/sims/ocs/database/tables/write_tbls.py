@@ -1,7 +1,12 @@
-from builtins import range
+from builtins import zip
 import collections
 
-__all__ = ["write_config", "write_field", "write_observation_exposures",
+from sqlalchemy import MetaData
+
+from lsst.sims.ocs.database.tables import base_tbls
+from lsst.sims.ocs.database.tables.row_extractors import create_row_extractor
+
+__all__ = ["write_config", "write_field", "write_idle_history", "write_observation_exposures",
            "write_observation_history", "write_observation_proposal_history", "write_proposal_field",
            "write_proposal", "write_scheduled_downtime",
            "write_slew_activities", "write_slew_history",
@@ -9,24 +14,35 @@ __all__ = ["write_config", "write_field", "write_observation_exposures",
            "write_target_exposures", "write_target_history", "write_target_proposal_history",
            "write_unscheduled_downtime"]
 
-def ordered_dict_from_namedtuple(data, sid=None):
-    """Convert a namedtuple to an OrderedDict.
+"""The row extractors for the write functions keyed by table attribute name.
+"""
+_row_extractors = {}
+
+def _ordered_dict_from_row(table_name, data, sid):
+    """Create a dictionary of data for a table from its row extractor.
+
+    The row extractor is created from the table definition the first time it is needed.
 
     Parameters
     ----------
-    data : collections.namedtuple
-        The data to convert.
-    sid : int, optional
+    table_name : str
+        The attribute name used for the table in :class:`.SocsDatabase`.
+    data : object
+        The topic instance or tuple containing the information.
+    sid : int
         The current session ID.
 
     Returns
     -------
-        collections.OrderedDict
+    collections.OrderedDict
+        A dictionary of the data in table column order.
     """
-    values = data._asdict()
-    if sid is not None:
-        values["Session_sessionId"] = sid
-    return values
+    try:
+        extractor = _row_extractors[table_name]
+    except KeyError:
+        table = getattr(base_tbls, "create_{}".format(table_name))(MetaData())
+        extractor = _row_extractors[table_name] = create_row_extractor(table_name, table)
+    return collections.OrderedDict(zip(extractor.columns, extractor(data, sid)))
 
 def write_config(data, sid):
     """Create a dictionary of data for the Config table.
@@ -43,14 +59,7 @@ def write_config(data, sid):
     collections.OrderedDict
         A dictionary of the data.
     """
-    values = collections.OrderedDict([
-        ('configId', data[0]),
-        ('Session_sessionId', sid),
-        ('paramName', data[1]),
-        ('paramValue', data[2])
-    ])
-
-    return values
+    return _ordered_dict_from_row("config", data, sid)
 
 def write_field(data, sid):
     """Create a dictionary of data for the Field table.
@@ -67,19 +76,24 @@ def write_field(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    values = collections.OrderedDict([
-        ('fieldId', data[0]),
-        ('Session_sessionId', sid),
-        ('fov', data[1]),
-        ('ra', data[2]),
-        ('dec', data[3]),
-        ('gl', data[4]),
-        ('gb', data[5]),
-        ('el', data[6]),
-        ('eb', data[7])
-    ])
-
-    return values
+    return _ordered_dict_from_row("field", data, sid)
+
+def write_idle_history(data, sid):
+    """Create a dictionary of data for the IdleHistory table.
+
+    Parameters
+    ----------
+    data : :class:`.IdleHistory`
+        The instance containing the skipped interval information.
+    sid : int
+        The current session ID.
+
+    Returns
+    -------
+    collections.OrderedDict
+        A dictionary of the data.
+    """
+    return _ordered_dict_from_row("idle_history", data, sid)
 
 def write_observation_exposures(data, sid):
     """Create a dictionary of data for the ObsExposures table.
@@ -96,7 +110,7 @@ def write_observation_exposures(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("observation_exposures", data, sid)
 
 def write_observation_history(data, sid):
     """Create a dictionary of data for the ObsHistory table.
@@ -113,47 +127,7 @@ def write_observation_history(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    values = collections.OrderedDict([
-        ('observationId', data.observationId),
-        ('Session_sessionId', sid),
-        ('observationStartTime', data.observationStartTime),
-        ('observationStartMJD', data.observationStartMjd),
-        ('observationStartLST', data.observationStartLst),
-        ('night', data.night),
-        ('TargetHistory_targetId', data.targetId),
-        ('Field_fieldId', -1),
-        ('groupId', data.groupId),
-        ('ra', data.ra),
-        ('dec', data.decl),
-        ('filter', data.filter),
-        ('angle', data.angle),
-        ('altitude', data.altitude),
-        ('azimuth', data.azimuth),
-        ('numExposures', data.numExposures),
-        ('visitTime', data.visitTime),
-        ('visitExposureTime', sum([data.exposureTimes[i] for i in range(data.numExposures)])),
-        ('airmass', data.airmass),
-        ('skyBrightness', data.skyBrightness),
-        ('cloud', data.cloud),
-        ('seeingFwhm500', data.seeingFwhm500),
-        ('seeingFwhmGeom', data.seeingFwhmGeom),
-        ('seeingFwhmEff', data.seeingFwhmEff),
-        ('fiveSigmaDepth', data.fiveSigmaDepth),
-        ('moonRA', data.moonRa),
-        ('moonDec', data.moonDec),
-        ('moonAlt', data.moonAlt),
-        ('moonAz', data.moonAz),
-        ('moonDistance', data.moonDistance),
-        ('moonPhase', data.moonPhase),
-        ('sunRA', data.sunRa),
-        ('sunDec', data.sunDec),
-        ('sunAlt', data.sunAlt),
-        ('sunAz', data.sunAz),
-        ('solarElong', data.solarElong),
-        ('slew_time', data.slewTime),
-        ('note', data.note)
-    ])
-    return values
+    return _ordered_dict_from_row("observation_history", data, sid)
 
 def write_observation_proposal_history(data, sid):
     """Create a dictionary of data for the ObsProposalHistory table.
@@ -170,7 +144,7 @@ def write_observation_proposal_history(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("observation_proposal_history", data, sid)
 
 def write_proposal_field(data, sid):
     """Create a dictionary of data for the ProposalField table.
@@ -187,7 +161,7 @@ def write_proposal_field(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("proposal_field", data, sid)
 
 def write_proposal(data, sid):
     """Create a dictionary of data for the Proposal table.
@@ -204,8 +178,7 @@ def write_proposal(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
-
+    return _ordered_dict_from_row("proposal", data, sid)
 
 def write_scheduled_downtime(data, sid):
     """Create a dictionary of data for the ScheduledDowntime table.
@@ -222,13 +195,7 @@ def write_scheduled_downtime(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    values = collections.OrderedDict([
-        ('night', data[0]),
-        ('Session_sessionId', sid),
-        ('duration', data[1]),
-        ('activity', data[2])
-    ])
-    return values
+    return _ordered_dict_from_row("scheduled_downtime", data, sid)
 
 def write_slew_activities(data, sid):
     """Create a dictionary of data for the SlewHistory table.
@@ -245,7 +212,7 @@ def write_slew_activities(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("slew_activities", data, sid)
 
 def write_slew_history(data, sid):
     """Create a dictionary of data for the SlewHistory table.
@@ -262,7 +229,7 @@ def write_slew_history(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("slew_history", data, sid)
 
 def write_slew_final_state(data, sid):
     """Create a dictionary of data for the SlewFinalState table.
@@ -279,7 +246,7 @@ def write_slew_final_state(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("slew_final_state", data, sid)
 
 def write_slew_initial_state(data, sid):
     """Create a dictionary of data for the SlewInitialState table.
@@ -296,7 +263,7 @@ def write_slew_initial_state(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("slew_initial_state", data, sid)
 
 def write_slew_maxspeeds(data, sid):
     """Create a dictionary of data for the SlewMaxSpeeds table.
@@ -313,7 +280,7 @@ def write_slew_maxspeeds(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("slew_maxspeeds", data, sid)
 
 def write_target_exposures(data, sid):
     """Create a dictionary of data for the TargetExposures table.
@@ -330,7 +297,7 @@ def write_target_exposures(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("target_exposures", data, sid)
 
 def write_target_history(data, sid):
     """Create a dictionary of data for the TargetHistory table.
@@ -347,41 +314,7 @@ def write_target_history(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    values = collections.OrderedDict([
-        ('targetId', data.targetId),
-        ('Session_sessionId', sid),
-        ('Field_fieldId', -1),
-        ('groupId', -1),
-        ('ra', data.ra),
-        ('dec', data.decl),
-        ('filter', data.filter),
-        ('angle', data.skyAngle),
-        ('numExposures', data.numExposures),
-        ('requestedExpTime', sum([data.exposureTimes[i] for i in range(data.numExposures)])),
-        ('requestTime', data.requestTime),
-        ('requestMJD', data.requestMjd),
-        ('airmass', data.airmass),
-        ('skyBrightness', data.skyBrightness),
-        ('cloud', data.cloud),
-        ('seeing', data.seeing),
-        ('slewTime', data.slewTime),
-        ('cost', -1),
-        ('rank', -1),
-        ('propBoost', -1),
-        ('numRequestingProps', data.numProposals),
-        ('moonRA', data.moonRa),
-        ('moonDec', data.moonDec),
-        ('moonAlt', data.moonAlt),
-        ('moonAz', data.moonAz),
-        ('moonDistance', data.moonDistance),
-        ('moonPhase', data.moonPhase),
-        ('sunRA', data.sunRa),
-        ('sunDec', data.sunDec),
-        ('sunAlt', data.sunAlt),
-        ('sunAz', data.sunAz),
-        ('solarElong', data.solarElong)
-    ])
-    return values
+    return _ordered_dict_from_row("target_history", data, sid)
 
 def write_target_proposal_history(data, sid):
     """Create a dictionary of data for the TargetProposalHistory table.
@@ -398,7 +331,7 @@ def write_target_proposal_history(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    return ordered_dict_from_namedtuple(data, sid=sid)
+    return _ordered_dict_from_row("target_proposal_history", data, sid)
 
 def write_unscheduled_downtime(data, sid):
     """Create a dictionary of data for the UnscheduledDowntime table.
@@ -415,10 +348,4 @@ def write_unscheduled_downtime(data, sid):
     collections.OrderedDict
         A dictionary of the topic data.
     """
-    values = collections.OrderedDict([
-        ('night', data[0]),
-        ('Session_sessionId', sid),
-        ('duration', data[1]),
-        ('activity', data[2])
-    ])
-    return values
+    return _ordered_dict_from_row("unscheduled_downtime", data, sid)
@@ -1,3 +1,5 @@
+import numpy
+
 from lsst.sims.cloudModel import CloudModel
 
 __all__ = ["CloudInterface"]
@@ -35,6 +37,23 @@ class CloudInterface(object):
         """
         return self.cloud_model.get_cloud(delta_time)
 
+    def get_cloud_array(self, delta_times):
+        """Get the cloud for a set of times.
+
+        The cloud model only handles single times, so it is evaluated for each time in turn.
+
+        Parameters
+        ----------
+        delta_times : numpy.ndarray
+            The times (seconds) from the start of the simulation.
+
+        Returns
+        -------
+        numpy.ndarray
+            The cloud (fraction of sky in 8ths) closest to each time.
+        """
+        return numpy.array([self.get_cloud(delta_time) for delta_time in delta_times], dtype=float)
+
     def initialize(self, cloud_file=None):
         """Configure the cloud information.
 
@@ -46,6 +46,30 @@ class SeeingInterface(object):
         """
         return self.seeingSim.get_seeing_singlefilter(delta_time, filter_name, airmass)
 
+    def calculate_seeing_array(self, delta_times, filter_name, airmasses):
+        """Calculate the seeing values for a set of times and airmasses in one filter.
+
+        The seeing model only handles single values, so it is evaluated for each time and airmass
+        in turn.
+
+        Parameters
+        ----------
+        delta_times : numpy.ndarray
+            The times (seconds) from the start of the simulation.
+        filter_name : str
+            The single character filter name for the calculation.
+        airmasses : numpy.ndarray
+            The airmasses for the calculation.
+
+        Returns
+        -------
+        tuple(numpy.ndarray)
+            The FWHM 500nm, FWHM Geometric and FWHM Effective seeing values.
+        """
+        values = [self.calculate_seeing(delta_time, filter_name, airmass)
+                  for delta_time, airmass in zip(delta_times, airmasses)]
+        return tuple(numpy.array(value, dtype=float) for value in zip(*values))
+
     def get_seeing(self, delta_time):
         """Get the seeing for the specified time.
 
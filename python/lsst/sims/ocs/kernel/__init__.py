@@ -1,8 +1,15 @@
 """
 Module for classes pertaining to the SOCS simulation kernel.
 """
+from .checkpoint import *
+from .deferred_conditions import *
 from .downtime_handler import *
+from .event_queue import *
+from .idle_skipper import *
+from .night_boundaries import *
 from .proposal_info import *
+from .state_handoff import *
 from .time_handler import *
 from .sequencer import *
 from .simulator import *
+from .sweep import *
@@ -0,0 +1,163 @@
+from builtins import object
+import glob
+import logging
+import os
+import pickle
+import re
+
+from lsst.sims.ocs.utilities import expand_path, get_hostname
+from lsst.sims.ocs.utilities.socs_exceptions import CheckpointError
+
+__all__ = ["CheckpointHandler"]
+
+class CheckpointHandler(object):
+    """Handle writing and reading night-level simulation checkpoints.
+
+    A checkpoint is a pickled dictionary containing the state of the simulation kernel at the end of
+    a night. The state collection and restoration is done by the :class:`.Simulator`; this class only
+    handles the checkpoint files.
+
+    Attributes
+    ----------
+    save_path : str
+        The directory to save the checkpoint files into.
+    interval : int
+        The number of nights between checkpoints. A value of zero or less disables checkpointing.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, save_path=None, interval=0):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        save_path : str, optional
+            The directory to save the checkpoint files into. Default is the current directory.
+        interval : int, optional
+            The number of nights between checkpoints. Default is no checkpoints.
+        """
+        self.save_path = expand_path(save_path) if save_path is not None else os.curdir
+        self.interval = interval if interval is not None else 0
+        self.log = logging.getLogger("kernel.CheckpointHandler")
+
+    def filename(self, session_id, night):
+        """Get the full path of the checkpoint file for a session and night.
+
+        Parameters
+        ----------
+        session_id : int
+            The simulation session ID.
+        night : int
+            The night at which the checkpoint was taken.
+
+        Returns
+        -------
+        str
+        """
+        return os.path.join(self.save_path, "{}_{}_checkpoint_{}.pkl".format(get_hostname(), session_id,
+                                                                             night))
+
+    def latest_night(self, session_id):
+        """Find the last night with a checkpoint for the given session.
+
+        Parameters
+        ----------
+        session_id : int
+            The simulation session ID.
+
+        Returns
+        -------
+        int
+            The last checkpointed night.
+
+        Raises
+        ------
+        :class:`.CheckpointError`
+            If no checkpoint files exist for the session.
+        """
+        pattern = r"{}_{}_checkpoint_(\d+)\.pkl$".format(re.escape(get_hostname()), session_id)
+        nights = []
+        for ckpt_file in glob.glob(os.path.join(self.save_path, "*_checkpoint_*.pkl")):
+            match = re.search(pattern, os.path.basename(ckpt_file))
+            if match is not None:
+                nights.append(int(match.group(1)))
+        if not len(nights):
+            raise CheckpointError("No checkpoints found for session {} in {}"
+                                  .format(session_id, self.save_path))
+        return max(nights)
+
+    def should_write(self, night):
+        """Determine if a checkpoint is requested for the given night.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+
+        Returns
+        -------
+        bool
+        """
+        return self.interval > 0 and night % self.interval == 0
+
+    def read(self, session_id, night):
+        """Read the checkpoint for a session and night.
+
+        Parameters
+        ----------
+        session_id : int
+            The simulation session ID.
+        night : int
+            The night at which the checkpoint was taken.
+
+        Returns
+        -------
+        dict
+            The simulation state stored in the checkpoint.
+
+        Raises
+        ------
+        :class:`.CheckpointError`
+            If the checkpoint file does not exist.
+        """
+        ckpt_file = self.filename(session_id, night)
+        if not os.path.exists(ckpt_file):
+            raise CheckpointError("Checkpoint file {} does not exist!".format(ckpt_file))
+        self.log.info("Reading checkpoint {}".format(ckpt_file))
+        with open(ckpt_file, "rb") as cfile:
+            return pickle.load(cfile)
+
+    def write(self, session_id, night, state):
+        """Write the checkpoint for a session and night.
+
+        The file is written to a temporary name and then moved into place so that a crash during
+        the write never leaves a truncated checkpoint behind. A state that cannot be pickled is
+        logged and no checkpoint is written, so the simulation can continue.
+
+        Parameters
+        ----------
+        session_id : int
+            The simulation session ID.
+        night : int
+            The night at which the checkpoint is taken.
+        state : dict
+            The simulation state to store.
+
+        Returns
+        -------
+        str or None
+            The full path of the checkpoint file or None if the state cannot be pickled.
+        """
+        ckpt_file = self.filename(session_id, night)
+        tmp_file = ckpt_file + ".tmp"
+        try:
+            with open(tmp_file, "wb") as cfile:
+                pickle.dump(state, cfile, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            os.remove(tmp_file)
+            self.log.error("Skipping checkpoint {}: {}".format(ckpt_file, err))
+            return None
+        os.rename(tmp_file, ckpt_file)
+        self.log.info("Wrote checkpoint {}".format(ckpt_file))
+        return ckpt_file
@@ -0,0 +1,124 @@
+from builtins import object
+from builtins import zip
+import logging
+import numpy
+
+from lsst.sims.utils import m5_flat_sed
+
+__all__ = ["DeferredConditions"]
+
+class DeferredConditions(object):
+    """Compute the observing conditions of the visits in bulk.
+
+    The visit parameters needed for the cloud, seeing and five sigma depth are recorded during the
+    night. Before the collected information is written to the survey database, the values are
+    computed for all recorded visits and placed into the ObsHistory rows. The cloud and seeing
+    models are evaluated visit by visit, while the five sigma depth is computed on NumPy arrays
+    for each filter.
+
+    Attributes
+    ----------
+    seeing_interface : :class:`.SeeingInterface`
+        The instance providing the seeing values.
+    cloud_interface : :class:`.CloudInterface`
+        The instance providing the cloud values.
+    db : :class:`.SocsDatabase`
+        The instance of the survey database.
+    visits : list[tuple]
+        The ObsHistory row index, elapsed time (seconds), filter, airmass, sky brightness and visit
+        exposure time (seconds) for each recorded visit.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, seeing_interface, cloud_interface, db):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        seeing_interface : :class:`.SeeingInterface`
+            The instance providing the seeing values.
+        cloud_interface : :class:`.CloudInterface`
+            The instance providing the cloud values.
+        db : :class:`.SocsDatabase`
+            The instance of the survey database.
+        """
+        self.seeing_interface = seeing_interface
+        self.cloud_interface = cloud_interface
+        self.db = db
+        self.visits = []
+        self.log = logging.getLogger("kernel.DeferredConditions")
+
+    def __len__(self):
+        """int: The number of recorded visits.
+        """
+        return len(self.visits)
+
+    def add(self, row_index, elapsed_time, filter_name, airmass, sky_brightness, exposure_time):
+        """Record the parameters of a visit.
+
+        Parameters
+        ----------
+        row_index : int
+            The index of the visit within the collected ObsHistory rows.
+        elapsed_time : float
+            The time (seconds) from the start of the simulation to the visit start.
+        filter_name : str
+            The single character filter name.
+        airmass : float
+            The airmass of the visit.
+        sky_brightness : float
+            The sky brightness (mag/arcsec^2) of the visit.
+        exposure_time : float
+            The total exposure time (seconds) of the visit.
+        """
+        self.visits.append((row_index, elapsed_time, filter_name, airmass, sky_brightness, exposure_time))
+
+    def compute(self):
+        """Compute the conditions for all the recorded visits.
+
+        Returns
+        -------
+        tuple(list[int], dict(str, numpy.ndarray))
+            The ObsHistory row indexes and the column values for the visits.
+        """
+        row_indexes, elapsed_times, filters, airmasses, sky_brightnesses, exposure_times = \
+            zip(*self.visits)
+        elapsed_times = numpy.array(elapsed_times)
+        filters = numpy.array(filters)
+        airmasses = numpy.array(airmasses)
+        sky_brightnesses = numpy.array(sky_brightnesses)
+        exposure_times = numpy.array(exposure_times)
+
+        cloud = self.cloud_interface.get_cloud_array(elapsed_times)
+        seeing_fwhm_500 = numpy.zeros(len(self))
+        seeing_fwhm_geom = numpy.zeros(len(self))
+        seeing_fwhm_eff = numpy.zeros(len(self))
+        five_sigma_depth = numpy.zeros(len(self))
+        # The seeing and m5 filter dependence is given by name, so group the visits by filter.
+        for filter_name in numpy.unique(filters):
+            mask = filters == filter_name
+            fwhm_500, fwhm_geom, fwhm_eff = \
+                self.seeing_interface.calculate_seeing_array(elapsed_times[mask], str(filter_name),
+                                                             airmasses[mask])
+            seeing_fwhm_500[mask] = fwhm_500
+            seeing_fwhm_geom[mask] = fwhm_geom
+            seeing_fwhm_eff[mask] = fwhm_eff
+            five_sigma_depth[mask] = m5_flat_sed(str(filter_name), sky_brightnesses[mask], fwhm_eff,
+                                                 exposure_times[mask], airmasses[mask])
+
+        values = {"cloud": cloud, "seeingFwhm500": seeing_fwhm_500, "seeingFwhmGeom": seeing_fwhm_geom,
+                  "seeingFwhmEff": seeing_fwhm_eff, "fiveSigmaDepth": five_sigma_depth}
+        return list(row_indexes), values
+
+    def apply(self):
+        """Compute the conditions for the recorded visits and place them into the collected rows.
+
+        This is meant to run right before the survey database writes the collected information.
+        """
+        if not len(self):
+            return
+        row_indexes, values = self.compute()
+        self.db.update_rows("observation_history", row_indexes, values)
+        self.log.debug("Computed the conditions for {} visits.".format(len(self)))
+        self.visits = []
@@ -65,7 +65,8 @@ class DowntimeHandler(object):
             Downtime configuration instance.
         """
         self.scheduled.initialize(config.scheduled_downtime_db)
-        self.unscheduled.initialize(config.unscheduled_downtime_use_random_seed)
+        self.unscheduled.initialize(config.unscheduled_downtime_use_random_seed,
+                                    config.unscheduled_downtime_random_seed)
         config.unscheduled_downtime_random_seed = self.unscheduled.get_seed()
 
     def get_downtime(self, night):
@@ -92,6 +93,34 @@ class DowntimeHandler(object):
         except KeyError:
             return 0
 
+    def get_state(self):
+        """Return the information needed to restore the handler.
+
+        Returns
+        -------
+        dict
+            The pending downtime days and the remaining downtime queues.
+        """
+        return {"downtime_days": set(self.downtime_days),
+                "current_scheduled": self.current_scheduled,
+                "current_unscheduled": self.current_unscheduled,
+                "scheduled": self.scheduled.dt,
+                "unscheduled": self.unscheduled.ud}
+
+    def set_state(self, state):
+        """Restore the handler from a previously saved state.
+
+        Parameters
+        ----------
+        state : dict
+            The information returned from :meth:`get_state`.
+        """
+        self.downtime_days = set(state["downtime_days"])
+        self.current_scheduled = state["current_scheduled"]
+        self.current_unscheduled = state["current_unscheduled"]
+        self.scheduled.dt = state["scheduled"]
+        self.unscheduled.ud = state["unscheduled"]
+
     def update(self):
         """Update the lsit of downtime days.
         """
@@ -0,0 +1,202 @@
+from builtins import object
+import collections
+from enum import Enum
+import heapq
+import itertools
+import logging
+import time
+
+__all__ = ["Event", "EventType", "EventQueue"]
+
+class EventType(Enum):
+    """The types of events handled by the simulation kernel.
+    """
+    NIGHT_START = 1
+    VISIT = 2
+    NIGHT_END = 3
+    DAY_START = 4
+    DOWNTIME_END = 5
+
+class Event(object):
+    """Hold the information of a scheduled event.
+
+    Attributes
+    ----------
+    timestamp : float
+        The UNIX timestamp when the event happens.
+    event_type : :class:`.EventType` or object
+        The type of the event. Plug-ins can use their own hashable types.
+    night : int
+        The survey night the event belongs to.
+    data : dict
+        Any extra information for the event handlers.
+    """
+
+    __slots__ = ("timestamp", "event_type", "night", "data")
+
+    def __init__(self, timestamp, event_type, night=None, data=None):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        timestamp : float
+            The UNIX timestamp when the event happens.
+        event_type : :class:`.EventType` or object
+            The type of the event.
+        night : int, optional
+            The survey night the event belongs to.
+        data : dict, optional
+            Any extra information for the event handlers.
+        """
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.night = night
+        self.data = data if data is not None else {}
+
+    def __repr__(self):
+        return "Event({:.6f}, {}, night={})".format(self.timestamp, self.event_type, self.night)
+
+class EventQueue(object):
+    """Run the simulation as a sequence of timestamped events.
+
+    The events are kept in a heap ordered by timestamp and, for equal timestamps, by the order
+    they were pushed. Running the queue moves the simulation time straight to the next event and
+    calls the handlers registered for its type. Handlers push the events that follow from them.
+    The time is never moved backwards, so an event scheduled for an earlier time than the
+    current one is handled at the current time.
+
+    Attributes
+    ----------
+    handlers : dict(object, list[func])
+        The functions called with the event for each event type.
+    listeners : list[func]
+        The functions called with every event before its handlers.
+    profile : bool
+        Flag to count the events and time their handlers.
+    counts : collections.Counter
+        The number of handled events for each event type.
+    elapsed : collections.Counter
+        The wall clock time (seconds) spent in the handlers for each event type.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, profile=False):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        profile : bool, optional
+            Flag to count the events and time their handlers. Default is False.
+        """
+        self.heap = []
+        self.sequence = itertools.count()
+        self.handlers = collections.defaultdict(list)
+        self.listeners = []
+        self.profile = profile
+        self.counts = collections.Counter()
+        self.elapsed = collections.Counter()
+        self.log = logging.getLogger("kernel.EventQueue")
+
+    def __len__(self):
+        """int: The number of scheduled events.
+        """
+        return len(self.heap)
+
+    def add_listener(self, listener):
+        """Add a function called with every event before its handlers.
+
+        Parameters
+        ----------
+        listener : func
+            The function taking the :class:`.Event` instance.
+        """
+        self.listeners.append(listener)
+
+    def clear(self):
+        """Remove all scheduled events.
+        """
+        self.heap = []
+
+    def dispatch(self, event):
+        """Call the listeners and the handlers for an event.
+
+        Parameters
+        ----------
+        event : :class:`.Event`
+            The event to handle.
+        """
+        for listener in self.listeners:
+            listener(event)
+        if self.profile:
+            start = time.time()
+        for handler in self.handlers[event.event_type]:
+            handler(event)
+        if self.profile:
+            self.counts[event.event_type] += 1
+            self.elapsed[event.event_type] += time.time() - start
+
+    def pop(self):
+        """Remove and return the next event.
+
+        Returns
+        -------
+        :class:`.Event`
+        """
+        return heapq.heappop(self.heap)[2]
+
+    def push(self, timestamp, event_type, night=None, **data):
+        """Schedule an event.
+
+        Parameters
+        ----------
+        timestamp : float
+            The UNIX timestamp when the event happens.
+        event_type : :class:`.EventType` or object
+            The type of the event.
+        night : int, optional
+            The survey night the event belongs to.
+        data : dict
+            Any extra information for the event handlers.
+
+        Returns
+        -------
+        :class:`.Event`
+        """
+        event = Event(timestamp, event_type, night, data)
+        heapq.heappush(self.heap, (timestamp, next(self.sequence), event))
+        return event
+
+    def register(self, event_type, handler):
+        """Add a handler for an event type.
+
+        Parameters
+        ----------
+        event_type : :class:`.EventType` or object
+            The type of the event.
+        handler : func
+            The function taking the :class:`.Event` instance.
+        """
+        self.handlers[event_type].append(handler)
+
+    def run(self, time_handler):
+        """Handle the events until none are left.
+
+        Parameters
+        ----------
+        time_handler : :class:`.TimeHandler`
+            The simulation time handling instance.
+        """
+        while self.heap:
+            event = self.pop()
+            delta = event.timestamp - time_handler.current_timestamp
+            if delta > 0:
+                time_handler.update_time(delta, "seconds")
+            self.dispatch(event)
+
+    def log_profile(self):
+        """Log the event counts and handler times.
+        """
+        for event_type, count in self.counts.items():
+            self.log.info("{}: {} events in {:.3f} seconds".format(event_type, count,
+                                                                   self.elapsed[event_type]))
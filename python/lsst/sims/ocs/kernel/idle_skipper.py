@@ -0,0 +1,123 @@
+from builtins import object
+import collections
+
+__all__ = ["IdleHistory", "IdleSkipper"]
+
+"""Simple tuple for handling the idle history information.
+"""
+IdleHistory = collections.namedtuple("IdleHistory", ["idleHistoryId", "night", "startTime", "duration",
+                                                     "source"])
+
+class IdleSkipper(object):
+    """Decide how far to skip ahead when the Scheduler offers no target.
+
+    A time to the next observing opportunity from the driver is used when one is given.
+    Otherwise the skip starts at the idle delay and grows by the backoff factor for every
+    consecutive missed target, up to a maximum. A skip never goes past the end of the night by
+    more than the idle delay.
+
+    Attributes
+    ----------
+    idle_delay : float
+        The shortest skip (seconds).
+    max_delay : float
+        The longest skip (seconds) without a driver hint.
+    backoff : float
+        The factor growing the skip for each consecutive missed target.
+    consecutive : int
+        The number of consecutive missed targets.
+    skips : int
+        The number of skips made. Also the identifier of the last skip.
+    """
+
+    def __init__(self, idle_delay, max_delay=1800.0, backoff=2.0):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        idle_delay : float
+            The shortest skip (seconds).
+        max_delay : float, optional
+            The longest skip (seconds) without a driver hint. Default is 1800.
+        backoff : float, optional
+            The factor growing the skip for each consecutive missed target. Default is 2.
+        """
+        self.idle_delay = idle_delay
+        self.max_delay = max(max_delay, idle_delay)
+        self.backoff = backoff
+        self.consecutive = 0
+        self.skips = 0
+
+    def next_delay(self, hint=None, remaining=None):
+        """Get the length of the next skip.
+
+        Parameters
+        ----------
+        hint : float, optional
+            The time (seconds) to the next observing opportunity from the driver.
+        remaining : float, optional
+            The time (seconds) left in the night.
+
+        Returns
+        -------
+        tuple(float, str)
+            The skip (seconds) and its source: hint or backoff.
+        """
+        if hint is not None and hint > 0:
+            delay = max(hint, self.idle_delay)
+            source = "hint"
+        else:
+            delay = min(self.idle_delay * self.backoff ** self.consecutive, self.max_delay)
+            source = "backoff"
+        if remaining is not None:
+            delay = min(delay, max(remaining, self.idle_delay))
+        return delay, source
+
+    def reset(self):
+        """Start over after a target is received.
+        """
+        self.consecutive = 0
+
+    def skip(self, night, timestamp, hint=None, remaining=None):
+        """Make a skip for a missed target.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+        timestamp : float
+            The current UNIX timestamp.
+        hint : float, optional
+            The time (seconds) to the next observing opportunity from the driver.
+        remaining : float, optional
+            The time (seconds) left in the night.
+
+        Returns
+        -------
+        :class:`.IdleHistory`
+            The information for the skipped interval.
+        """
+        delay, source = self.next_delay(hint, remaining)
+        self.consecutive += 1
+        self.skips += 1
+        return IdleHistory(self.skips, night, timestamp, delay, source)
+
+    def get_state(self):
+        """Return the information needed to restore the skipper.
+
+        Returns
+        -------
+        dict
+        """
+        return {"consecutive": self.consecutive, "skips": self.skips}
+
+    def set_state(self, state):
+        """Restore the skipper from a previously saved state.
+
+        Parameters
+        ----------
+        state : dict
+            The information returned from :meth:`get_state`.
+        """
+        self.consecutive = state["consecutive"]
+        self.skips = state["skips"]
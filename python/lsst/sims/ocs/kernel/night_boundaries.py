@@ -0,0 +1,180 @@
+from builtins import object
+from builtins import range
+import hashlib
+import logging
+import numpy
+import os
+
+from lsst.sims.ocs.utilities.constants import SECONDS_IN_MINUTE
+
+__all__ = ["NightBoundaries"]
+
+class NightBoundaries(object):
+    """Provide the sunset and sunrise timestamps of the survey nights from a precomputed table.
+
+    The table is computed once by stepping the sky model from the start of the survey to each
+    night in the same way the simulation does: the boundaries of a night are found from the time
+    shortly after the previous sunrise. The table can be stored in a cache directory keyed by the
+    observing site, survey start date and night boundary so later simulations only load it.
+
+    Attributes
+    ----------
+    sky_model : lsst.ts.astrosky.model.AstronomicalSkyModel
+        The instance calculating the night boundaries.
+    night_boundary : float
+        The sun altitude (degrees) marking the start and end of the night.
+    cache_dir : str or None
+        The directory for the table files. None keeps the table in memory only.
+    set_timestamps : numpy.ndarray
+        The UNIX timestamps of the start of each night.
+    rise_timestamps : numpy.ndarray
+        The UNIX timestamps of the end of each night.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, sky_model, night_boundary, cache_dir=None):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        sky_model : lsst.ts.astrosky.model.AstronomicalSkyModel
+            The instance calculating the night boundaries.
+        night_boundary : float
+            The sun altitude (degrees) marking the start and end of the night.
+        cache_dir : str, optional
+            The directory for the table files. Default is to keep the table in memory only.
+        """
+        self.sky_model = sky_model
+        self.night_boundary = night_boundary
+        self.cache_dir = cache_dir
+        self.set_timestamps = numpy.array([])
+        self.rise_timestamps = numpy.array([])
+        self.log = logging.getLogger("kernel.NightBoundaries")
+
+    def __len__(self):
+        """int: The number of nights in the table.
+        """
+        return len(self.set_timestamps)
+
+    def cache_key(self, obs_site_config, start_date):
+        """Create the key identifying a table.
+
+        Parameters
+        ----------
+        obs_site_config : :class:`.ObservingSite`
+            The instance of the observing site configuration.
+        start_date : str
+            The survey start date in the format of YYYY-MM-DD.
+
+        Returns
+        -------
+        str
+        """
+        key = "{!r}:{!r}:{!r}:{}:{!r}".format(obs_site_config.latitude_rad, obs_site_config.longitude_rad,
+                                              obs_site_config.height, start_date, self.night_boundary)
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def cache_file(self, key):
+        """Get the table file for a key.
+
+        Parameters
+        ----------
+        key : str
+            The key from :meth:`cache_key`.
+
+        Returns
+        -------
+        str
+        """
+        return os.path.join(self.cache_dir, "night_boundaries_{}.npz".format(key))
+
+    def compute(self, start_timestamp, num_nights):
+        """Compute the table.
+
+        Parameters
+        ----------
+        start_timestamp : float
+            The UNIX timestamp of the survey start.
+        num_nights : int
+            The number of nights to compute.
+        """
+        set_timestamps = numpy.zeros(num_nights)
+        rise_timestamps = numpy.zeros(num_nights)
+        timestamp = start_timestamp
+        for i in range(num_nights):
+            self.sky_model.update(timestamp)
+            set_timestamps[i], rise_timestamps[i] = self.sky_model.get_night_boundaries(self.night_boundary)
+            # The simulation moves just past the sunrise before the next night starts.
+            timestamp = rise_timestamps[i] + SECONDS_IN_MINUTE
+        self.set_timestamps = set_timestamps
+        self.rise_timestamps = rise_timestamps
+
+    def get(self, night, timestamp):
+        """Get the boundaries of a night.
+
+        The table entry is only used when the given time falls between the previous sunrise and the
+        sunset of the night, which is where the table was computed from.
+
+        Parameters
+        ----------
+        night : int
+            The survey night (starting at 1).
+        timestamp : float
+            The current UNIX timestamp.
+
+        Returns
+        -------
+        tuple(float, float) or None
+            The sunset and sunrise timestamps or None if the table does not cover the time.
+        """
+        index = night - 1
+        if index < 0 or index >= len(self):
+            return None
+        if index > 0 and timestamp < self.rise_timestamps[index - 1]:
+            return None
+        if timestamp >= self.set_timestamps[index]:
+            return None
+        return float(self.set_timestamps[index]), float(self.rise_timestamps[index])
+
+    def initialize(self, obs_site_config, start_date, start_timestamp, num_nights):
+        """Load the table from the cache directory or compute it.
+
+        A cached table is used if it covers at least the requested number of nights. A computed
+        table is written to the cache directory.
+
+        Parameters
+        ----------
+        obs_site_config : :class:`.ObservingSite`
+            The instance of the observing site configuration.
+        start_date : str
+            The survey start date in the format of YYYY-MM-DD.
+        start_timestamp : float
+            The UNIX timestamp of the survey start.
+        num_nights : int
+            The number of nights needed by the simulation.
+        """
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = self.cache_file(self.cache_key(obs_site_config, start_date))
+            if os.path.exists(cache_file):
+                with numpy.load(cache_file) as cached:
+                    if len(cached["set_timestamps"]) >= num_nights:
+                        self.set_timestamps = cached["set_timestamps"]
+                        self.rise_timestamps = cached["rise_timestamps"]
+                        self.log.info("Loaded night boundaries from {}".format(cache_file))
+                        return
+
+        self.compute(start_timestamp, num_nights)
+        self.log.info("Computed night boundaries for {} nights.".format(num_nights))
+
+        if cache_file is not None:
+            try:
+                os.makedirs(self.cache_dir)
+            except OSError:
+                if not os.path.isdir(self.cache_dir):
+                    raise
+            tmp_file = "{}.{}.tmp".format(cache_file, os.getpid())
+            with open(tmp_file, "wb") as ofile:
+                numpy.savez(ofile, set_timestamps=self.set_timestamps, rise_timestamps=self.rise_timestamps)
+            os.rename(tmp_file, cache_file)
@@ -3,7 +3,9 @@ from builtins import range
 import logging
 import numpy
 
+from lsst.sims.ocs.kernel import StateHandoff
 from lsst.sims.ocs.observatory import MainObservatory
+from lsst.sims.ocs.sal import create_topic
 from lsst.sims.ocs.setup import LoggingLevel
 from lsst.ts.astrosky.model import AstronomicalSkyModel
 from lsst.ts.dateloc import ObservatoryLocation
@@ -30,13 +32,15 @@ class Sequencer(object):
         Instance of the SOCS observatory model.
     observatory_state : SALPY_scheduler.observatoryStateC
         DDS topic instance for the observatory state information.
+    state_handoff : :class:`.StateHandoff`
+        The instance giving the observatory state directly to the driver.
     idle_delay : float
         Time (units=seconds) to wait when a missed target is received.
     log : logging.Logger
         The logging instance.
     """
 
-    def __init__(self, obs_site_config, idle_delay, no_dds=False):
+    def __init__(self, obs_site_config, idle_delay, no_dds=False, model_fallback=False):
         """Initialize the class.
 
         Parameters
@@ -45,15 +49,20 @@ class Sequencer(object):
             The instance of the observing site configuration.
         idle_delay : float
             The delay time (seconds) to skip forward when no target is received.
+        no_dds : bool, optional
+            Flag for running without DDS communication. Default is False.
+        model_fallback : bool, optional
+            Flag to look up unknown observatory attributes on the observatory model. Default is False.
         """
         self.targets_received = 0
         self.targets_missed = 0
         self.observation = None
-        self.observatory_model = MainObservatory(obs_site_config)
+        self.observatory_model = MainObservatory(obs_site_config, model_fallback)
         self.observatory_location = ObservatoryLocation(obs_site_config.latitude_rad,
                                                         obs_site_config.longitude_rad,
                                                         obs_site_config.height)
         self.observatory_state = None
+        self.state_handoff = StateHandoff()
         self.log = logging.getLogger("kernel.Sequencer")
         self.idle_delay = (idle_delay, "seconds")
         self.sky_model = AstronomicalSkyModel(self.observatory_location)
@@ -110,6 +119,45 @@ class Sequencer(object):
 
         return self.observatory_state
 
+    def get_driver_observatory_state(self, timestamp):
+        """Return the observatory state for handing directly to the driver.
+
+        Parameters
+        ----------
+        timestamp : float
+            The current timestamp at the state retrieval request.
+
+        Return
+        ------
+        lsst.ts.observatory.model.ObservatoryState
+        """
+        self.observatory_model.update_state(timestamp)
+        return self.state_handoff.refresh(self.observatory_model.current_state)
+
+    def get_state(self):
+        """Return the information needed to restore the sequencer.
+
+        Returns
+        -------
+        dict
+            The sequencer counters and the observatory state.
+        """
+        return {"targets_received": self.targets_received,
+                "targets_missed": self.targets_missed,
+                "observatory_model": self.observatory_model.get_state()}
+
+    def set_state(self, state):
+        """Restore the sequencer from a previously saved state.
+
+        Parameters
+        ----------
+        state : dict
+            The information returned from :meth:`get_state`.
+        """
+        self.targets_received = state["targets_received"]
+        self.targets_missed = state["targets_missed"]
+        self.observatory_model.set_state(state["observatory_model"])
+
     def initialize(self, sal, obs_config):
         """Perform initialization steps.
 
@@ -123,11 +171,9 @@ class Sequencer(object):
             The instance of the observatory configuration.
         """
         if self.no_dds:
-            from SALPY_scheduler import scheduler_observationC
-            from SALPY_scheduler import scheduler_observatoryStateC
-            self.observation = scheduler_observationC()
+            self.observation = create_topic("observation")
             self.observatory_model.configure(obs_config)
-            self.observatory_state = scheduler_observatoryStateC()
+            self.observatory_state = create_topic("observatoryState")
         else:
             self.observation = sal.set_publish_topic("observation")
             self.observatory_state = sal.set_publish_topic("observatoryState")
@@ -142,8 +188,10 @@ class Sequencer(object):
         self.log.info("Number of targets received: {}".format(self.targets_received))
         self.log.info("Number of observations made: {}".format(self.observations_made))
         self.log.info("Number of targets missed: {}".format(self.targets_missed))
+        if self.observatory_model.slew_cache is not None:
+            self.observatory_model.slew_cache.log_stats()
 
-    def observe_target(self, target, th):
+    def observe_target(self, target, th, idle_time=None, forward_idle=True):
         """Observe the given target.
 
         This function performs the necessary steps to observe the given target. The current steps are:
@@ -153,8 +201,8 @@ class Sequencer(object):
           * Update the simulation time after "visit"
 
         If the targetId is -1, this means a target was not offered by the Scheduler. Time is forwarded
-        by the idle delay time and slew and exposure information are set to None. The observation takes the
-        target's Id.
+        by the idle delay time, or the given idle time, unless the caller forwards it, and slew and
+        exposure information are set to None. The observation takes the target's Id.
 
         Parameters
         ----------
@@ -162,6 +210,10 @@ class Sequencer(object):
             A target telemetry topic containing the current target information.
         th : :class:`.TimeHandler`
             An instance of the simulation's TimeHandler.
+        idle_time : float, optional
+            The time (seconds) to forward when no target is offered. Default is the idle delay.
+        forward_idle : bool, optional
+            Flag to forward the time when no target is offered. Default is True.
 
         Returns
         -------
@@ -223,7 +275,11 @@ class Sequencer(object):
             self.observation.skyBrightness = 30.0
             slew_info = None
             exposure_info = None
-            th.update_time(*self.idle_delay)
+            if forward_idle:
+                if idle_time is not None:
+                    th.update_time(idle_time, "seconds")
+                else:
+                    th.update_time(*self.idle_delay)
             self.targets_missed += 1
 
         return self.observation, slew_info, exposure_info
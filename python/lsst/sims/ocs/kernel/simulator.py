@@ -20,13 +20,15 @@ from lsst.ts.schedulerConfig import ConfigurationCommunicator
 from lsst.sims.ocs.database.tables import write_config, write_field
 from lsst.sims.ocs.database.tables import write_proposal, write_proposal_field
 from lsst.sims.ocs.environment import CloudInterface, SeeingInterface
-from lsst.sims.ocs.kernel import DowntimeHandler, ObsProposalHistory
+from lsst.sims.ocs.kernel import CheckpointHandler, DeferredConditions, DowntimeHandler, ObsProposalHistory
 from lsst.sims.ocs.kernel import ProposalInfo, ProposalFieldInfo
-from lsst.sims.ocs.kernel import Sequencer, TargetProposalHistory, TimeHandler
-from lsst.sims.ocs.sal import SalManager, topic_strdict
+from lsst.sims.ocs.kernel import EpochTimeHandler, EventQueue, EventType, IdleSkipper, NightBoundaries
+from lsst.sims.ocs.kernel import Sequencer, TargetProposalHistory
+from lsst.sims.ocs.kernel import TimeHandler
+from lsst.sims.ocs.sal import SalManager, create_topic, topic_strdict
 from lsst.sims.ocs.setup import LoggingLevel
 from lsst.sims.ocs.utilities.constants import DAYS_IN_YEAR, SECONDS_IN_MINUTE
-from lsst.sims.ocs.utilities.socs_exceptions import SchedulerTimeoutError
+from lsst.sims.ocs.utilities.socs_exceptions import CheckpointError, SchedulerTimeoutError
 from lsst.ts.scheduler import SALUtils
 from lsst.sims.utils import m5_flat_sed
 
@@ -69,6 +71,20 @@ class Simulator(object):
         The instance of the fields database.
     field_selection : lsst.sims.survey.fields.FieldSelection
         The instance of the field selector.
+    checkpoint : :class:`.CheckpointHandler`
+        The instance handling the night-level checkpoint files.
+    resume_night : int or None
+        The checkpointed night to resume the simulation from. None for a new simulation.
+    idle_skipper : :class:`.IdleSkipper` or None
+        The instance deciding how far to skip ahead when no target is offered. None always skips
+        the idle delay.
+    event_queue : :class:`.EventQueue`
+        The queue of events used by the event kernel.
+    night_boundaries : :class:`.NightBoundaries`
+        The instance providing the precomputed sunset and sunrise timestamps of the survey nights.
+    deferred_conditions : :class:`.DeferredConditions` or None
+        The instance computing the visit cloud, seeing and five sigma depth in bulk. None computes
+        them for each visit.
     """
 
     def __init__(self, options, database, driver=None):
@@ -101,6 +117,9 @@ class Simulator(object):
             self.conf.load([str(CONFIG_DIRECTORY)])
             self.config_path = str(CONFIG_DIRECTORY)
         self.conf.load_proposals()
+        if self.opts.downtime_seed is not None:
+            self.conf.downtime.unscheduled_downtime_use_random_seed = True
+            self.conf.downtime.unscheduled_downtime_random_seed = self.opts.downtime_seed
 
         self.db = database
 
@@ -135,6 +154,10 @@ class Simulator(object):
         self.sun = Sun()
         self.cloud_interface = None
         self.seeing_interface = None
+        self.deferred_conditions = None
+        self.night_boundaries = None
+        self.idle_skipper = None
+        self.event_queue = EventQueue(profile=self.opts.event_kernel_profile)
         self.field_database = FieldsDatabase()
         self.field_selection = FieldSelection()
         self.obs_site_info = None
@@ -146,6 +169,16 @@ class Simulator(object):
             self.socs_timeout = self.opts.scheduler_timeout
             self.conf_comm.socs_timeout = self.socs_timeout
 
+        checkpoint_dir = self.opts.checkpoint_dir
+        if checkpoint_dir is None:
+            checkpoint_dir = self.opts.sqlite_save_dir
+        self.checkpoint = CheckpointHandler(checkpoint_dir, self.opts.checkpoint_interval)
+        self.resume_night = None
+        if self.opts.resume is not None:
+            self.resume_night = self.opts.from_night
+            if self.resume_night is None:
+                self.resume_night = self.checkpoint.latest_night(self.db.session_id)
+
         self.scheduler_summary_state = None
         self.scheduler_valid_settings = None
 
@@ -163,22 +196,99 @@ class Simulator(object):
         """
         return math.floor(self.fractional_duration * DAYS_IN_YEAR)
 
+    def begin_day(self, night):
+        """Start the day after a night of the simulation.
+
+        This function performs the start of day actions, like a filter swap, and writes a checkpoint
+        or backup if one is due.
+
+        Parameters
+        ----------
+        night : int
+            The night that just ended.
+        """
+        self.start_day()
+        if self.no_dds_comm and self.checkpoint.should_write(night):
+            self.write_checkpoint(night)
+        elif self.db.should_backup(night):
+            self.db.backup()
+
+    def begin_night(self, night):
+        """Start a night of the simulation.
+
+        This function sets up the night boundaries and downtime, hands the night to the driver and
+        makes sure the Scheduler is enabled.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+        """
+        self.start_night(night)
+        self.open_night(night)
+
+    def open_night(self, night):
+        """Hand a started night to the driver and make sure the Scheduler is enabled.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+        """
+        if self.no_dds_comm:
+            self.driver.update_time(self.time_handler.current_timestamp, night)
+            self.driver.start_night(self.time_handler.current_timestamp, night)
+
+        if self.scheduler_state != self.summary_state_enum['ENABLE']:
+            self.log.info('Enabling scheduler...')
+            self.send_scheduler_to(1)  # enable the scheduler
+            self.listen_scheduler_state()
+            self.log.debug('Received state %s ' % self.scheduler_summary_state.summaryState)
+            self.scheduler_state = self.scheduler_summary_state.summaryState
+            if self.scheduler_state != self.summary_state_enum['ENABLE']:
+                # Scheduler not enable! Issue exception
+                raise Exception("Scheduler %s, expected ENABLE." % self.scheduler_state)
+
     def end_night(self):
         """Perform actions at the end of the night.
         """
-        self.db.write()
+        if self.deferred_conditions is not None:
+            self.deferred_conditions.apply()
+        self.db.end_night(self.time_handler.current_timestamp)
         self.seq.end_night()
 
     def finalize(self):
         """Perform finalization steps.
 
-        This function handles finalization of the :class:`.SalManager` and :class:`.Sequencer` instances.
+        This function handles finalization of the :class:`.SalManager`, :class:`.Sequencer` and
+        :class:`.SocsDatabase` instances. Any deferred database indexes are created and the
+        SummaryAllProps view is materialized into a table unless it is turned off. A working session
+        database is always backed up, even if one of these steps fails.
         """
         self.seq.finalize()
+        try:
+            self.db.finalize()
+            self.db.create_indexes()
+            if self.opts.summary_table:
+                self.db.materialize_summary_all_props()
+        finally:
+            self.db.backup()
         if not self.no_dds_comm:
             self.sal.finalize()
         self.log.info("Ending simulation")
 
+    def finish_night(self, night):
+        """Finish a night of the simulation for SOCS and the driver.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+        """
+        self.end_night()
+        if self.no_dds_comm:
+            self.driver.end_night(self.time_handler.current_timestamp, night)
+
     def gather_proposal_history(self, phtype, topic):
         """Gather the proposal history from the current target.
 
@@ -232,6 +342,108 @@ class Simulator(object):
                     if (tf - lasttime) > self.socs_timeout:
                         raise SchedulerTimeoutError("The Scheduler is not serving targets!")
 
+    def handle_day_start(self, event):
+        """Start the day after a night and schedule the next night.
+
+        Parameters
+        ----------
+        event : :class:`.Event`
+            The day start event.
+        """
+        self.begin_day(event.night)
+        if event.night < event.data["last_night"]:
+            self.event_queue.push(self.time_handler.current_timestamp, EventType.NIGHT_START,
+                                  night=event.night + 1, **event.data)
+
+    def handle_downtime_end(self, event):
+        """Open a night lost to downtime and schedule its end.
+
+        Parameters
+        ----------
+        event : :class:`.Event`
+            The downtime end event.
+        """
+        self.open_night(event.night)
+        self.event_queue.push(self.time_handler.current_timestamp, EventType.NIGHT_END, night=event.night,
+                              **event.data)
+
+    def handle_night_end(self, event):
+        """Finish a night and schedule the start of the day.
+
+        Parameters
+        ----------
+        event : :class:`.Event`
+            The night end event.
+        """
+        self.finish_night(event.night)
+        self.event_queue.push(self.time_handler.current_timestamp, EventType.DAY_START, night=event.night,
+                              **event.data)
+
+    def handle_night_start(self, event):
+        """Start a night and schedule its first visit.
+
+        For a night lost to downtime, the end of the downtime is scheduled instead, so the time
+        jumps straight past the night.
+
+        Parameters
+        ----------
+        event : :class:`.Event`
+            The night start event.
+        """
+        downtime = self.start_night(event.night, forward_downtime=False)
+        if downtime is not None:
+            self.event_queue.push(self.time_handler.future_timestamp(downtime, "seconds"),
+                                  EventType.DOWNTIME_END, night=event.night, **event.data)
+            return
+        self.open_night(event.night)
+        self.schedule_visit(self.time_handler.current_timestamp, event)
+
+    def handle_visit(self, event):
+        """Observe a visit and schedule the next one.
+
+        When the Scheduler offers no target, the next visit is scheduled at the end of the idle
+        interval, so the time jumps straight to it.
+
+        Parameters
+        ----------
+        event : :class:`.Event`
+            The visit event.
+        """
+        idle_interval = self.observe_visit(event.night, forward_idle=False)
+        if idle_interval is None:
+            timestamp = self.time_handler.current_timestamp
+        else:
+            timestamp = self.time_handler.future_timestamp(*idle_interval)
+        self.schedule_visit(timestamp, event)
+
+    def schedule_visit(self, timestamp, event):
+        """Schedule the next visit of a night or the end of the night if it is over.
+
+        Parameters
+        ----------
+        timestamp : float
+            The UNIX timestamp of the next visit.
+        event : :class:`.Event`
+            The event the night information is taken from.
+        """
+        event_type = EventType.VISIT if timestamp < self.end_of_night else EventType.NIGHT_END
+        self.event_queue.push(timestamp, event_type, night=event.night, **event.data)
+
+    def idle_hint(self):
+        """Get the time to the next observing opportunity from the driver.
+
+        Returns
+        -------
+        float or None
+            The time (seconds) or None if the driver does not provide it.
+        """
+        if not self.no_dds_comm:
+            return None
+        time_to_next_target = getattr(self.driver, "time_to_next_target", None)
+        if time_to_next_target is None:
+            return None
+        return time_to_next_target(self.time_handler.current_timestamp)
+
     def initialize(self):
         """Perform initialization steps.
 
@@ -294,47 +506,215 @@ class Simulator(object):
                 raise Exception("Scheduler %s, expected DISABLE." % self.scheduler_state)
 
         else:
-            from SALPY_scheduler import scheduler_timeHandlerC
-            from SALPY_scheduler import scheduler_logevent_targetC
-            from SALPY_scheduler import scheduler_bulkCloudC
-            from SALPY_scheduler import scheduler_seeingC
-            from SALPY_scheduler import scheduler_logevent_needFilterSwapC
-            from SALPY_scheduler import scheduler_interestedProposalC
-
-            self.comm_time = scheduler_timeHandlerC()
-            self.target = scheduler_logevent_targetC()
-            self.cloud = scheduler_bulkCloudC()
-            self.seeing = scheduler_seeingC()
-            self.filter_swap = scheduler_logevent_needFilterSwapC()
-            self.interested_proposal = scheduler_interestedProposalC()
+            self.comm_time = create_topic("timeHandler")
+            self.target = create_topic("logevent_target")
+            self.cloud = create_topic("bulkCloud")
+            self.seeing = create_topic("seeing")
+            self.filter_swap = create_topic("logevent_needFilterSwap")
+            self.interested_proposal = create_topic("interestedProposal")
             self.conf_comm.initialize(self.sal, self.conf)
 
-        self.time_handler = TimeHandler(self.conf.survey.start_date)
+        time_handler_class = EpochTimeHandler if self.opts.epoch_time else TimeHandler
+        self.time_handler = time_handler_class(self.conf.survey.start_date)
         self.cloud_interface = CloudInterface(self.time_handler)
         self.seeing_interface = SeeingInterface(self.time_handler)
         self.cloud_interface.initialize(self.conf.environment.cloud_db)
         self.seeing_interface.initialize(self.conf.environment, self.conf.observatory.filters)
+        if self.no_dds_comm and self.opts.deferred_conditions:
+            # The conditions do not feed back into the scheduler without DDS, so they are computed
+            # for all the collected visits right before the information is written.
+            self.deferred_conditions = DeferredConditions(self.seeing_interface, self.cloud_interface,
+                                                          self.db)
+            self.db.flush_callbacks.append(self.deferred_conditions.apply)
 
         self.seq = Sequencer(self.conf_comm.config.observing_site, self.conf_comm.config.survey.idle_delay,
-                             no_dds=self.no_dds_comm)
+                             no_dds=self.no_dds_comm, model_fallback=self.opts.model_fallback)
 
         self.seq.initialize(self.sal, self.conf_comm.config.observatory)
+        if self.opts.slew_cache:
+            self.seq.observatory_model.enable_slew_cache(self.opts.slew_cache,
+                                                         self.opts.slew_cache_resolution,
+                                                         self.opts.slew_cache_strict)
+        if self.opts.idle_skip:
+            self.idle_skipper = IdleSkipper(self.seq.idle_delay[0], self.opts.idle_skip_max,
+                                            self.opts.idle_skip_backoff)
+        self.night_boundaries = NightBoundaries(self.seq.sky_model, self.conf.sched_driver.night_boundary,
+                                                self.opts.night_boundary_cache)
+        self.night_boundaries.initialize(self.conf_comm.config.observing_site, self.conf.survey.start_date,
+                                         self.time_handler.initial_timestamp, int(self.duration))
         self.dh.initialize(self.conf.downtime)
-        self.dh.write_downtime_to_db(self.db)
+        if self.resume_night is None:
+            self.dh.write_downtime_to_db(self.db)
 
         self.log.info("Finishing simulation initialization")
 
+    def observe_visit(self, night, forward_idle=True):
+        """Observe the next target from the Scheduler.
+
+        This function sends the current time, observatory state and environment to the Scheduler,
+        observes the received target and collects the resulting information.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+        forward_idle : bool, optional
+            Flag to forward the time over the idle interval when no target is offered. Default is True.
+
+        Returns
+        -------
+        tuple(float, str) or None
+            The idle interval (value and units) when no target is offered and the time was not
+            forwarded, otherwise None.
+        """
+
+        if not self.no_dds_comm:
+            self.comm_time.timestamp = self.time_handler.current_timestamp
+            self.sal.put(self.comm_time)
+
+        self.log.log(LoggingLevel.EXTENSIVE.value,
+                     "Timestamp sent: {:.6f}".format(self.time_handler.current_timestamp))
+
+        if self.no_dds_comm and self.opts.state_handoff:
+            driver_observatory_state = \
+                self.seq.get_driver_observatory_state(self.time_handler.current_timestamp)
+            self.log.log(LoggingLevel.EXTENSIVE.value,
+                         "Observatory State changed: {}".format(self.seq.state_handoff.changed))
+        else:
+            observatory_state = self.seq.get_observatory_state(self.time_handler.current_timestamp)
+            self.log.log(LoggingLevel.EXTENSIVE.value,
+                         "Observatory State: {}".format(topic_strdict(observatory_state)))
+        if self.no_dds_comm:
+            self.driver.update_time(self.time_handler.current_timestamp, night)
+            if not self.opts.state_handoff:
+                driver_observatory_state = SALUtils.rtopic_observatory_state(observatory_state)
+            self.driver.update_internal_conditions(driver_observatory_state, night)
+            self.cloud.bulkCloud = self.cloud_interface.get_cloud(self.time_handler.time_since_start)
+            self.seeing.seeing = self.seeing_interface.get_seeing(self.time_handler.time_since_start)
+            self.driver.update_external_conditions(self.cloud.bulkCloud, self.seeing.seeing)
+        else:
+            self.sal.put(observatory_state)
+
+            self.cloud_interface.set_topic(self.time_handler, self.cloud)
+            self.sal.put(self.cloud)
+
+            self.seeing_interface.set_topic(self.time_handler, self.seeing)
+            self.sal.put(self.seeing)
+
+        self.get_target_from_scheduler()
+
+        idle = None
+        if self.idle_skipper is not None:
+            if self.target.targetId == -1:
+                idle = self.idle_skipper.skip(night, self.time_handler.current_timestamp, self.idle_hint(),
+                                              self.end_of_night - self.time_handler.current_timestamp)
+            else:
+                self.idle_skipper.reset()
+
+        observation, slew_info, exposure_info = \
+            self.seq.observe_target(self.target, self.time_handler,
+                                    idle.duration if idle is not None else None, forward_idle)
+        # Add a few more things to the observation
+        observation.night = night
+        elapsed_time = self.time_handler.time_since_given(observation.observationStartTime)
+        visit_exposure_time = sum([observation.exposureTimes[i]
+                                   for i in range(observation.numExposures)])
+        if self.deferred_conditions is None:
+            observation.cloud = self.cloud_interface.get_cloud(elapsed_time)
+            seeing_values = self.seeing_interface.calculate_seeing(elapsed_time,
+                                                                   observation.filter,
+                                                                   observation.airmass)
+            observation.seeingFwhm500 = seeing_values[0]
+            observation.seeingFwhmGeom = seeing_values[1]
+            observation.seeingFwhmEff = seeing_values[2]
+
+            observation.fiveSigmaDepth = m5_flat_sed(observation.filter,
+                                                     observation.skyBrightness,
+                                                     observation.seeingFwhmEff,
+                                                     visit_exposure_time,
+                                                     observation.airmass)
+
+        observation.note = self.target.note
+        observation.numProposals = self.target.numProposals
+        for i in range(self.target.numProposals):
+            observation.proposalIds[i] = self.target.proposalId[i]
+        self.log.log(LoggingLevel.EXTENSIVE.value, "tx: observation")
+        if self.no_dds_comm:
+            driver_observation = SALUtils.rtopic_observation(observation)
+            self.log.debug('%i: %s', observation.numProposals, observation.proposalIds)
+            self.log.debug('%i: %s', driver_observation.num_props,
+                           driver_observation.propid_list)
+            target_list = self.driver.register_observation(driver_observation)
+            SALUtils.wtopic_interestedProposal(self.interested_proposal,
+                                               observation.targetId,
+                                               target_list)
+        else:
+            self.sal.put(observation)
+
+            # Wait for interested proposal information
+            lastconfigtime = time.time()
+            while self.wait_for_scheduler:
+                rcode = self.sal.manager.getNextSample_interestedProposal(self.interested_proposal)
+                if rcode == 0 and self.interested_proposal.numProposals >= 0:
+                    self.log.log(LoggingLevel.EXTENSIVE.value, "Received interested proposal.")
+                    break
+                else:
+                    tf = time.time()
+                    if (tf - lastconfigtime) > 5.0:
+                        self.log.log(LoggingLevel.EXTENSIVE.value,
+                                     "Failed to receive interested proposal due to timeout.")
+                        break
+
+        if self.wait_for_scheduler and observation.targetId != -1:
+            self.db.append_data("target_history", self.target)
+            if self.deferred_conditions is not None:
+                self.deferred_conditions.add(self.db.row_count("observation_history"),
+                                             elapsed_time, observation.filter,
+                                             observation.airmass, observation.skyBrightness,
+                                             visit_exposure_time)
+            self.db.append_data("observation_history", observation)
+            self.gather_proposal_history("target", self.target)
+            self.gather_proposal_history("observation", self.interested_proposal)
+            for slew_type, slew_data in slew_info.items():
+                self.log.log(LoggingLevel.TRACE.value, "{}, {}".format(slew_type, type(slew_data)))
+                if isinstance(slew_data, list):
+                    for data in slew_data:
+                        self.db.append_data(slew_type, data)
+                else:
+                    self.db.append_data(slew_type, slew_data)
+            for exposure_type in exposure_info:
+                self.log.log(LoggingLevel.TRACE.value, "Adding {} to DB".format(exposure_type))
+                self.log.log(LoggingLevel.TRACE.value,
+                             "Number of exposures being added: "
+                             "{}".format(len(exposure_info[exposure_type])))
+                for exposure in exposure_info[exposure_type]:
+                    self.db.append_data(exposure_type, exposure)
+            self.db.check_flush(self.time_handler.current_timestamp)
+        if idle is not None:
+            self.db.append_data("idle_history", idle)
+        if forward_idle or self.target.targetId != -1:
+            return None
+        return (idle.duration, "seconds") if idle is not None else self.seq.idle_delay
+
     def run(self):
         """Run the simulation.
+
+        The nights are run as a loop over the visits or, with the event kernel, as a sequence of
+        night start, visit, night end and day start events from an :class:`.EventQueue`.
         """
         self.log.info("Starting simulation")
 
         start_night = 1
         if self.no_dds_comm:
             self.scheduler_state = self.summary_state_enum['ENABLE']  # set scheduler state to enable...
-            self.configure_driver()
+            if self.resume_night is not None:
+                # The driver is configured and restored from the checkpoint.
+                self.restore_checkpoint(self.resume_night)
+                start_night = self.resume_night + 1
+            else:
+                self.configure_driver()
             # Taking COLD/WARM start into consideration
-            if self.driver.night > 0:
+            if self.resume_night is None and self.driver.night > 0:
                 # Not sure I actually need to do this... But I think I do need to wal the timestamp over each night
                 for night in range(self.driver.night):
                     self.start_night(night+1)
@@ -349,138 +729,108 @@ class Simulator(object):
                     self.end_night()
                     self.start_day()
                     start_night += 1
+        elif self.resume_night is not None:
+            raise CheckpointError("Resuming from a checkpoint is only supported without DDS comm.")
         # TODO: Implement COLD/WARM start in dds mode...
         # else:
         #     self.conf_comm.run()
 
-        self.save_configuration()
-        self.save_proposal_information()
-        self.save_field_information()
+        if self.resume_night is None:
+            self.save_configuration()
+            self.save_proposal_information()
+            self.save_field_information()
 
         # Note that if you are cold starting and the duration is smaller than the cold start database, you won't
         # run any simulation.
         self.log.debug("Duration = {}".format(self.duration))
-        for night in range(start_night, int(self.duration) + 1):
-            self.start_night(night)
-            if self.no_dds_comm:
-                self.driver.update_time(self.time_handler.current_timestamp, night)
-                self.driver.start_night(self.time_handler.current_timestamp, night)
-
-            if self.scheduler_state != self.summary_state_enum['ENABLE']:
-                self.log.info('Enabling scheduler...')
-                self.send_scheduler_to(1)  # enable the scheduler
-                self.listen_scheduler_state()
-                self.log.debug('Received state %s ' % self.scheduler_summary_state.summaryState)
-                self.scheduler_state = self.scheduler_summary_state.summaryState
-                if self.scheduler_state != self.summary_state_enum['ENABLE']:
-                    # Scheduler not enable! Issue exception
-                    raise Exception("Scheduler %s, expected ENABLE." % self.scheduler_state)
+        if self.opts.event_kernel:
+            self.run_events(start_night)
+            return
 
+        for night in range(start_night, int(self.duration) + 1):
+            self.begin_night(night)
             while self.time_handler.current_timestamp < self.end_of_night:
+                self.observe_visit(night)
+            self.finish_night(night)
+            self.begin_day(night)
 
-                if not self.no_dds_comm:
-                    self.comm_time.timestamp = self.time_handler.current_timestamp
-                    self.sal.put(self.comm_time)
-
-                self.log.log(LoggingLevel.EXTENSIVE.value,
-                             "Timestamp sent: {:.6f}".format(self.time_handler.current_timestamp))
-
-                observatory_state = self.seq.get_observatory_state(self.time_handler.current_timestamp)
-                self.log.log(LoggingLevel.EXTENSIVE.value,
-                             "Observatory State: {}".format(topic_strdict(observatory_state)))
-                if self.no_dds_comm:
-                    self.driver.update_time(self.time_handler.current_timestamp, night)
-                    driver_observatory_state = SALUtils.rtopic_observatory_state(observatory_state)
-                    self.driver.update_internal_conditions(driver_observatory_state, night)
-                    self.cloud.bulkCloud = self.cloud_interface.get_cloud(self.time_handler.time_since_start)
-                    self.seeing.seeing = self.seeing_interface.get_seeing(self.time_handler.time_since_start)
-                    self.driver.update_external_conditions(self.cloud.bulkCloud, self.seeing.seeing)
-                else:
-                    self.sal.put(observatory_state)
-
-                    self.cloud_interface.set_topic(self.time_handler, self.cloud)
-                    self.sal.put(self.cloud)
+    def run_events(self, start_night):
+        """Run the nights of the simulation from an event queue.
 
-                    self.seeing_interface.set_topic(self.time_handler, self.seeing)
-                    self.sal.put(self.seeing)
+        The simulation time jumps from one event to the next, including over the idle intervals and
+        the nights lost to downtime. The handlers give the same results as the visit loop in
+        :meth:`run`. Plug-ins can register handlers or listeners on
+        :attr:`event_queue` and schedule their own events.
 
-                self.get_target_from_scheduler()
+        Parameters
+        ----------
+        start_night : int
+            The first night to run.
+        """
+        last_night = int(self.duration)
+        if start_night > last_night:
+            return
+        self.event_queue.register(EventType.NIGHT_START, self.handle_night_start)
+        self.event_queue.register(EventType.VISIT, self.handle_visit)
+        self.event_queue.register(EventType.NIGHT_END, self.handle_night_end)
+        self.event_queue.register(EventType.DAY_START, self.handle_day_start)
+        self.event_queue.register(EventType.DOWNTIME_END, self.handle_downtime_end)
+        self.event_queue.push(self.time_handler.current_timestamp, EventType.NIGHT_START, night=start_night,
+                              last_night=last_night)
+        self.event_queue.run(self.time_handler)
+        if self.event_queue.profile:
+            self.event_queue.log_profile()
+
+    def checkpoint_limits(self):
+        """Get the last identifiers written to the session database tables.
+
+        Returns
+        -------
+        dict(str, tuple(str, float))
+            The table attribute names mapped to the column and the last value to keep when resuming.
+        """
+        obs = self.seq.observatory_model
+        return {"target_history": ("requestTime", self.time_handler.current_timestamp),
+                "observation_history": ("observationId", obs.observations_made),
+                "slew_history": ("slewCount", obs.slew_count),
+                "slew_initial_state": ("slewStateId", obs.slew_count),
+                "slew_final_state": ("slewStateId", obs.slew_count),
+                "slew_maxspeeds": ("slewMaxSpeedId", obs.slew_count),
+                "slew_activities": ("slewActivityId", obs.slew_activities_done),
+                "target_exposures": ("exposureId", obs.exposures_made),
+                "observation_exposures": ("exposureId", obs.exposures_made),
+                "observation_proposal_history": ("propHistId", self.observation_proposals_counted - 1),
+                "target_proposal_history": ("propHistId", self.target_proposals_counted - 1),
+                "idle_history": ("idleHistoryId",
+                                 self.idle_skipper.skips if self.idle_skipper is not None else 0)}
+
+    def restore_checkpoint(self, night):
+        """Restore the simulation state from the checkpoint of the given night.
+
+        Any information written to the session database after the checkpoint is removed. A driver
+        saved through its state hook is configured before its state is restored.
 
-                observation, slew_info, exposure_info = self.seq.observe_target(self.target,
-                                                                                self.time_handler)
-                # Add a few more things to the observation
-                observation.night = night
-                elapsed_time = self.time_handler.time_since_given(observation.observationStartTime)
-                observation.cloud = self.cloud_interface.get_cloud(elapsed_time)
-                seeing_values = self.seeing_interface.calculate_seeing(elapsed_time, observation.filter,
-                                                                   observation.airmass)
-                observation.seeingFwhm500 = seeing_values[0]
-                observation.seeingFwhmGeom = seeing_values[1]
-                observation.seeingFwhmEff = seeing_values[2]
-
-                visit_exposure_time = sum([observation.exposureTimes[i]
-                                           for i in range(observation.numExposures)])
-                observation.fiveSigmaDepth = m5_flat_sed(observation.filter,
-                                                           observation.skyBrightness,
-                                                           observation.seeingFwhmEff,
-                                                           visit_exposure_time,
-                                                           observation.airmass)
-
-                observation.note = self.target.note
-                observation.numProposals = self.target.numProposals
-                for i in range(self.target.numProposals):
-                    observation.proposalIds[i] = self.target.proposalId[i]
-                self.log.log(LoggingLevel.EXTENSIVE.value, "tx: observation")
-                if self.no_dds_comm:
-                    driver_observation = SALUtils.rtopic_observation(observation)
-                    self.log.debug('%i: %s', observation.numProposals, observation.proposalIds)
-                    self.log.debug('%i: %s', driver_observation.num_props,
-                                   driver_observation.propid_list)
-                    target_list = self.driver.register_observation(driver_observation)
-                    SALUtils.wtopic_interestedProposal(self.interested_proposal,
-                                                       observation.targetId,
-                                                       target_list)
-                else:
-                    self.sal.put(observation)
-
-                    # Wait for interested proposal information
-                    lastconfigtime = time.time()
-                    while self.wait_for_scheduler:
-                        rcode = self.sal.manager.getNextSample_interestedProposal(self.interested_proposal)
-                        if rcode == 0 and self.interested_proposal.numProposals >= 0:
-                            self.log.log(LoggingLevel.EXTENSIVE.value, "Received interested proposal.")
-                            break
-                        else:
-                            tf = time.time()
-                            if (tf - lastconfigtime) > 5.0:
-                                self.log.log(LoggingLevel.EXTENSIVE.value,
-                                             "Failed to receive interested proposal due to timeout.")
-                                break
-
-                if self.wait_for_scheduler and observation.targetId != -1:
-                    self.db.append_data("target_history", self.target)
-                    self.db.append_data("observation_history", observation)
-                    self.gather_proposal_history("target", self.target)
-                    self.gather_proposal_history("observation", self.interested_proposal)
-                    for slew_type, slew_data in slew_info.items():
-                        self.log.log(LoggingLevel.TRACE.value, "{}, {}".format(slew_type, type(slew_data)))
-                        if isinstance(slew_data, list):
-                            for data in slew_data:
-                                self.db.append_data(slew_type, data)
-                        else:
-                            self.db.append_data(slew_type, slew_data)
-                    for exposure_type in exposure_info:
-                        self.log.log(LoggingLevel.TRACE.value, "Adding {} to DB".format(exposure_type))
-                        self.log.log(LoggingLevel.TRACE.value,
-                                     "Number of exposures being added: "
-                                     "{}".format(len(exposure_info[exposure_type])))
-                        for exposure in exposure_info[exposure_type]:
-                            self.db.append_data(exposure_type, exposure)
-
-            self.end_night()
-            if self.no_dds_comm:
-                self.driver.end_night(self.time_handler.current_timestamp, night)
-            self.start_day()
+        Parameters
+        ----------
+        night : int
+            The night at which the checkpoint was taken.
+        """
+        state = self.checkpoint.read(self.db.session_id, night)
+        self.time_handler.set_state(state["time_handler"])
+        self.seq.set_state(state["sequencer"])
+        self.dh.set_state(state["downtime_handler"])
+        self.observation_proposals_counted = state["observation_proposals_counted"]
+        self.target_proposals_counted = state["target_proposals_counted"]
+        if self.idle_skipper is not None and state.get("idle_skipper") is not None:
+            self.idle_skipper.set_state(state["idle_skipper"])
+        if state.get("driver_state") is not None:
+            self.configure_driver()
+            self.driver.set_state(state["driver_state"])
+        else:
+            self.driver = state["driver"]
+        self.db.truncate_session(state["db_limits"])
+        self.log.info("Resuming simulation after night {} at {}".format(night,
+                                                                        self.time_handler.current_timestring))
 
     def save_configuration(self):
         """Save the configuration information to the DB.
@@ -555,13 +905,20 @@ class Simulator(object):
 
         self.seq.start_day(self.filter_swap)
 
-    def start_night(self, night):
+    def start_night(self, night, forward_downtime=True):
         """Perform actions at the start of the night.
 
         Parameters
         ----------
         night : int
             The current night.
+        forward_downtime : bool, optional
+            Flag to forward the time past a night lost to downtime. Default is True.
+
+        Returns
+        -------
+        float or None
+            The time (seconds) to the end of the downtime when it was not forwarded, otherwise None.
         """
         self.log.info("Night {}".format(night))
         self.seq.start_night(night, self.duration)
@@ -569,9 +926,11 @@ class Simulator(object):
 
         self.log.debug("Timestamp: %.6f", self.time_handler.current_timestamp)
 
-        self.seq.sky_model.update(self.time_handler.current_timestamp)
-        (set_timestamp,
-         rise_timestamp) = self.seq.sky_model.get_night_boundaries(self.conf.sched_driver.night_boundary)
+        boundaries = self.night_boundaries.get(night, self.time_handler.current_timestamp)
+        if boundaries is None:
+            self.seq.sky_model.update(self.time_handler.current_timestamp)
+            boundaries = self.seq.sky_model.get_night_boundaries(self.conf.sched_driver.night_boundary)
+        set_timestamp, rise_timestamp = boundaries
 
         self.log.debug("Set timestamp: %.6f", set_timestamp)
         self.log.debug("Rise timestamp: %.6f", rise_timestamp)
@@ -587,8 +946,6 @@ class Simulator(object):
         end_of_night_str = self.time_handler.future_timestring(0, "seconds", timestamp=self.end_of_night)
         self.log.debug("End of night {} at {}".format(night, end_of_night_str))
 
-        self.db.clear_data()
-
         down_days = self.dh.get_downtime(night)
         if down_days:
             self.log.info("Observatory is down: {} days.".format(down_days))
@@ -608,10 +965,42 @@ class Simulator(object):
                 self.sal.put(observatory_state)
 
             delta = math.fabs(self.time_handler.current_timestamp - self.end_of_night) + SECONDS_IN_MINUTE
+            if not forward_downtime:
+                return delta
             self.time_handler.update_time(delta, "seconds")
         elif not self.no_dds_comm:
             self.comm_time.isDown = False
             self.comm_time.downDuration = down_days
+        return None
+
+    def write_checkpoint(self, night):
+        """Write a checkpoint of the simulation state at the end of the given night.
+
+        A driver providing get_state and set_state methods is saved through them, otherwise the
+        driver instance itself is pickled.
+
+        Parameters
+        ----------
+        night : int
+            The current night.
+        """
+        # The checkpoint is only valid once the night's information is in the saved database.
+        if not self.db.data_empty:
+            self.db.flush(self.time_handler.current_timestamp)
+        self.db.wait_for_writes()
+        self.db.backup()
+        has_state_hook = hasattr(self.driver, "get_state") and hasattr(self.driver, "set_state")
+        state = {"night": night,
+                 "time_handler": self.time_handler.get_state(),
+                 "sequencer": self.seq.get_state(),
+                 "downtime_handler": self.dh.get_state(),
+                 "observation_proposals_counted": self.observation_proposals_counted,
+                 "target_proposals_counted": self.target_proposals_counted,
+                 "idle_skipper": self.idle_skipper.get_state() if self.idle_skipper is not None else None,
+                 "driver": None if has_state_hook else self.driver,
+                 "driver_state": self.driver.get_state() if has_state_hook else None,
+                 "db_limits": self.checkpoint_limits()}
+        self.checkpoint.write(self.db.session_id, night, state)
 
     def write_proposal_fields(self, prop_fields):
         """Transform the proposal field information and write to the survey database.
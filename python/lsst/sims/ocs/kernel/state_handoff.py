@@ -0,0 +1,77 @@
+from builtins import object
+import copy
+
+__all__ = ["StateHandoff"]
+
+"""The stored scalar attributes of the observatory state given to the driver. The angles are kept
+in radians and the degree attributes of the state are derived from them.
+"""
+STATE_FIELDS = ("time", "ra_rad", "dec_rad", "ang_rad", "alt_rad", "az_rad", "pa_rad", "rot_rad",
+                "tracking", "telalt_rad", "telaz_rad", "telrot_rad", "domalt_rad", "domaz_rad", "filter")
+
+"""The list attributes of the observatory state given to the driver.
+"""
+STATE_LIST_FIELDS = ("mountedfilters", "unmountedfilters")
+
+class StateHandoff(object):
+    """Give the observatory state to the driver without the DDS topic conversions.
+
+    The driver receives the same state object every time. Before each hand-off, only the attributes
+    that changed in the SOCS observatory model state are copied into it. The list attributes are
+    copied so that the driver never holds the lists of the SOCS model.
+
+    Attributes
+    ----------
+    state : lsst.ts.observatory.model.ObservatoryState or None
+        The state object given to the driver. It is created from the first state refreshed.
+    changed : tuple(str)
+        The attributes copied in the last refresh.
+    refreshes : int
+        The number of refreshes made.
+    fields_copied : int
+        The total number of attributes copied.
+    """
+
+    def __init__(self):
+        """Initialize the class.
+        """
+        self.state = None
+        self.changed = ()
+        self.refreshes = 0
+        self.fields_copied = 0
+
+    def refresh(self, source):
+        """Bring the driver state up to date with the given state.
+
+        Parameters
+        ----------
+        source : lsst.ts.observatory.model.ObservatoryState
+            The current state of the SOCS observatory model.
+
+        Returns
+        -------
+        lsst.ts.observatory.model.ObservatoryState
+            The state object for the driver.
+        """
+        self.refreshes += 1
+        if self.state is None:
+            self.state = copy.deepcopy(source)
+            self.changed = STATE_FIELDS + STATE_LIST_FIELDS
+            self.fields_copied += len(self.changed)
+            return self.state
+
+        state = self.state
+        changed = []
+        for name in STATE_FIELDS:
+            value = getattr(source, name)
+            if getattr(state, name) != value:
+                setattr(state, name, value)
+                changed.append(name)
+        for name in STATE_LIST_FIELDS:
+            value = getattr(source, name)
+            if getattr(state, name) != value:
+                setattr(state, name, list(value))
+                changed.append(name)
+        self.changed = tuple(changed)
+        self.fields_copied += len(changed)
+        return state
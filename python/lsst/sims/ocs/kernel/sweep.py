@@ -0,0 +1,242 @@
+from builtins import object
+import collections
+import copy
+import itertools
+import json
+import logging
+import multiprocessing
+import time
+
+from lsst.sims.ocs.database import FlushPolicy, SocsDatabase
+from lsst.sims.ocs.kernel import Simulator
+from lsst.sims.ocs.setup import configure_file_logging, generate_logfile_path, set_log_levels
+
+__all__ = ["SweepMember", "SurveySweep", "load_driver", "run_sweep_member"]
+
+"""Simple tuple for handling the parameters of a single simulation in a sweep.
+"""
+SweepMember = collections.namedtuple("SweepMember", ["session_id", "config_path", "frac_duration",
+                                                     "downtime_seed"])
+
+def load_driver(scheduler_type):
+    """Create the in-process scheduler driver.
+
+    Parameters
+    ----------
+    scheduler_type : str
+        The type of scheduler driver (feature or proposal).
+
+    Returns
+    -------
+    Driver instance.
+    """
+    if str(scheduler_type) == "feature":
+        from lsst.sims.featureScheduler.driver import FeatureSchedulerDriver as Driver
+    elif str(scheduler_type) == "proposal":
+        from lsst.ts.proposalScheduler import ProposalDriver as Driver
+    else:
+        raise ValueError("Unknown scheduler type {}".format(scheduler_type))
+    return Driver()
+
+def run_sweep_member(options):
+    """Run a single simulation of a sweep.
+
+    The session database must have already been created by the parent process. Each call creates
+    its own :class:`.SocsDatabase` and :class:`.Simulator` instances and logs directly to the
+    session log file.
+
+    Parameters
+    ----------
+    options : argparse.Namespace
+        The full set of options for the simulation including the allocated *session_id*.
+
+    Returns
+    -------
+    tuple(int, str, float)
+        The session ID, the completion status and the running time (seconds).
+    """
+    session_id = options.session_id
+    console_detail, file_detail = set_log_levels(options.verbose)
+    configure_file_logging(file_detail, generate_logfile_path(options.log_path, session_id))
+    log = logging.getLogger("opsim4-sweep")
+
+    start_time = time.time()
+    sim = None
+    try:
+        db = SocsDatabase(sqlite_save_path=options.sqlite_save_dir,
+                          session_id_start=options.session_id_start,
+                          sqlite_session_save_path=options.sqlite_session_save_dir,
+                          async_write=options.db_async_write,
+                          write_queue_size=options.db_write_queue_size,
+                          durability=options.db_durability,
+                          fast_insert=options.db_fast_insert,
+                          columnar=options.db_columnar,
+                          output_format=options.output_format,
+                          deferred_indexes=options.db_deferred_indexes,
+                          working_path=options.db_working_path,
+                          backup_interval=options.db_backup_interval,
+                          flush_policy=FlushPolicy(max_rows=options.db_flush_rows,
+                                                   max_bytes=options.db_flush_bytes,
+                                                   interval=options.db_flush_interval,
+                                                   nights=options.db_flush_nights))
+        db.resume_session(session_id)
+
+        sim = Simulator(options, db, driver=load_driver(options.scheduler_type))
+        sim.initialize()
+        try:
+            sim.run()
+        except BaseException:
+            if not sim.db.data_empty:
+                sim.db.flush()
+            raise
+        finally:
+            sim.finalize()
+        status = "completed"
+    except Exception:
+        log.exception("An exception was thrown in SOCS!")
+        status = "failed"
+
+    run_time = time.time() - start_time
+    log.info("Total running time = {:.2f} seconds".format(run_time))
+    return (session_id, status, run_time)
+
+class SurveySweep(object):
+    """Run a matrix of simulations across a local process pool.
+
+    The matrix is the product of the configuration override paths, fractional survey durations
+    and unscheduled downtime seeds. Session IDs are allocated sequentially by the parent process
+    before the simulations are handed to the workers, so concurrent runs never share one.
+
+    Attributes
+    ----------
+    options : argparse.Namespace
+        The base options for every simulation.
+    members : list[:class:`.SweepMember`]
+        The set of simulations in the sweep.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, options):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        options : argparse.Namespace
+            The options returned by the sweep ArgumentParser instance.
+        """
+        self.options = options
+        self.members = []
+        self.log = logging.getLogger("kernel.SurveySweep")
+
+    @property
+    def matrix(self):
+        """list[tuple(str, float, int)]: The configuration path, fractional duration and downtime seed
+           for each simulation.
+        """
+        config_paths = self.options.config_paths or [self.options.config_path]
+        frac_durations = self.options.frac_durations or [self.options.frac_duration]
+        downtime_seeds = self.options.downtime_seeds or [self.options.downtime_seed]
+        return list(itertools.product(config_paths, frac_durations, downtime_seeds))
+
+    def allocate_sessions(self):
+        """Create the session databases for each simulation in the sweep.
+
+        The session databases are created with the same schema options as the simulations use, so
+        that deferred indexes are left out for the simulations to create.
+        """
+        db = SocsDatabase(sqlite_save_path=self.options.sqlite_save_dir,
+                          session_id_start=self.options.session_id_start,
+                          sqlite_session_save_path=self.options.sqlite_session_save_dir,
+                          durability=self.options.db_durability,
+                          output_format=self.options.output_format,
+                          deferred_indexes=self.options.db_deferred_indexes,
+                          working_path=self.options.db_working_path)
+        self.members = []
+        for config_path, frac_duration, downtime_seed in self.matrix:
+            comment = "{} (sweep: config_path={}, frac_duration={}, "\
+                      "downtime_seed={})".format(self.options.startup_comment, config_path, frac_duration,
+                                                 downtime_seed)
+            session_id = db.new_session(comment)
+            self.members.append(SweepMember(session_id, config_path, frac_duration, downtime_seed))
+
+    def member_options(self, member):
+        """Create the options for a single simulation in the sweep.
+
+        Parameters
+        ----------
+        member : :class:`.SweepMember`
+            The simulation parameters.
+
+        Returns
+        -------
+        argparse.Namespace
+        """
+        options = copy.copy(self.options)
+        options.session_id = member.session_id
+        options.config_path = member.config_path
+        options.frac_duration = member.frac_duration
+        options.downtime_seed = member.downtime_seed
+        options.dds_comm = False
+        options.resume = None
+        options.from_night = None
+        return options
+
+    def run(self):
+        """Run all the simulations of the sweep.
+
+        Returns
+        -------
+        list[dict]
+            The manifest entries for the simulations.
+        """
+        self.allocate_sessions()
+        results = {}
+        self.write_manifest(results)
+        self.log.info("Running {} simulations".format(len(self.members)))
+
+        pool = multiprocessing.Pool(processes=self.options.processes, maxtasksperchild=1)
+        try:
+            for session_id, status, run_time in pool.imap_unordered(run_sweep_member,
+                                                                    [self.member_options(m)
+                                                                     for m in self.members]):
+                self.log.info("Session {} {} in {:.2f} seconds".format(session_id, status, run_time))
+                results[session_id] = (status, run_time)
+                self.write_manifest(results)
+        finally:
+            pool.close()
+            pool.join()
+
+        return self.manifest(results)
+
+    def manifest(self, results):
+        """Create the manifest entries for the simulations.
+
+        Parameters
+        ----------
+        results : dict(int, tuple(str, float))
+            The completion status and running time for the finished simulations.
+
+        Returns
+        -------
+        list[dict]
+        """
+        entries = []
+        for member in self.members:
+            entry = member._asdict()
+            status, run_time = results.get(member.session_id, ("pending", None))
+            entry["status"] = status
+            entry["run_time"] = run_time
+            entries.append(entry)
+        return entries
+
+    def write_manifest(self, results):
+        """Write the manifest file for the sweep.
+
+        Parameters
+        ----------
+        results : dict(int, tuple(str, float))
+            The completion status and running time for the finished simulations.
+        """
+        with open(self.options.manifest, 'w') as mfile:
+            json.dump(self.manifest(results), mfile, indent=2)
@@ -1,8 +1,24 @@
+from __future__ import division
 from builtins import object
 from datetime import datetime
 from datetime import timedelta
+import math
 
-__all__ = ["TimeHandler"]
+__all__ = ["TimeHandler", "EpochTimeHandler"]
+
+"""The number of microseconds in a second.
+"""
+MICROSECONDS_IN_SECOND = 1000000
+
+"""The number of microseconds in a day.
+"""
+MICROSECONDS_IN_DAY = 86400 * MICROSECONDS_IN_SECOND
+
+"""The number of microseconds in each of the :class:`datetime.timedelta` units.
+"""
+MICROSECONDS_IN_UNIT = {"microseconds": 1, "milliseconds": 1000, "seconds": MICROSECONDS_IN_SECOND,
+                        "minutes": 60 * MICROSECONDS_IN_SECOND, "hours": 3600 * MICROSECONDS_IN_SECOND,
+                        "days": MICROSECONDS_IN_DAY, "weeks": 7 * MICROSECONDS_IN_DAY}
 
 class TimeHandler(object):
     """Keep track of simulation time information.
@@ -106,6 +122,26 @@ class TimeHandler(object):
         """
         return self.current_dt.isoformat()
 
+    def get_state(self):
+        """Return the information needed to restore the handler.
+
+        Returns
+        -------
+        dict
+            The current simulation date/time.
+        """
+        return {"current_dt": self.current_dt}
+
+    def set_state(self, state):
+        """Restore the handler from a previously saved state.
+
+        Parameters
+        ----------
+        state : dict
+            The information returned from :meth:`get_state`.
+        """
+        self.current_dt = state["current_dt"]
+
     def has_time_elapsed(self, time_span):
         """Return a boolean determining if the time span has elapsed.
 
@@ -240,3 +276,211 @@ class TimeHandler(object):
             return self._time_difference(self.initial_dt, given_datetime)
         else:
             return self._time_difference(given_datetime, self.initial_dt)
+
+
+class EpochTimeHandler(TimeHandler):
+    """Keep track of simulation time information as a count since the UNIX epoch.
+
+    The current time is held as an integer number of microseconds since the UNIX epoch, which is
+    the resolution of :class:`datetime.datetime`, so the timestamps are identical to the ones from
+    :class:`.TimeHandler`. The current timestamp is cached when the time is updated and the
+    date/time instances and ISO-8601 strings are only created when asked for.
+
+    Attributes
+    ----------
+    initial_us : int
+        The simulation start in microseconds since the UNIX epoch.
+    current_us : int
+        The current simulation time in microseconds since the UNIX epoch.
+    """
+
+    def __init__(self, initial_date):
+        """Initialize the class.
+
+        Parameters
+        ----------
+            initial_date : str
+                The inital date in the format of YYYY-MM-DD.
+        """
+        self._current_timestamp = None
+        super(EpochTimeHandler, self).__init__(initial_date)
+        self.initial_us = self._datetime_us(self.initial_dt)
+        self._initial_timestamp = self.initial_us / MICROSECONDS_IN_SECOND
+
+    def _datetime_us(self, dt):
+        """Get the number of microseconds since the UNIX epoch for a date/time.
+
+        Parameters
+        ----------
+        dt : datetime.datetime
+            The date/time instance.
+
+        Returns
+        -------
+        int
+        """
+        return self._timedelta_us(dt - self._unix_start)
+
+    @staticmethod
+    def _timedelta_us(delta):
+        """Get the number of microseconds in a time difference.
+
+        Parameters
+        ----------
+        delta : datetime.timedelta
+            The time difference.
+
+        Returns
+        -------
+        int
+        """
+        return (delta.days * 86400 + delta.seconds) * MICROSECONDS_IN_SECOND + delta.microseconds
+
+    @staticmethod
+    def _timestamp_us(timestamp):
+        """Get the number of microseconds since the UNIX epoch for a UNIX timestamp.
+
+        The fraction of a second is rounded half to even like
+        :meth:`datetime.datetime.utcfromtimestamp`.
+
+        Parameters
+        ----------
+        timestamp : float
+            The UNIX timestamp.
+
+        Returns
+        -------
+        int
+        """
+        frac, seconds = math.modf(timestamp)
+        return int(seconds) * MICROSECONDS_IN_SECOND + int(round(frac * MICROSECONDS_IN_SECOND))
+
+    @staticmethod
+    def _increment_us(time_increment, time_units):
+        """Get the number of microseconds in a time increment.
+
+        The conversion follows :class:`datetime.timedelta`: the whole part of the increment is converted
+        exactly and the leftover fraction of a microsecond rounds the total half to even.
+
+        Parameters
+        ----------
+        time_increment : float
+            The time increment.
+        time_units : str
+            The time unit for the increment value.
+
+        Returns
+        -------
+        int
+        """
+        unit_us = MICROSECONDS_IN_UNIT[time_units]
+        frac, whole = math.modf(time_increment)
+        leftover, frac_us = math.modf(frac * unit_us)
+        increment = int(whole) * unit_us + int(frac_us)
+        if abs(leftover) == 0.5:
+            return (increment + int(math.copysign(1, leftover))) if increment % 2 else increment
+        return increment + int(round(leftover))
+
+    @property
+    def current_dt(self):
+        """datetime.datetime: The current simulation date/time.
+        """
+        return self._unix_start + timedelta(microseconds=self.current_us)
+
+    @current_dt.setter
+    def current_dt(self, dt):
+        self.current_us = self._datetime_us(dt)
+        self._current_timestamp = self.current_us / MICROSECONDS_IN_SECOND
+
+    @property
+    def initial_timestamp(self):
+        """float: Return the UNIX timestamp for the initial date/time.
+        """
+        return self._initial_timestamp
+
+    @property
+    def current_timestamp(self):
+        """float: Return the UNIX timestamp for the current date/time.
+        """
+        return self._current_timestamp
+
+    @property
+    def current_midnight_timestamp(self):
+        """float: Return the UNIX timestamp of midnight for the current date.
+        """
+        return (self.current_us // MICROSECONDS_IN_DAY) * MICROSECONDS_IN_DAY / MICROSECONDS_IN_SECOND
+
+    @property
+    def next_midnight_timestamp(self):
+        """float: Return the UNIX timestamp of midnight for the next day after current date.
+        """
+        return (self.current_us // MICROSECONDS_IN_DAY + 1) * MICROSECONDS_IN_DAY / MICROSECONDS_IN_SECOND
+
+    @property
+    def time_since_start(self):
+        """float: The number of seconds since the start date.
+        """
+        return (self.current_us - self.initial_us) / MICROSECONDS_IN_SECOND
+
+    def update_time(self, time_increment, time_units):
+        """Update the currently held timestamp.
+
+        Parameters
+        ----------
+        time_increment : float
+            The increment to adjust the current time.
+        time_units : str
+            The time unit for the increment value.
+        """
+        self.current_us += self._increment_us(time_increment, time_units)
+        self._current_timestamp = self.current_us / MICROSECONDS_IN_SECOND
+
+    def has_time_elapsed(self, time_span):
+        """Return a boolean determining if the time span has elapsed.
+
+        Parameters
+        ----------
+        time_span : float
+            The requested time span in seconds.
+
+        Returns
+        -------
+        bool
+            True if the time elapsed is greater or False if less than the time span.
+        """
+        return time_span >= self.time_since_start
+
+    def future_timestamp(self, time_increment, time_units, timestamp=None):
+        """Return the UNIX timestamp for the future date/time.
+
+        Parameters
+        ----------
+        time_increment : float
+            The increment to adjust the current time.
+        time_units : str
+            The time unit for the increment value.
+        timestamp : float, optional
+            An alternative timestamp to apply the time increment to.
+
+        Returns
+        -------
+        float
+            The future UNIX timestamp.
+        """
+        start_us = self._timestamp_us(timestamp) if timestamp is not None else self.current_us
+        return (start_us + self._increment_us(time_increment, time_units)) / MICROSECONDS_IN_SECOND
+
+    def time_since_given(self, timestamp):
+        """Return the elapsed time (seconds).
+
+        Parameters
+        ----------
+        timestamp : float
+            A UNIX timestamp
+
+        Returns
+        -------
+        float
+            The elapsed time (seconds) between the given timestamp and the initial timestamp.
+        """
+        return (self._timestamp_us(timestamp) - self.initial_us) / MICROSECONDS_IN_SECOND
@@ -3,6 +3,7 @@ Module for classes that implement the necessary behavior for the SOCS additions
 Scheduler Observatory Model.
 """
 from .exposure_information import *
+from .slew_cache import *
 from .slew_information import *
 from .variational_model import *
 from .main_observatory import *
@@ -4,6 +4,7 @@ from builtins import str
 import copy
 import logging
 import math
+import operator
 
 import palpy
 
@@ -13,10 +14,51 @@ from lsst.ts.observatory.model import ObservatoryModel, Target
 from lsst.sims.ocs.setup import LoggingLevel
 from lsst.sims.ocs.observatory import ObsExposure, TargetExposure
 from lsst.sims.ocs.observatory import SlewActivity, SlewHistory, SlewMaxSpeeds, SlewState
+from lsst.sims.ocs.observatory import SlewCache, snapshot_state
 from lsst.sims.ocs.observatory import VariationalModel
 
 __all__ = ["MainObservatory"]
 
+"""The ObservatoryModel attributes used through MainObservatory.
+"""
+DELEGATED_ATTRIBUTES = ("current_state", "park_state")
+
+"""The ObservatoryModel methods used through MainObservatory.
+"""
+DELEGATED_METHODS = ("park", "update_state")
+
+def _delegate_attribute(name):
+    """Create a property forwarding an attribute to the ObservatoryModel.
+
+    Parameters
+    ----------
+    name : str
+        The attribute name.
+
+    Returns
+    -------
+    property
+    """
+    def fset(self, value):
+        setattr(self.model, name, value)
+    return property(operator.attrgetter("model." + name), fset,
+                    doc="Forwarded to the ObservatoryModel {} attribute.".format(name))
+
+def _delegate_method(name):
+    """Create a property returning a method of the ObservatoryModel.
+
+    Parameters
+    ----------
+    name : str
+        The method name.
+
+    Returns
+    -------
+    property
+    """
+    return property(operator.attrgetter("model." + name),
+                    doc="Forwarded to the ObservatoryModel {} method.".format(name))
+
 class MainObservatory(object):
     """Class for the Main Observatory.
 
@@ -25,6 +67,9 @@ class MainObservatory(object):
     as its base information. There is an option to add variations onto the parameters and values that
     the model calculates to simulate real world behaviors.
 
+    The parts of the observatory model API used by SOCS are forwarded to the model by properties.
+    Other model attributes are only found when the model fallback is turned on.
+
     Attributes
     ----------
     log : logging.Logger
@@ -33,17 +78,27 @@ class MainObservatory(object):
         The instance of the Observatory model from the LSST Scheduler.
     param_dict : dict
         The configuration parameters for the Observatory model.
+    model_fallback : bool
+        Flag to look up unknown attributes on the observatory model.
+    slew_cache : :class:`.SlewCache` or None
+        The instance remembering the slew delays, if turned on.
     """
 
-    def __init__(self, obs_site_config):
+    model_fallback = False
+
+    def __init__(self, obs_site_config, model_fallback=False):
         """Initialize the class.
 
         Parameters
         ----------
         obs_site_config : :class:`.ObservingSite`
             The instance of the observing site configuration.
+        model_fallback : bool, optional
+            Flag to look up unknown attributes on the observatory model. This is meant for debugging
+            since the lookups are slow. Default is False.
         """
         self.log = logging.getLogger("observatory.MainObservatory")
+        self.model_fallback = model_fallback
         observatory_location = ObservatoryLocation()
         observatory_location.configure({"obs_site": obs_site_config.toDict()})
         self.config = None
@@ -62,18 +117,23 @@ class MainObservatory(object):
         self.slew_activities_done = 0
         self.slew_maxspeeds = None
         self.variational_model = None
+        self.slew_cache = None
 
     def __getattr__(self, name):
-        """Find attributes in lsst.ts.scheduler.observator_model.ObservatorModel as well as MainObservatory.
+        """Find attributes in lsst.ts.scheduler.observator_model.ObservatorModel for the model fallback.
         """
+        cclass_name = self.__class__.__name__
+        if not self.model_fallback or name == "model":
+            raise AttributeError("'{}' object has no attribute '{}'".format(cclass_name, name))
         try:
-            return getattr(self.model, name)
+            value = getattr(self.model, name)
         except AttributeError:
-            cclass_name = self.__class__.__name__
             aclass_name = self.model.__class__.__name__
             raise AttributeError("'{}' and '{}' objects have no attribute '{}'".format(cclass_name,
                                                                                        aclass_name,
                                                                                        name))
+        self.log.debug("Attribute {} found through the model fallback.".format(name))
+        return value
 
     def calculate_visit_time(self, target, th):
         """Calculate the visit time from the target and camera information.
@@ -133,6 +193,25 @@ class MainObservatory(object):
         self.param_dict.update(self.config.toDict())
         self.model.configure(self.param_dict)
         self.variational_model = VariationalModel(obs_config)
+        if self.slew_cache is not None:
+            self.slew_cache.clear()
+
+    def enable_slew_cache(self, max_size, resolution=1.0e-3, strict=False):
+        """Remember the slew delays calculated by the observatory model.
+
+        Parameters
+        ----------
+        max_size : int
+            The largest number of remembered delays.
+        resolution : float, optional
+            The rounding (degrees) of the telescope and dome positions in the cache key.
+            Default is 0.001.
+        strict : bool, optional
+            Flag to check the cached delays against calculated ones. Default is False.
+        """
+        slew_cache = SlewCache(self.model, max_size, resolution, strict)
+        if slew_cache.install():
+            self.slew_cache = slew_cache
 
     def get_slew_activities(self):
         """Get the slew activities for the given slew.
@@ -158,7 +237,7 @@ class MainObservatory(object):
 
         Parameters
         ----------
-        slew_state_info : lsst.ts.scheduler.observatory_model.ObservatoryState
+        slew_state_info : lsst.ts.scheduler.observatory_model.ObservatoryState or :class:`.StateSnapshot`
             The current slew state instance.
 
         Returns
@@ -174,6 +253,34 @@ class MainObservatory(object):
                                self.slew_count)
         return slew_state
 
+    def get_state(self):
+        """Return the information needed to restore the observatory.
+
+        Returns
+        -------
+        dict
+            The current model state and the observatory counters.
+        """
+        return {"current_state": copy.deepcopy(self.model.current_state),
+                "slew_count": self.slew_count,
+                "observations_made": self.observations_made,
+                "exposures_made": self.exposures_made,
+                "slew_activities_done": self.slew_activities_done}
+
+    def set_state(self, state):
+        """Restore the observatory from a previously saved state.
+
+        Parameters
+        ----------
+        state : dict
+            The information returned from :meth:`get_state`.
+        """
+        self.model.current_state = state["current_state"]
+        self.slew_count = state["slew_count"]
+        self.observations_made = state["observations_made"]
+        self.exposures_made = state["exposures_made"]
+        self.slew_activities_done = state["slew_activities_done"]
+
     def observe(self, time_handler, target, observation):
         """Perform the observation of the given target.
 
@@ -260,14 +367,14 @@ class MainObservatory(object):
         """
         self.slew_count += 1
         self.log.log(LoggingLevel.TRACE.value, "Slew count: {}".format(self.slew_count))
-        initial_slew_state = copy.deepcopy(self.model.current_state)
+        initial_slew_state = snapshot_state(self.model.current_state)
         self.log.log(LoggingLevel.TRACE.value, "Initial slew state: {}".format(initial_slew_state))
         self.slew_initial_state = self.get_slew_state(initial_slew_state)
 
         sched_target = Target.from_topic(target)
         self.model.slew(sched_target)
 
-        final_slew_state = copy.deepcopy(self.model.current_state)
+        final_slew_state = snapshot_state(self.model.current_state)
         self.log.log(LoggingLevel.TRACE.value, "Final slew state: {}".format(final_slew_state))
         self.slew_final_state = self.get_slew_state(final_slew_state)
 
@@ -302,6 +409,8 @@ class MainObservatory(object):
         if self.variational_model.active:
             new_obs_config = self.variational_model.modify_parameters(night, duration)
             self.model.configure(new_obs_config)
+            if self.slew_cache is not None:
+                self.slew_cache.clear()
 
     def swap_filter(self, filter_to_unmount):
         """Perform a filter swap.
@@ -317,3 +426,10 @@ class MainObservatory(object):
         """
         self.log.debug("Swap out {} filter.".format(filter_to_unmount))
         self.model.swap_filter(filter_to_unmount)
+
+
+for _name in DELEGATED_ATTRIBUTES:
+    setattr(MainObservatory, _name, _delegate_attribute(_name))
+for _name in DELEGATED_METHODS:
+    setattr(MainObservatory, _name, _delegate_method(_name))
+del _name
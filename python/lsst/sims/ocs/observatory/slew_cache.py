@@ -0,0 +1,193 @@
+from builtins import object
+from builtins import zip
+import collections
+import logging
+import math
+
+__all__ = ["SlewCache"]
+
+"""The observatory state attributes (radians) describing a position for the slew delay.
+"""
+POSITION_FIELDS = ("telalt_rad", "telaz_rad", "telrot_rad", "domalt_rad", "domaz_rad")
+
+"""The target state attributes (radians per second) set by the slew delay calculation. The degree
+peak speeds of the state are derived from them.
+"""
+PEAKSPEED_FIELDS = ("domalt_peakspeed_rad", "domaz_peakspeed_rad", "telalt_peakspeed_rad",
+                    "telaz_peakspeed_rad", "telrot_peakspeed_rad")
+
+"""Simple tuple for holding a cached slew delay and its side information.
+"""
+SlewCacheEntry = collections.namedtuple("SlewCacheEntry", ["delay", "peakspeeds", "delays_dict",
+                                                           "criticalpath"])
+
+class SlewCache(object):
+    """Remember the slew delays calculated by the observatory model.
+
+    The cache replaces the get_slew_delay_for_state method of the model instance. The key is made from
+    the telescope and dome positions and filters of the initial and target states, rounded to the
+    resolution. A cached result restores the peak speeds on the target state and the last slew
+    delays and critical path on the model, so the slew looks the same as a calculated one. Since
+    states within the resolution share a result, the cached delays can differ slightly from
+    calculated ones. The strict mode calculates every delay and counts the cached results that do
+    not match.
+
+    Attributes
+    ----------
+    model : lsst.ts.observatory.model.ObservatoryModel
+        The instance of the observatory model.
+    max_size : int
+        The largest number of remembered delays. The least recently used ones are dropped.
+    resolution : float
+        The rounding (degrees) of the positions in the key.
+    strict : bool
+        Flag to check the cached delays against calculated ones.
+    tolerance : float
+        The largest difference (seconds) between a cached and calculated delay in the strict mode.
+    entries : collections.OrderedDict
+        The cached results in order of use.
+    hits : int
+        The number of delays found in the cache.
+    misses : int
+        The number of delays calculated.
+    mismatches : int
+        The number of cached delays not matching the calculated ones in the strict mode.
+    log : logging.Logger
+        The logging instance.
+    """
+
+    def __init__(self, model, max_size=100000, resolution=1.0e-3, strict=False, tolerance=1.0e-6):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        model : lsst.ts.observatory.model.ObservatoryModel
+            The instance of the observatory model.
+        max_size : int, optional
+            The largest number of remembered delays. Default is 100000.
+        resolution : float, optional
+            The rounding (degrees) of the positions in the key. Default is 0.001.
+        strict : bool, optional
+            Flag to check the cached delays against calculated ones. Default is False.
+        tolerance : float, optional
+            The largest difference (seconds) between a cached and calculated delay in the strict
+            mode. Default is 1e-6.
+        """
+        self.model = model
+        self.max_size = max_size
+        self.resolution = resolution
+        self.strict = strict
+        self.tolerance = tolerance
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.mismatches = 0
+        self.calculate = None
+        self.log = logging.getLogger("observatory.SlewCache")
+
+    def __len__(self):
+        """int: The number of remembered delays.
+        """
+        return len(self.entries)
+
+    def clear(self):
+        """Forget the remembered delays.
+
+        This must be done when the observatory model is configured again.
+        """
+        self.entries.clear()
+
+    def install(self):
+        """Put the cache in front of the model slew delay calculation.
+
+        Returns
+        -------
+        bool
+            True if the model has a slew delay calculation to cache.
+        """
+        if self.calculate is not None:
+            return True
+        calculate = getattr(self.model, "get_slew_delay_for_state", None)
+        if calculate is None:
+            self.log.warning("The observatory model has no get_slew_delay_for_state, slew cache not used.")
+            return False
+        self.calculate = calculate
+        self.model.get_slew_delay_for_state = self.get_slew_delay_for_state
+        return True
+
+    def key(self, targetstate, initstate):
+        """Create the cache key for a slew.
+
+        Parameters
+        ----------
+        targetstate : lsst.ts.observatory.model.ObservatoryState
+            The state at the end of the slew.
+        initstate : lsst.ts.observatory.model.ObservatoryState
+            The state at the start of the slew.
+
+        Returns
+        -------
+        tuple
+        """
+        resolution = math.radians(self.resolution)
+        return (tuple(int(round(getattr(initstate, name) / resolution)) for name in POSITION_FIELDS),
+                initstate.filter, initstate.tracking,
+                tuple(int(round(getattr(targetstate, name) / resolution)) for name in POSITION_FIELDS),
+                targetstate.filter)
+
+    def get_slew_delay_for_state(self, targetstate, initstate, include_slew_data=False):
+        """Get the slew delay from the cache or the observatory model.
+
+        Parameters
+        ----------
+        targetstate : lsst.ts.observatory.model.ObservatoryState
+            The state at the end of the slew.
+        initstate : lsst.ts.observatory.model.ObservatoryState
+            The state at the start of the slew.
+        include_slew_data : bool, optional
+            Flag to keep the slew delays and critical path on the model. Default is False.
+
+        Returns
+        -------
+        float
+            The slew delay (seconds).
+        """
+        key = self.key(targetstate, initstate)
+        entry = self.entries.pop(key, None)
+        if entry is not None and not self.strict:
+            self.hits += 1
+            self.entries[key] = entry
+            for name, value in zip(PEAKSPEED_FIELDS, entry.peakspeeds):
+                setattr(targetstate, name, value)
+            if include_slew_data:
+                self.model.lastslew_delays_dict = dict(entry.delays_dict)
+                self.model.lastslew_criticalpath = list(entry.criticalpath)
+            return entry.delay
+
+        delay = self.calculate(targetstate, initstate, include_slew_data)
+        if entry is not None:
+            self.hits += 1
+            if abs(entry.delay - delay) > self.tolerance:
+                self.mismatches += 1
+                self.log.warning("Cached slew delay {} does not match calculated delay {}."
+                                 .format(entry.delay, delay))
+        else:
+            self.misses += 1
+        if not include_slew_data:
+            # The slew delays and critical path are only known for calculations that keep them.
+            if entry is not None:
+                self.entries[key] = entry
+            return delay
+        self.entries[key] = SlewCacheEntry(delay, tuple(getattr(targetstate, name)
+                                                        for name in PEAKSPEED_FIELDS),
+                                           dict(self.model.lastslew_delays_dict),
+                                           list(self.model.lastslew_criticalpath))
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return delay
+
+    def log_stats(self):
+        """Log the cache counters.
+        """
+        self.log.info("Slew cache: {} hits, {} misses, {} mismatches, {} entries."
+                      .format(self.hits, self.misses, self.mismatches, len(self)))
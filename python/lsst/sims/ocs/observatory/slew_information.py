@@ -1,6 +1,7 @@
 import collections
+import operator
 
-__all__ = ["SlewActivity", "SlewHistory", "SlewMaxSpeeds", "SlewState"]
+__all__ = ["SlewActivity", "SlewHistory", "SlewMaxSpeeds", "SlewState", "StateSnapshot", "snapshot_state"]
 
 """Simple tuple for handling slew history information.
 """
@@ -24,3 +25,31 @@ SlewActivity = collections.namedtuple("SlewActivity", ["slewActivityId", "activi
 SlewMaxSpeeds = collections.namedtuple("SlewMaxSpeeds", ["slewMaxSpeedId", "domeAltSpeed", "domeAzSpeed",
                                                          "telAltSpeed", "telAzSpeed", "rotatorSpeed",
                                                          "SlewHistory_slewCount"])
+
+"""Simple tuple for holding the observatory state information needed around a slew.
+"""
+StateSnapshot = collections.namedtuple("StateSnapshot", ["time", "ra", "dec", "ra_rad", "dec_rad", "ang",
+                                                         "alt", "az", "pa", "tracking", "telalt", "telaz",
+                                                         "telrot", "domalt", "domaz", "filter",
+                                                         "domalt_peakspeed", "domaz_peakspeed",
+                                                         "telalt_peakspeed", "telaz_peakspeed",
+                                                         "telrot_peakspeed"])
+
+_snapshot_getter = operator.attrgetter(*StateSnapshot._fields)
+
+def snapshot_state(state):
+    """Copy the slew information from an observatory state.
+
+    Only the scalar attributes are copied, so the snapshot is not affected by later changes to the
+    state and does not need a deep copy of it.
+
+    Parameters
+    ----------
+    state : lsst.ts.observatory.model.ObservatoryState
+        The observatory state instance.
+
+    Returns
+    -------
+    :class:`.StateSnapshot`
+    """
+    return StateSnapshot._make(_snapshot_getter(state))
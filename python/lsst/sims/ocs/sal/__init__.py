@@ -2,4 +2,5 @@
 Module for classes and functions dealing with the SAL interface.
 """
 from .sal_manager import *
+from .topic_structs import *
 from .topic_utilities import *
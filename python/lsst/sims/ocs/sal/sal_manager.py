@@ -1,6 +1,11 @@
 from builtins import object
 from builtins import str
-import SALPY_scheduler
+try:
+    import SALPY_scheduler
+except ImportError:
+    # The topics created without DDS communication are native structures, so the module can be
+    # imported before the package is found. The Scheduler driver still needs a SAL build.
+    SALPY_scheduler = None
 
 __all__ = ["SalManager"]
 
@@ -25,10 +30,36 @@ class SalManager(object):
         """Perform initialization steps.
 
         This function handles creation of the Scheduler SAL manager and sets the debugging level.
+
+        Raises
+        ------
+        ImportError
+            If the SALPY_scheduler package is not available.
         """
-        self.manager = SALPY_scheduler.SAL_scheduler()
+        self.manager = self._get_sal_class("SAL_scheduler")()
         self.manager.setDebugLevel(self.debug_level)
 
+    def _get_sal_class(self, class_name):
+        """Get a class from the SALPY_scheduler package.
+
+        Parameters
+        ----------
+        class_name : str
+            The name of the class.
+
+        Returns
+        -------
+        type
+
+        Raises
+        ------
+        ImportError
+            If the SALPY_scheduler package is not available.
+        """
+        if SALPY_scheduler is None:
+            raise ImportError("The SALPY_scheduler package is required for DDS communication.")
+        return getattr(SALPY_scheduler, class_name)
+
     def finalize(self):
         """Perform finalization steps.
 
@@ -52,7 +83,7 @@ class SalManager(object):
             The telemetry data structure associated with the topic.
         """
         topic_name = "scheduler_{}".format(topic_short_name)
-        topic = getattr(SALPY_scheduler, "{}C".format(topic_name))
+        topic = self._get_sal_class("{}C".format(topic_name))
         return topic()
 
     def set_publish_topic(self, topic_short_name):
@@ -72,7 +103,7 @@ class SalManager(object):
         """
         topic_name = "scheduler_{}".format(topic_short_name)
         self.manager.salTelemetryPub(topic_name)
-        topic = getattr(SALPY_scheduler, "{}C".format(topic_name))
+        topic = self._get_sal_class("{}C".format(topic_name))
         return topic()
 
     def set_subscribe_topic(self, topic_short_name):
@@ -92,7 +123,7 @@ class SalManager(object):
         """
         topic_name = "scheduler_{}".format(topic_short_name)
         self.manager.salTelemetrySub(topic_name)
-        topic = getattr(SALPY_scheduler, "{}C".format(topic_name))
+        topic = self._get_sal_class("{}C".format(topic_name))
         return topic()
 
     def set_subscribe_logevent(self, event_short_name):
@@ -112,7 +143,7 @@ class SalManager(object):
         """
         topic_name = "scheduler_logevent_{}".format(event_short_name)
         self.manager.salEventSub(topic_name)
-        topic = getattr(SALPY_scheduler, "{}C".format(topic_name))
+        topic = self._get_sal_class("{}C".format(topic_name))
         return topic()
 
     def put(self, topic_obj):
@@ -134,7 +165,7 @@ class SalManager(object):
 
         self.manager.salProcessor("scheduler_command_{}".format(cmd))
         # Get the myData object
-        self.cmd_topic = getattr(SALPY_scheduler, 'scheduler_command_{}C'.format(cmd))()
+        self.cmd_topic = self._get_sal_class('scheduler_command_{}C'.format(cmd))()
 
         # cmd_topic = self.update_myData(myData,**kwargs)
         for key in kwargs:
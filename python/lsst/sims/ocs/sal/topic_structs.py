@@ -0,0 +1,170 @@
+from builtins import object
+
+__all__ = ["TopicStruct", "TimeHandlerStruct", "TargetStruct", "BulkCloudStruct", "SeeingStruct",
+           "NeedFilterSwapStruct", "InterestedProposalStruct", "ObservationStruct", "ObservatoryStateStruct",
+           "create_topic"]
+
+"""The length of the exposure time arrays in the topics.
+"""
+MAX_EXPOSURES = 10
+
+"""The length of the proposal arrays in the topics.
+"""
+MAX_PROPOSALS = 100
+
+def _proposal_fields(*names):
+    """Create the fields for proposal arrays.
+
+    Parameters
+    ----------
+    names : str
+        The field names.
+
+    Returns
+    -------
+    tuple(tuple(str, list))
+    """
+    return tuple((name, [0] * MAX_PROPOSALS) for name in names)
+
+
+"""The fields shared by the target and observation topics.
+"""
+_SKY_FIELDS = (("moonRa", 0.0), ("moonDec", 0.0), ("moonAlt", 0.0), ("moonAz", 0.0), ("moonPhase", 0.0),
+               ("moonDistance", 0.0), ("sunRa", 0.0), ("sunDec", 0.0), ("sunAlt", 0.0), ("sunAz", 0.0),
+               ("solarElong", 0.0))
+
+_TIME_HANDLER_FIELDS = (("timestamp", 0.0), ("night", 0), ("isDown", False), ("downDuration", 0.0))
+
+_TARGET_FIELDS = (("targetId", 0), ("fieldId", 0), ("groupId", 0), ("filter", ""), ("requestTime", 0.0),
+                  ("requestMjd", 0.0), ("ra", 0.0), ("decl", 0.0), ("skyAngle", 0.0), ("numExposures", 0),
+                  ("exposureTimes", [0] * MAX_EXPOSURES), ("airmass", 0.0), ("skyBrightness", 0.0),
+                  ("cloud", 0.0), ("seeing", 0.0), ("slewTime", 0.0), ("note", ""),
+                  ("numProposals", 0)) + \
+    _proposal_fields("proposalId", "proposalValue", "proposalNeed", "proposalBonus", "proposalBoost") + \
+    _SKY_FIELDS
+
+_BULK_CLOUD_FIELDS = (("timestamp", 0.0), ("bulkCloud", 0.0))
+
+_SEEING_FIELDS = (("timestamp", 0.0), ("seeing", 0.0))
+
+_NEED_FILTER_SWAP_FIELDS = (("needSwap", False), ("filterToUnmount", ""))
+
+_INTERESTED_PROPOSAL_FIELDS = (("observationId", 0), ("targetId", 0), ("numProposals", 0)) + \
+    _proposal_fields("proposalIds", "proposalValues", "proposalNeeds", "proposalBonuses", "proposalBoosts")
+
+_OBSERVATION_FIELDS = (("observationId", 0), ("targetId", 0), ("fieldId", 0), ("groupId", 0), ("night", 0),
+                       ("observationStartTime", 0.0), ("observationStartMjd", 0.0),
+                       ("observationStartLst", 0.0), ("filter", ""), ("ra", 0.0), ("decl", 0.0),
+                       ("angle", 0.0), ("altitude", 0.0), ("azimuth", 0.0), ("numExposures", 0),
+                       ("exposureTimes", [0] * MAX_EXPOSURES), ("visitTime", 0.0), ("airmass", 0.0),
+                       ("skyBrightness", 0.0), ("cloud", 0.0), ("seeingFwhm500", 0.0),
+                       ("seeingFwhmGeom", 0.0), ("seeingFwhmEff", 0.0), ("fiveSigmaDepth", 0.0),
+                       ("slewTime", 0.0), ("note", ""), ("numProposals", 0)) + \
+    _proposal_fields("proposalIds") + _SKY_FIELDS
+
+_OBSERVATORY_STATE_FIELDS = (("timestamp", 0.0), ("pointingRa", 0.0), ("pointingDec", 0.0),
+                             ("pointingAngle", 0.0), ("pointingAltitude", 0.0), ("pointingAzimuth", 0.0),
+                             ("pointingPa", 0.0), ("pointingRot", 0.0), ("tracking", False),
+                             ("telescopeAltitude", 0.0), ("telescopeAzimuth", 0.0),
+                             ("telescopeRotator", 0.0), ("domeAltitude", 0.0), ("domeAzimuth", 0.0),
+                             ("filterPosition", ""), ("filterMounted", ""), ("filterUnmounted", ""))
+
+class TopicStruct(object):
+    """Hold the information of a Scheduler topic without the SAL.
+
+    The subclasses mirror the attributes of the SALPY_scheduler topic classes used when running
+    without DDS communication. The attributes are slots that start at their default values and
+    array attributes are plain lists of the topic's array length.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self):
+        """Initialize the class.
+        """
+        for name, default in self._fields:
+            setattr(self, name, list(default) if isinstance(default, list) else default)
+
+    def __getstate__(self):
+        return dict((name, getattr(self, name)) for name, _ in self._fields)
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+class TimeHandlerStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_timeHandlerC.
+    """
+    _fields = _TIME_HANDLER_FIELDS
+    __slots__ = tuple(name for name, _ in _TIME_HANDLER_FIELDS)
+
+class TargetStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_logevent_targetC.
+    """
+    _fields = _TARGET_FIELDS
+    __slots__ = tuple(name for name, _ in _TARGET_FIELDS)
+
+class BulkCloudStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_bulkCloudC.
+    """
+    _fields = _BULK_CLOUD_FIELDS
+    __slots__ = tuple(name for name, _ in _BULK_CLOUD_FIELDS)
+
+class SeeingStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_seeingC.
+    """
+    _fields = _SEEING_FIELDS
+    __slots__ = tuple(name for name, _ in _SEEING_FIELDS)
+
+class NeedFilterSwapStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_logevent_needFilterSwapC.
+    """
+    _fields = _NEED_FILTER_SWAP_FIELDS
+    __slots__ = tuple(name for name, _ in _NEED_FILTER_SWAP_FIELDS)
+
+class InterestedProposalStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_interestedProposalC.
+    """
+    _fields = _INTERESTED_PROPOSAL_FIELDS
+    __slots__ = tuple(name for name, _ in _INTERESTED_PROPOSAL_FIELDS)
+
+class ObservationStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_observationC.
+    """
+    _fields = _OBSERVATION_FIELDS
+    __slots__ = tuple(name for name, _ in _OBSERVATION_FIELDS)
+
+class ObservatoryStateStruct(TopicStruct):
+    """Equivalent of SALPY_scheduler.scheduler_observatoryStateC.
+    """
+    _fields = _OBSERVATORY_STATE_FIELDS
+    __slots__ = tuple(name for name, _ in _OBSERVATORY_STATE_FIELDS)
+
+
+"""The topic structures keyed by the topic name minus the scheduler prefix.
+"""
+TOPIC_STRUCTS = {
+    "timeHandler": TimeHandlerStruct,
+    "logevent_target": TargetStruct,
+    "bulkCloud": BulkCloudStruct,
+    "seeing": SeeingStruct,
+    "logevent_needFilterSwap": NeedFilterSwapStruct,
+    "interestedProposal": InterestedProposalStruct,
+    "observation": ObservationStruct,
+    "observatoryState": ObservatoryStateStruct
+}
+
+def create_topic(topic_short_name):
+    """Create the topic structure for running without DDS communication.
+
+    Parameters
+    ----------
+    topic_short_name : str
+        The part of the topic name minus the scheduler prefix.
+
+    Returns
+    -------
+    :class:`.TopicStruct`
+    """
+    return TOPIC_STRUCTS[topic_short_name]()
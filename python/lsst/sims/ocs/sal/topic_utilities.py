@@ -25,7 +25,7 @@ def topic_strdict(topic, float_format="{:.3f}"):
     """
     output = collections.OrderedDict()
     for k, v in inspect.getmembers(topic):
-        if not k.startswith("__"):
+        if not k.startswith("_"):
             try:
                 if v.is_integer():
                     vs = str(v)
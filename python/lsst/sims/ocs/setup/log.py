@@ -5,13 +5,15 @@ import os
 
 from lsst.sims.ocs.utilities import get_hostname
 
-__all__ = ["LoggingLevel", "configure_logging", "generate_logfile_path", "set_log_levels"]
+__all__ = ["LoggingLevel", "configure_file_logging", "configure_logging", "generate_logfile_path",
+           "set_log_levels"]
 
 MAX_CONSOLE = 2
 MIN_FILE = 3
 MAX_FILE = 5
 
 CONSOLE_FORMAT = "%(message)s"
+FILE_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 
 class LoggingLevel(Enum):
     """Handle some extra logging levels.
@@ -63,6 +65,33 @@ def configure_logging(console_detail, file_detail, log_port=logging.handlers.DEF
     sh = logging.handlers.SocketHandler('localhost', log_port)
     logging.getLogger().addHandler(sh)
 
+def configure_file_logging(file_detail, log_file):
+    """Configure logging directly to a file for the application.
+
+    This bypasses the central logger process and is used when many simulations are run from
+    the same parent process.
+
+    Parameters
+    ----------
+    file_detail : int
+        The requested detail level for the file logger.
+    log_file : str
+        The full path of the log file.
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.setLevel(DETAIL_LEVEL[file_detail])
+    logging.captureWarnings(True)
+
+    for level in LoggingLevel:
+        logging.addLevelName(level.value, level.name)
+
+    fh = logging.FileHandler(log_file)
+    fh.setLevel(DETAIL_LEVEL[file_detail])
+    fh.setFormatter(logging.Formatter(FILE_FORMAT))
+    root_logger.addHandler(fh)
+
 def set_log_levels(verbose=0):
     """Set detail levels for console and file logging systems.
 
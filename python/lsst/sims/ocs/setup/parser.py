@@ -2,7 +2,7 @@ import argparse
 
 from lsst.sims.ocs import __version__
 
-__all__ = ["create_parser"]
+__all__ = ["create_parser", "create_sweep_parser"]
 
 def create_parser():
     """Create the argument parser for the main driver script.
@@ -22,6 +22,48 @@ def create_parser():
     parser.add_argument("--frac-duration", dest="frac_duration", type=float, default=-1,
                         help="Temporary flag to set the fractional duration for the survey in units of "
                         "years.")
+    parser.add_argument("--epoch-time", dest="epoch_time", action="store_true",
+                        help="Flag to keep the simulation time as a count since the UNIX epoch instead of "
+                        "a date/time. The timestamps are identical, but cheaper to update and read.")
+    parser.add_argument("--event-kernel", dest="event_kernel", action="store_true",
+                        help="Flag to run the nights as a queue of timestamped events instead of a loop "
+                        "over the visits.")
+    parser.add_argument("--event-kernel-profile", dest="event_kernel_profile", action="store_true",
+                        help="Flag to log the number of events and the time spent handling them.")
+    parser.add_argument("--idle-skip", dest="idle_skip", action="store_true",
+                        help="Flag to skip ahead adaptively when the Scheduler offers no target. The time to "
+                        "the next observing opportunity from the driver is used if available, otherwise the "
+                        "idle delay grows for every consecutive missed target. The skipped intervals are "
+                        "recorded in the IdleHistory table.")
+    parser.add_argument("--idle-skip-max", dest="idle_skip_max", type=float, default=1800.0,
+                        help="The longest skip (seconds) without a driver hint.")
+    parser.add_argument("--idle-skip-backoff", dest="idle_skip_backoff", type=float, default=2.0,
+                        help="The factor growing the skip for every consecutive missed target.")
+    parser.add_argument("--night-boundary-cache", dest="night_boundary_cache", default=None,
+                        help="A directory for caching the precomputed survey night boundaries. The "
+                        "cached tables are shared by simulations with the same site, start date and night "
+                        "boundary. If none, the night boundaries are computed for each simulation.")
+    parser.add_argument("--deferred-conditions", dest="deferred_conditions", action="store_true",
+                        help="Flag to compute the visit cloud, seeing and five sigma depth for all the "
+                        "collected visits before they are written instead of for each visit. Only used "
+                        "when running without DDS communication.")
+    parser.add_argument("--state-handoff", dest="state_handoff", action="store_true",
+                        help="Flag to give the observatory state directly to the driver instead of "
+                        "through the observatory state topic. Only used when running without DDS "
+                        "communication.")
+    parser.add_argument("--model-fallback", dest="model_fallback", action="store_true",
+                        help="Flag to look up unknown observatory attributes on the scheduler observatory "
+                        "model. This is a slow debugging aid.")
+    parser.add_argument("--slew-cache", dest="slew_cache", type=int, default=0,
+                        help="Remember up to this many slew delays calculated by the observatory model. "
+                        "Slews with the same telescope and dome positions and filters, within the "
+                        "resolution, reuse a remembered delay. Zero turns the cache off.")
+    parser.add_argument("--slew-cache-resolution", dest="slew_cache_resolution", type=float, default=1.0e-3,
+                        help="The rounding (degrees) of the telescope and dome positions for the slew "
+                        "cache.")
+    parser.add_argument("--slew-cache-strict", dest="slew_cache_strict", action="store_true",
+                        help="Flag to calculate every slew delay and count the remembered delays that do "
+                        "not match.")
     parser.add_argument("--no-sched", dest="no_scheduler", action="store_true",
                         help="Flag to make program not wait for Scheduler.")
     parser.add_argument("--scheduler-timeout", dest="scheduler_timeout", type=int, default=60,
@@ -43,6 +85,67 @@ def create_parser():
                               "tracking database.")
     sqlite_group.add_argument("-s", "--session-id-start", dest="session_id_start",
                               help="Set a new value for the starting session ID.")
+    sqlite_group.add_argument("--session-id", dest="session_id", type=int, default=None,
+                              help="Reserve a specific session ID for the simulation instead of the next "
+                              "available one. The simulation fails if the session ID is taken.")
+    sqlite_group.add_argument("--db-async-write", dest="db_async_write", action="store_true",
+                              help="Write each night's information to the session database from a "
+                              "background thread.")
+    sqlite_group.add_argument("--db-write-queue-size", dest="db_write_queue_size", type=int, default=2,
+                              help="The number of nights allowed to wait for the background database "
+                              "writer.")
+    sqlite_group.add_argument("--db-durability", dest="db_durability", choices=["safe", "fast"],
+                              default=None, help="Tune the session database for speed. Both settings use "
+                              "write-ahead logging, a larger page cache and in-memory temporary storage. "
+                              "The fast setting also turns off syncing to disk and can corrupt the "
+                              "database if the machine crashes. If none, the SQLite defaults are used.")
+    sqlite_group.add_argument("--db-fast-insert", dest="db_fast_insert", action="store_true",
+                              help="Insert rows into the session database through the raw sqlite3 "
+                              "driver instead of SQLAlchemy.")
+    sqlite_group.add_argument("--db-columnar", dest="db_columnar", action="store_true",
+                              help="Collect each night's information in per-table columns instead of a "
+                              "list of rows.")
+    sqlite_group.add_argument("--output-format", dest="output_format", choices=["sqlite", "parquet"],
+                              default="sqlite", help="The format for the nightly simulation output. With "
+                              "parquet, each table is written to a Parquet file with one row group per "
+                              "night and the SQLite session database only holds the session, "
+                              "configuration, field and proposal information. Requires pyarrow.")
+    sqlite_group.add_argument("--db-deferred-indexes", dest="db_deferred_indexes", action="store_true",
+                              help="Create the session database tables without their secondary indexes "
+                              "and build the indexes at the end of the simulation.")
+    sqlite_group.add_argument("--db-working-path", dest="db_working_path", default=None,
+                              help="Run the session database in memory (:memory:) or in the given "
+                              "directory, like a tmpfs mount, and back it up to the save directory.")
+    sqlite_group.add_argument("--db-backup-interval", dest="db_backup_interval", type=int, default=0,
+                              help="The number of nights between backups of the working session "
+                              "database. The database is always backed up at the end of the simulation.")
+    sqlite_group.add_argument("--db-flush-rows", dest="db_flush_rows", type=int, default=0,
+                              help="Write the collected information once this many rows are collected, "
+                              "even part way through a night.")
+    sqlite_group.add_argument("--db-flush-bytes", dest="db_flush_bytes", type=int, default=0,
+                              help="Write the collected information once its estimated size (bytes) is "
+                              "reached, even part way through a night.")
+    sqlite_group.add_argument("--db-flush-interval", dest="db_flush_interval", type=float, default=0.0,
+                              help="Write the collected information after this much simulated time "
+                              "(seconds), even part way through a night.")
+    sqlite_group.add_argument("--db-flush-nights", dest="db_flush_nights", type=int, default=1,
+                              help="The number of nights to collect before writing the information.")
+    sqlite_group.add_argument("--no-summary-table", dest="summary_table", action="store_false",
+                              help="Keep SummaryAllProps as a view instead of materializing it into an "
+                              "indexed table at the end of the simulation.")
+
+    checkpoint_group_descr = ["This group of arguments controls the checkpointing and resuming of the "
+                              "simulation."]
+    ckpt_grp = parser.add_argument_group("checkpoint", " ".join(checkpoint_group_descr))
+    ckpt_grp.add_argument("--checkpoint-interval", dest="checkpoint_interval", type=int, default=0,
+                          help="Write a checkpoint of the simulation state every N nights. Zero means no "
+                          "checkpoints. Only available when not using DDS comm.")
+    ckpt_grp.add_argument("--checkpoint-dir", dest="checkpoint_dir", help="A directory to save the "
+                          "checkpoint files. If none, the SQLite save directory is used.")
+    ckpt_grp.add_argument("--resume", dest="resume", type=int, help="Resume the simulation with the given "
+                          "session ID from a checkpoint.")
+    ckpt_grp.add_argument("--from-night", dest="from_night", type=int, help="The checkpointed night to "
+                          "resume from. If none, the last checkpoint for the session is used.")
 
     tracking_group_descr = ["This group of arguments controls the tracking of the simulation session."]
     track_grp = parser.add_argument_group("tracking", " ".join(tracking_group_descr))
@@ -63,6 +166,9 @@ def create_parser():
                                "If none, will use default set.")
     conf_grp.add_argument("--config-version", dest="config_version", default='master',
                           help="Name of the branch with configurations for the scheduler. (default=master)")
+    conf_grp.add_argument("--downtime-seed", dest="downtime_seed", type=int, default=None,
+                          help="Set the random seed for generating the unscheduled downtime. If none, "
+                          "the configured behavior is used.")
     conf_grp.add_argument("--save-config", dest="save_config", action="store_true",
                           help="If set, a config_<session Id> directory that will contain the "
                           "saved configuration will be created at the location of --save-config-dir.")
@@ -82,3 +188,33 @@ def create_parser():
                          "more than three flags for long runs as it will generate LOTS of output.")
 
     return parser
+
+def create_sweep_parser():
+    """Create the argument parser for the survey sweep driver script.
+
+    The sweep parser contains all of the main driver script arguments, which act as the base
+    options for every simulation in the sweep.
+    """
+    parser = create_parser()
+    parser.usage = "opsim4-sweep [options]"
+    parser.description = "Run a matrix of Operations Simulator v4 simulations (no DDS comm) across a " \
+                         "local process pool."
+
+    sweep_group_descr = ["This group of arguments controls the matrix of simulations to run. Every "
+                         "combination of the values is run once."]
+    sweep_grp = parser.add_argument_group("sweep", " ".join(sweep_group_descr))
+    sweep_grp.add_argument("--config-paths", dest="config_paths", nargs='+', default=None,
+                           help="A set of configuration override directories. If none, the --config-path "
+                           "value is used.")
+    sweep_grp.add_argument("--frac-durations", dest="frac_durations", nargs='+', type=float, default=None,
+                           help="A set of fractional survey durations. If none, the --frac-duration value "
+                           "is used.")
+    sweep_grp.add_argument("--downtime-seeds", dest="downtime_seeds", nargs='+', type=int, default=None,
+                           help="A set of unscheduled downtime random seeds. If none, the --downtime-seed "
+                           "value is used.")
+    sweep_grp.add_argument("-j", "--processes", dest="processes", type=int, default=None,
+                           help="The number of worker processes. If none, the number of CPUs is used.")
+    sweep_grp.add_argument("--manifest", dest="manifest", default="sweep_manifest.json",
+                           help="The file to write the sweep manifest of session IDs into.")
+
+    return parser
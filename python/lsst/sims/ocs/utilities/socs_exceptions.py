@@ -12,3 +12,8 @@ class SocsDatabaseError(Exception):
     """Used when there are errors writing to the simulation database.
     """
     pass
+
+class CheckpointError(Exception):
+    """Used when a simulation checkpoint cannot be written or restored.
+    """
+    pass
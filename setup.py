@@ -51,7 +51,7 @@ if __name__ == "__main__":
         url='https://github.com/lsst-sims/sims_ocs',
         cmdclass={
         },
-        scripts=['scripts/opsim4'],
+        scripts=['scripts/opsim4', 'scripts/opsim4-sweep', 'scripts/merge_sessions'],
         packages=[
             'lsst',
         ],
@@ -0,0 +1,67 @@
+import array
+import unittest
+
+from sqlalchemy import MetaData
+
+from lsst.sims.ocs.database import ColumnBuffer
+from lsst.sims.ocs.database.tables import create_slew_activities, write_slew_activities
+from lsst.sims.ocs.observatory import SlewActivity
+
+class ColumnBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = create_slew_activities(MetaData())
+        self.buffer = ColumnBuffer(self.table)
+        self.session_id = 1000
+
+    def add_rows(self, num_rows):
+        for i in range(num_rows):
+            activity = SlewActivity(i + 1, "telalt", 2.0 * i, "True", 1)
+            self.buffer.append(write_slew_activities(activity, self.session_id))
+
+    def test_basic_information_after_creation(self):
+        self.assertEqual(len(self.buffer), 0)
+        self.assertListEqual(self.buffer.names, [c.name for c in self.table.columns])
+        self.assertIsInstance(self.buffer.column("slewActivityId"), array.array)
+        self.assertIsInstance(self.buffer.column("activityDelay"), array.array)
+        self.assertIsInstance(self.buffer.column("activity"), list)
+
+    def test_append(self):
+        self.add_rows(3)
+        self.assertEqual(len(self.buffer), 3)
+        self.assertListEqual(list(self.buffer.column("activityDelay")), [0.0, 2.0, 4.0])
+        self.assertListEqual(list(self.buffer.column("Session_sessionId")), [self.session_id] * 3)
+
+    def test_rows_in_column_order(self):
+        self.add_rows(2)
+        rows = list(self.buffer.rows())
+        self.assertEqual(rows[1], (2, self.session_id, "telalt", 2.0, "True", 1))
+
+    def test_append_row(self):
+        self.buffer.append_row((1, self.session_id, "telalt", 2.0, "True", 1))
+        self.assertEqual(len(self.buffer), 1)
+        self.assertEqual(self.buffer.column("activityDelay")[0], 2.0)
+
+    def test_update(self):
+        self.add_rows(3)
+        self.buffer.update("activityDelay", [0, 2], [5.0, 6.0])
+        self.assertEqual(self.buffer.column("activityDelay")[0], 5.0)
+        self.assertEqual(self.buffer.column("activityDelay")[2], 6.0)
+
+    def test_incompatible_value_changes_column_to_list(self):
+        self.buffer.append({"slewActivityId": 1.5})
+        self.assertIsInstance(self.buffer.column("slewActivityId"), list)
+        self.assertEqual(self.buffer.column("slewActivityId")[0], 1.5)
+
+    def test_staged_rows_transposed_in_chunks(self):
+        self.buffer = ColumnBuffer(self.table, chunk_size=2)
+        self.add_rows(3)
+        self.assertEqual(len(self.buffer.staged_rows), 1)
+        self.assertEqual(len(self.buffer), 3)
+        self.assertListEqual(list(self.buffer.column("activityDelay")), [0.0, 2.0, 4.0])
+        self.assertEqual(len(self.buffer.staged_rows), 0)
+
+    def test_clear(self):
+        self.add_rows(2)
+        self.buffer.clear()
+        self.assertEqual(len(self.buffer), 0)
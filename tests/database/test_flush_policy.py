@@ -0,0 +1,48 @@
+import unittest
+
+from lsst.sims.ocs.database.flush_policy import FlushPolicy
+
+class FlushPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.values = {"night": 1, "filter": "r", "seeing": 0.7}
+
+    def test_basic_information_after_creation(self):
+        policy = FlushPolicy()
+        self.assertEqual(policy.rows, 0)
+        self.assertEqual(policy.nights, 1)
+        self.assertFalse(policy.should_write(100.0))
+        self.assertTrue(policy.end_night())
+
+    def test_max_rows(self):
+        policy = FlushPolicy(max_rows=2)
+        policy.add(self.values)
+        self.assertFalse(policy.should_write())
+        policy.add(self.values)
+        self.assertTrue(policy.should_write())
+        policy.reset()
+        self.assertFalse(policy.should_write())
+
+    def test_max_bytes(self):
+        policy = FlushPolicy(max_bytes=30)
+        self.assertEqual(FlushPolicy.estimate_bytes(self.values), 17)
+        policy.add(self.values)
+        self.assertFalse(policy.should_write())
+        policy.add(self.values)
+        self.assertTrue(policy.should_write())
+
+    def test_interval(self):
+        policy = FlushPolicy(interval=3600.0)
+        self.assertFalse(policy.should_write(1000.0))
+        self.assertFalse(policy.should_write(4000.0))
+        self.assertTrue(policy.should_write(4600.0))
+        policy.reset(4600.0)
+        self.assertFalse(policy.should_write(5000.0))
+
+    def test_multiple_nights(self):
+        policy = FlushPolicy(nights=3)
+        self.assertFalse(policy.end_night())
+        self.assertFalse(policy.end_night())
+        self.assertTrue(policy.end_night())
+        policy.reset()
+        self.assertFalse(policy.end_night())
@@ -0,0 +1,46 @@
+import os
+import shutil
+import unittest
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table
+
+from lsst.sims.ocs.database.column_buffer import ColumnBuffer
+from lsst.sims.ocs.database.parquet_writer import ParquetWriter
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+@unittest.skipIf(pq is None, "pyarrow is not available")
+class ParquetWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.output_dir = "parquet_output"
+        metadata = MetaData()
+        self.table = Table("Test", metadata,
+                           Column("testId", Integer, primary_key=True, nullable=False),
+                           Column("value", Float, nullable=False),
+                           Column("name", String(10), nullable=True))
+        self.writer = ParquetWriter(self.output_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_basic_information_after_creation(self):
+        self.assertTrue(os.path.isdir(self.output_dir))
+        self.assertEqual(len(self.writer.writers), 0)
+
+    def test_write_row_groups(self):
+        self.writer.write(self.table, [{"testId": 1, "value": 0.5, "name": "a"},
+                                       {"testId": 2, "value": 1.5, "name": None}])
+        column_buffer = ColumnBuffer(self.table)
+        column_buffer.append({"testId": 3, "value": 2.5, "name": "c"})
+        self.writer.write(self.table, column_buffer)
+        self.writer.close()
+
+        pfile = pq.ParquetFile(os.path.join(self.output_dir, "Test.parquet"))
+        self.assertEqual(pfile.num_row_groups, 2)
+        data = pfile.read().to_pydict()
+        self.assertListEqual(data["testId"], [1, 2, 3])
+        self.assertListEqual(data["name"], ["a", None, "c"])
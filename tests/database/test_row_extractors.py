@@ -0,0 +1,41 @@
+import unittest
+
+from sqlalchemy import MetaData
+
+from lsst.sims.ocs.database.tables import create_field, create_slew_activities, create_target_history
+from lsst.sims.ocs.database.tables import create_row_extractor, RowExtractor
+from lsst.sims.ocs.observatory import SlewActivity
+
+from . import topic_helpers
+
+class RowExtractorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.metadata = MetaData()
+        self.session_id = 1000
+
+    def test_namedtuple_rows(self):
+        table = create_slew_activities(self.metadata)
+        extractor = RowExtractor(table)
+        self.assertListEqual(extractor.columns, [c.name for c in table.columns])
+        row = extractor(SlewActivity(3, "telalt", 2.0, "True", 1), self.session_id)
+        self.assertEqual(row, (3, self.session_id, "telalt", 2.0, "True", 1))
+
+    def test_tuple_rows(self):
+        extractor = create_row_extractor("field", create_field(self.metadata))
+        field = topic_helpers.field_tuple
+        row = extractor(field, self.session_id)
+        self.assertEqual(row[0], field[0])
+        self.assertEqual(row[1], self.session_id)
+        self.assertEqual(row[2:], tuple(field[1:]))
+
+    def test_topic_rows(self):
+        table = create_target_history(self.metadata)
+        extractor = create_row_extractor("target_history", table)
+        target = topic_helpers.target
+        row = dict(zip(extractor.columns, extractor(target, self.session_id)))
+        self.assertEqual(len(row), len(table.c))
+        self.assertEqual(row["Session_sessionId"], self.session_id)
+        self.assertEqual(row["dec"], target.decl)
+        self.assertEqual(row["requestedExpTime"], sum(target.exposureTimes[:target.numExposures]))
+        self.assertEqual(row["cost"], -1)
@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import unittest
+
+from lsst.sims.ocs.database.session_loader import load_session
+from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
+
+class SessionLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session_db = "loader_2000.db"
+        conn = sqlite3.connect(self.session_db)
+        conn.execute("CREATE TABLE ObsHistory (observationId INTEGER NOT NULL, "
+                     "Session_sessionId INTEGER NOT NULL, night INTEGER NOT NULL, "
+                     "filter VARCHAR(1) NOT NULL, seeingFwhmEff FLOAT NOT NULL, "
+                     "PRIMARY KEY (observationId, Session_sessionId))")
+        conn.execute("CREATE TABLE SlewHistory (slewCount INTEGER NOT NULL, "
+                     "Session_sessionId INTEGER NOT NULL, slewTime FLOAT NOT NULL, "
+                     "ObsHistory_observationId INTEGER NOT NULL, PRIMARY KEY (slewCount, Session_sessionId))")
+        conn.executemany("INSERT INTO ObsHistory VALUES (?, ?, ?, ?, ?)",
+                         [(i, 2000, i // 10, "ugrizy"[i % 6], 0.5 + i / 100) for i in range(1, 51)])
+        conn.executemany("INSERT INTO SlewHistory VALUES (?, ?, ?, ?)",
+                         [(i, 2000, 5.0, i) for i in range(1, 51)])
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        os.remove(self.session_db)
+
+    def test_load_all(self):
+        data = load_session(self.session_db)
+        self.assertEqual(data.size, 50)
+        self.assertListEqual(list(data.dtype.names), ["observationId", "Session_sessionId", "night",
+                                                      "filter", "seeingFwhmEff"])
+        self.assertEqual(data["filter"][0], "g")
+
+    def test_load_columns_and_nights(self):
+        data = load_session(self.session_db, columns=["observationId", "night"], nights=(1, 2),
+                            chunk_size=7)
+        self.assertEqual(data.size, 20)
+        self.assertListEqual(list(data.dtype.names), ["observationId", "night"])
+        self.assertEqual(data["night"].min(), 1)
+        self.assertEqual(data["night"].max(), 2)
+
+    def test_load_multiple_tables(self):
+        data = load_session(self.session_db, tables=["ObsHistory", "SlewHistory"],
+                            columns={"SlewHistory": ["slewTime"]}, nights=(0, 0), as_dict=True)
+        self.assertEqual(data["ObsHistory"]["observationId"].size, 9)
+        self.assertEqual(data["SlewHistory"]["slewTime"].size, 9)
+
+    def test_bad_requests(self):
+        with self.assertRaises(SocsDatabaseError):
+            load_session("missing_2000.db")
+        with self.assertRaises(SocsDatabaseError):
+            load_session(self.session_db, tables="Field")
+        with self.assertRaises(SocsDatabaseError):
+            load_session(self.session_db, columns=["moonPhase"])
+
+    def test_load_nights_from_merged_sessions(self):
+        conn = sqlite3.connect(self.session_db)
+        conn.execute("CREATE TABLE SlewActivities (slewActivityId INTEGER NOT NULL, "
+                     "Session_sessionId INTEGER NOT NULL, activityDelay FLOAT NOT NULL, "
+                     "SlewHistory_slewCount INTEGER NOT NULL, "
+                     "PRIMARY KEY (slewActivityId, Session_sessionId))")
+        # A second session reusing the identifiers with its observations on later nights.
+        conn.executemany("INSERT INTO ObsHistory VALUES (?, ?, ?, ?, ?)",
+                         [(i, 2001, 10 + i // 10, "r", 0.7) for i in range(1, 51)])
+        conn.executemany("INSERT INTO SlewHistory VALUES (?, ?, ?, ?)",
+                         [(i, 2001, 6.0, i) for i in range(1, 51)])
+        conn.executemany("INSERT INTO SlewActivities VALUES (?, ?, ?, ?)",
+                         [(i, session_id, 1.0, i) for i in range(1, 51) for session_id in (2000, 2001)])
+        conn.commit()
+        conn.close()
+        data = load_session(self.session_db, tables=["SlewHistory", "SlewActivities"], nights=(0, 0),
+                            as_dict=True)
+        self.assertListEqual(list(data["SlewHistory"]["Session_sessionId"]), [2000] * 9)
+        self.assertListEqual(list(data["SlewActivities"]["Session_sessionId"]), [2000] * 9)
+        data = load_session(self.session_db, tables=["SlewHistory"], nights=(10, 10), as_dict=True)
+        self.assertListEqual(list(data["SlewHistory"]["Session_sessionId"]), [2001] * 9)
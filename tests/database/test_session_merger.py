@@ -0,0 +1,53 @@
+import os
+import sqlite3
+import unittest
+
+from lsst.sims.ocs.database.session_merger import SessionMerger
+from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
+
+class SessionMergerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session_dbs = []
+        for session_id in range(2000, 2003):
+            session_db = "merger_{}.db".format(session_id)
+            conn = sqlite3.connect(session_db)
+            conn.execute("CREATE TABLE Session (sessionId INTEGER PRIMARY KEY)")
+            conn.execute("CREATE TABLE ObsHistory (observationId INTEGER, Session_sessionId INTEGER, "
+                         "night INTEGER, PRIMARY KEY (observationId, Session_sessionId))")
+            conn.execute("CREATE INDEX o_night ON ObsHistory (night)")
+            conn.execute("INSERT INTO Session VALUES (?)", (session_id,))
+            conn.executemany("INSERT INTO ObsHistory VALUES (?, ?, ?)",
+                             [(i, session_id, i // 5) for i in range(20)])
+            conn.commit()
+            conn.close()
+            self.session_dbs.append(session_db)
+        self.output_db = "merger_all.db"
+
+    def tearDown(self):
+        for session_db in self.session_dbs + [self.output_db]:
+            if os.path.exists(session_db):
+                os.remove(session_db)
+
+    def check_output_db(self):
+        conn = sqlite3.connect(self.output_db)
+        result = conn.execute("SELECT count(*), count(DISTINCT Session_sessionId) FROM ObsHistory")
+        self.assertEqual(result.fetchone(), (60, 3))
+        result = conn.execute("SELECT count(*) FROM sqlite_master WHERE name='o_night'")
+        self.assertEqual(result.fetchone()[0], 1)
+        conn.close()
+
+    def test_basic_information_after_creation(self):
+        merger = SessionMerger(self.session_dbs, processes=8)
+        self.assertEqual(merger.processes, 3)
+        with self.assertRaises(SocsDatabaseError):
+            SessionMerger(["missing_2000.db"])
+
+    def test_merge_sqlite(self):
+        SessionMerger(self.session_dbs).merge_sqlite(self.output_db)
+        self.check_output_db()
+
+    def test_merge_sqlite_parallel(self):
+        SessionMerger(self.session_dbs, processes=2).merge_sqlite(self.output_db)
+        self.check_output_db()
+        self.assertFalse(os.path.exists("{}.part0".format(self.output_db)))
@@ -9,8 +9,10 @@ try:
 except ImportError:
     import mock
 
+from lsst.sims.ocs.database.column_buffer import ColumnBuffer
 from lsst.sims.ocs.database.socs_db import SocsDatabase
 from lsst.sims.ocs.database.tables import write_target_history
+from lsst.sims.ocs.utilities.socs_exceptions import SocsDatabaseError
 from . import topic_helpers
 
 class SocsDatabaseSqliteTest(unittest.TestCase):
@@ -26,8 +28,11 @@ class SocsDatabaseSqliteTest(unittest.TestCase):
 
     def tearDown(self):
         session_db_name = "{}_{}.db".format(self.hostname, self.session_id)
-        if os.path.exists(session_db_name):
-            os.remove(session_db_name)
+        # Failed inserts and the WAL files of the fast durability mode are left next to the session database.
+        for filename in (session_db_name, session_db_name + "-wal", session_db_name + "-shm",
+                         "target_history_{}.npz".format(self.session_id)):
+            if os.path.exists(filename):
+                os.remove(filename)
         if os.path.exists(self.db_name):
             os.remove(self.db_name)
 
@@ -107,6 +112,197 @@ class SocsDatabaseSqliteTest(unittest.TestCase):
         self.db.write()
         self.check_db_file_for_target_info()
 
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_async_write_data(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.db.async_write = True
+        self.setup_db("This is my cool test!")
+        self.create_append_data()
+
+        self.db.write()
+        self.assertTrue(self.db.data_empty)
+        self.assertIsNotNone(self.db.writer_thread)
+        self.db.finalize()
+        self.assertIsNone(self.db.writer_thread)
+        self.check_db_file_for_target_info()
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_async_write_error_raised_on_finalize(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.db.async_write = True
+        self.setup_db("This is my cool test!")
+        self.db.write_table("target_history", [write_target_history(topic_helpers.target, self.session_id)])
+        self.create_append_data()
+
+        self.db.write()
+        with self.assertRaises(SocsDatabaseError):
+            self.db.finalize()
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_durability_pragmas(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.db.durability = "fast"
+        self.setup_db("This is my cool test!")
+        conn = self.db.session_engine.connect()
+        self.assertEqual(conn.execute("PRAGMA journal_mode").scalar(), "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").scalar(), 0)
+        self.create_append_data()
+        self.db.write()
+        self.check_db_file_for_target_info()
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_fast_insert_write_data(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.db.fast_insert = True
+        self.setup_db("This is my cool test!")
+        self.create_append_data()
+
+        self.db.write()
+        self.check_db_file_for_target_info()
+        statement, columns = self.db.insert_statements["target_history"]
+        self.assertTrue(statement.startswith("INSERT INTO TargetHistory (targetId, Session_sessionId"))
+        self.assertEqual(len(columns), len(self.db.target_history.c))
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_columnar_write_data(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.db.columnar = True
+        self.db.data_list = self.db._new_data_list()
+        self.setup_db("This is my cool test!")
+        self.create_append_data()
+        self.create_append_data()
+        self.assertIsInstance(self.db.data_list["target_history"], ColumnBuffer)
+        self.assertEqual(len(self.db.data_list["target_history"]), 2)
+        self.db.clear_data()
+        self.create_append_data()
+
+        self.db.write()
+        self.check_db_file_for_target_info()
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_materialize_summary_all_props(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.setup_db("This is my cool test!")
+        self.db.materialize_summary_all_props()
+
+        session_db_name = "{}_{}.db".format(self.hostname, self.session_id)
+        engine = create_engine("sqlite:///{}".format(session_db_name))
+        conn = engine.connect()
+        result = conn.execute("SELECT type FROM sqlite_master WHERE name='SummaryAllProps'")
+        self.assertEqual(result.fetchone()[0], "table")
+        result = conn.execute("SELECT count(*) FROM sqlite_master WHERE type='index' AND "
+                              "tbl_name='SummaryAllProps'")
+        self.assertEqual(result.fetchone()[0], 4)
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_materialize_summary_all_props_after_resume(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.setup_db("This is my cool test!")
+        # The finalize of the crashed run materializes the view.
+        self.db.materialize_summary_all_props()
+
+        db = SocsDatabase()
+        db.resume_session(self.session_id)
+        db.truncate_session({"observation_history": ("observationId", 0)})
+        conn = db._get_conn()
+        type_query = "SELECT type FROM sqlite_master WHERE name='SummaryAllProps'"
+        self.assertEqual(conn.execute(type_query).fetchone()[0], "view")
+        db.materialize_summary_all_props()
+        self.assertEqual(conn.execute(type_query).fetchone()[0], "table")
+        db.materialize_summary_all_props()
+        result = conn.execute("SELECT count(*) FROM sqlite_master WHERE type='index' AND "
+                              "tbl_name='SummaryAllProps'")
+        self.assertEqual(result.fetchone()[0], 4)
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_deferred_indexes(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.db.deferred_indexes = True
+        self.setup_db("This is my cool test!")
+
+        session_db_name = "{}_{}.db".format(self.hostname, self.session_id)
+        engine = create_engine("sqlite:///{}".format(session_db_name))
+        conn = engine.connect()
+        index_query = "SELECT count(*) FROM sqlite_master WHERE type='index' AND sql IS NOT NULL"
+        self.assertEqual(conn.execute(index_query).fetchone()[0], 0)
+        self.db.create_indexes()
+        self.assertEqual(conn.execute(index_query).fetchone()[0], len(self.db._get_indexes()))
+
+        # A resumed run creates the indexes again at its finalize.
+        db = SocsDatabase(deferred_indexes=True)
+        db.resume_session(self.session_id)
+        db.create_indexes()
+        self.assertEqual(conn.execute(index_query).fetchone()[0], len(self.db._get_indexes()))
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_in_memory_write_data(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.db.working_path = ":memory:"
+        self.db.backup_interval = 2
+        self.setup_db("This is my cool test!")
+        self.assertTrue(os.path.exists("{}_{}.db".format(self.hostname, self.session_id)))
+        self.assertFalse(self.db.should_backup(1))
+        self.assertTrue(self.db.should_backup(2))
+        self.create_append_data()
+        self.db.write()
+        self.db.backup()
+        self.check_db_file_for_target_info()
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_reserve_session_id(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.setup_db("This is my cool test!")
+        os.remove("{}_{}.db".format(self.hostname, self.session_id))
+        self.session_id = self.db.new_session("This is my reserved test!", session_id=2050)
+        self.assertEqual(self.session_id, 2050)
+        with self.assertRaises(SocsDatabaseError):
+            self.db.new_session("This is my reserved test again!", session_id=2050)
+        self.assertEqual(self.db.new_session("This is my next test!"), 2051)
+        os.remove("{}_2051.db".format(self.hostname))
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_existing_session_database_not_reserved(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.setup_db("This is my cool test!")
+        existing_db = "{}_{}.db".format(self.hostname, self.session_id + 1)
+        open(existing_db, "w").close()
+        self.addCleanup(os.remove, existing_db)
+        with self.assertRaises(SocsDatabaseError):
+            self.db.new_session("This is my blocked test!")
+        engine = create_engine("sqlite:///{}".format(self.db_name))
+        result = engine.execute("SELECT max(sessionId) FROM Session")
+        self.assertEqual(result.scalar(), self.session_id)
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_update_rows(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.setup_db("This is my cool test!")
+        self.assertEqual(self.db.row_count("target_history"), 0)
+        self.create_append_data()
+        self.create_append_data()
+        self.assertEqual(self.db.row_count("target_history"), 2)
+        self.db.update_rows("target_history", [1], {"airmass": [1.5]})
+        columns = [column.name for column in self.db.target_history.columns]
+        rows = self.db.data_list["target_history"]
+        self.assertEqual(rows[1][columns.index("airmass")], 1.5)
+        self.assertEqual(rows[0], self.db.row_extractors["target_history"](topic_helpers.target,
+                                                                           self.session_id))
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_flush_callbacks(self, mock_get_hostname):
+        mock_get_hostname.return_value = self.hostname
+        self.setup_db("This is my cool test!")
+        callback = mock.Mock()
+        self.db.flush_callbacks.append(callback)
+        self.create_append_data()
+        self.db.flush()
+        self.assertEqual(callback.call_count, 1)
+        self.check_db_file_for_target_info()
+
+    def test_bad_durability(self):
+        with self.assertRaises(SocsDatabaseError):
+            SocsDatabase(durability="reckless")
+
     @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
     def test_write_table_data(self, mock_get_hostname):
         mock_get_hostname.return_value = self.hostname
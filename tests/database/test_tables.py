@@ -74,7 +74,7 @@ class TablesTest(unittest.TestCase):
     def test_create_observation_history_table(self):
         obs_hist = tbls.create_observation_history(self.metadata)
         self.assertEqual(len(obs_hist.c), 36)
-        self.assertEqual(len(obs_hist.indexes), 4)
+        self.assertEqual(len(obs_hist.indexes), 5)
 
     def test_write_observation_history_table(self):
         obs_topic = topic_helpers.observation_topic
@@ -242,6 +242,21 @@ class TablesTest(unittest.TestCase):
         self.assertEqual(result['duration'], usd[1])
         self.assertEqual(result['activity'], usd[2])
 
+    def test_create_idle_history_table(self):
+        idle_history = tbls.create_idle_history(self.metadata)
+        self.assertEqual(len(idle_history.c), 6)
+        self.assertEqual(len(idle_history.indexes), 1)
+
+    def test_write_idle_history_table(self):
+        idle = topic_helpers.idle_history
+        result = tbls.write_idle_history(idle, 1000)
+        idle_history = tbls.create_idle_history(self.metadata)
+        self.check_ordered_dict_to_table(result, idle_history)
+        self.assertEqual(result['idleHistoryId'], idle.idleHistoryId)
+        self.assertEqual(result['Session_sessionId'], 1000)
+        self.assertEqual(result['duration'], idle.duration)
+        self.assertEqual(result['source'], idle.source)
+
     def test_create_proposal_table(self):
         props = tbls.create_proposal(self.metadata)
         self.assertEqual(len(props.c), 4)
@@ -320,6 +335,21 @@ class TablesTest(unittest.TestCase):
         summary = tbls.create_summary_all_props(self.metadata, oh, sh, sfs, p, ph, f)
         self.assertEqual(len(summary.c), 36)
 
+    def test_summary_all_props_materialized_table(self):
+        oh = tbls.create_observation_history(self.metadata)
+        sh = tbls.create_slew_history(self.metadata)
+        sfs = tbls.create_slew_final_state(self.metadata)
+        ph = tbls.create_observation_proposal_history(self.metadata)
+        p = tbls.create_proposal(self.metadata)
+        f = tbls.create_field(self.metadata)
+        selectable = tbls.summary_all_props_select(oh, sh, sfs, p, ph, f)
+        summary, indexes = tbls.create_summary_all_props_table(MetaData(), selectable)
+        self.assertEqual(len(summary.c), len(selectable.c))
+        self.assertEqual(len(summary.indexes), 0)
+        self.assertEqual(len(indexes), 4)
+        for index in indexes:
+            self.assertIs(index.table, summary)
+
     def test_create_proposal_field_table(self):
         fields = tbls.create_proposal_field(self.metadata)
         self.assertEqual(len(fields.c), 4)
@@ -128,4 +128,7 @@ target_prop_hist = lsst.sims.ocs.kernel.TargetProposalHistory(propHistId=1, Prop
 prop_field_info = lsst.sims.ocs.kernel.ProposalFieldInfo(propFieldId=1, Proposal_propId=4,
                                                          Field_fieldId=1545)
 
+idle_history = lsst.sims.ocs.kernel.IdleHistory(idleHistoryId=3, night=12, startTime=1641081600.0,
+                                                duration=480.0, source="backoff")
+
 config_tuple = (10, "config/test/a", "1.0")
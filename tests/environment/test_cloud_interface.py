@@ -1,7 +1,12 @@
 import os
 import sqlite3
 import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 
+import numpy
 import SALPY_scheduler
 
 from lsst.utils import getPackageDir
@@ -56,6 +61,13 @@ class TestCloudInterface(unittest.TestCase):
         self.assertEqual(cloud_topic.timestamp, tstamp)
         self.assertEqual(cloud_topic.cloud, 0.0)
 
+    def test_get_cloud_array(self):
+        self.cloud.cloud_model = mock.Mock()
+        self.cloud.cloud_model.get_cloud.side_effect = lambda delta_time: delta_time / 100.0
+        cloud = self.cloud.get_cloud_array(numpy.array([100.0, 300.0]))
+        self.assertListEqual(cloud.tolist(), [1.0, 3.0])
+        self.assertEqual(self.cloud.cloud_model.get_cloud.call_count, 2)
+
 """
 class TestCloudModel(unittest.TestCase):
 
@@ -6,6 +6,7 @@ try:
 except ImportError:
     import mock
 
+import numpy
 import SALPY_scheduler
 
 import lsst.utils.tests
@@ -64,6 +65,17 @@ class TestSeeingInterface(unittest.TestCase):
         self.assertEqual(seeing_topic.timestamp, tstamp + 40 * 60)
         self.assertEqual(seeing_topic.seeing, 0.727564990520477)
 
+    def test_calculate_seeing_array(self):
+        self.seeing.seeingSim = mock.Mock()
+        self.seeing.seeingSim.get_seeing_singlefilter.side_effect = \
+            lambda delta_time, filter_name, airmass: (0.7, 0.8 * airmass, 0.9 * airmass)
+        fwhm_500, fwhm_geom, fwhm_eff = self.seeing.calculate_seeing_array(numpy.array([900.0, 1800.0]),
+                                                                           "g", numpy.array([1.0, 2.0]))
+        self.assertListEqual(fwhm_500.tolist(), [0.7, 0.7])
+        self.assertListEqual(fwhm_geom.tolist(), [0.8, 1.6])
+        self.assertListEqual(fwhm_eff.tolist(), [0.9, 1.8])
+        self.assertEqual(self.seeing.seeingSim.get_seeing_singlefilter.call_count, 2)
+
 """
 class TestSeeingModel(unittest.TestCase):
 
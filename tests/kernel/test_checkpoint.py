@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from lsst.sims.ocs.kernel.checkpoint import CheckpointHandler
+from lsst.sims.ocs.utilities.socs_exceptions import CheckpointError
+
+class CheckpointHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.save_path = tempfile.mkdtemp()
+        patcher1 = mock.patch("lsst.sims.ocs.kernel.checkpoint.get_hostname")
+        self.addCleanup(patcher1.stop)
+        self.mock_get_hostname = patcher1.start()
+        self.mock_get_hostname.return_value = "tester"
+        self.ch = CheckpointHandler(self.save_path, 10)
+
+    def tearDown(self):
+        shutil.rmtree(self.save_path)
+
+    def test_basic_information_after_creation(self):
+        self.assertEqual(self.ch.save_path, self.save_path)
+        self.assertEqual(self.ch.interval, 10)
+
+    def test_filename(self):
+        self.assertEqual(self.ch.filename(2000, 30),
+                         os.path.join(self.save_path, "tester_2000_checkpoint_30.pkl"))
+
+    def test_should_write(self):
+        self.assertTrue(self.ch.should_write(20))
+        self.assertFalse(self.ch.should_write(21))
+        self.assertFalse(CheckpointHandler(self.save_path).should_write(20))
+
+    def test_write_and_read(self):
+        state = {"night": 10, "observation_proposals_counted": 45}
+        ckpt_file = self.ch.write(2000, 10, state)
+        self.assertTrue(os.path.exists(ckpt_file))
+        self.assertDictEqual(self.ch.read(2000, 10), state)
+
+    def test_write_unpicklable_state(self):
+        self.assertIsNone(self.ch.write(2000, 10, {"driver": lambda: None}))
+        self.assertListEqual(os.listdir(self.save_path), [])
+
+    def test_read_missing_checkpoint(self):
+        with self.assertRaises(CheckpointError):
+            self.ch.read(2000, 10)
+
+    def test_latest_night(self):
+        for night in (10, 20, 30):
+            self.ch.write(2000, night, {"night": night})
+        self.ch.write(2001, 40, {"night": 40})
+        self.assertEqual(self.ch.latest_night(2000), 30)
+        with self.assertRaises(CheckpointError):
+            self.ch.latest_night(2002)
@@ -0,0 +1,53 @@
+import numpy
+import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from lsst.sims.ocs.kernel.deferred_conditions import DeferredConditions
+
+class DeferredConditionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.seeing_interface = mock.Mock()
+        self.seeing_interface.calculate_seeing_array.side_effect = \
+            lambda times, filter_name, airmasses: (airmasses * 0.5, airmasses * 0.6, airmasses * 0.7)
+        self.cloud_interface = mock.Mock()
+        self.cloud_interface.get_cloud_array.side_effect = lambda times: numpy.zeros(len(times))
+        self.db = mock.Mock()
+        self.dc = DeferredConditions(self.seeing_interface, self.cloud_interface, self.db)
+
+    def add_visits(self):
+        self.dc.add(0, 100.0, "r", 1.0, 21.0, 30.0)
+        self.dc.add(1, 200.0, "g", 1.2, 22.0, 30.0)
+        self.dc.add(2, 300.0, "r", 1.4, 20.5, 30.0)
+
+    def test_basic_information_after_creation(self):
+        self.assertEqual(len(self.dc), 0)
+
+    @mock.patch("lsst.sims.ocs.kernel.deferred_conditions.m5_flat_sed")
+    def test_compute(self, mock_m5_flat_sed):
+        mock_m5_flat_sed.side_effect = lambda filter_name, sky, fwhm_eff, exp_time, airmass: sky + 2.0
+        self.add_visits()
+        row_indexes, values = self.dc.compute()
+        self.assertListEqual(row_indexes, [0, 1, 2])
+        self.assertEqual(self.seeing_interface.calculate_seeing_array.call_count, 2)
+        self.assertEqual(mock_m5_flat_sed.call_count, 2)
+        numpy.testing.assert_array_almost_equal(values["seeingFwhmEff"], [0.7, 0.84, 0.98])
+        numpy.testing.assert_array_almost_equal(values["fiveSigmaDepth"], [23.0, 24.0, 22.5])
+        numpy.testing.assert_array_equal(values["cloud"], [0.0, 0.0, 0.0])
+
+    @mock.patch("lsst.sims.ocs.kernel.deferred_conditions.m5_flat_sed")
+    def test_apply(self, mock_m5_flat_sed):
+        mock_m5_flat_sed.side_effect = lambda filter_name, sky, fwhm_eff, exp_time, airmass: sky
+        self.add_visits()
+        self.dc.apply()
+        self.assertEqual(self.db.update_rows.call_count, 1)
+        self.assertEqual(self.db.update_rows.call_args[0][0], "observation_history")
+        self.assertListEqual(self.db.update_rows.call_args[0][1], [0, 1, 2])
+        self.assertEqual(len(self.dc), 0)
+
+    def test_apply_without_visits(self):
+        self.dc.apply()
+        self.assertEqual(self.db.update_rows.call_count, 0)
@@ -0,0 +1,75 @@
+import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from lsst.sims.ocs.kernel.event_queue import Event, EventQueue, EventType
+from lsst.sims.ocs.kernel.time_handler import TimeHandler
+
+class EventQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.th = TimeHandler("2022-10-01")
+        self.start = self.th.current_timestamp
+        self.eq = EventQueue()
+
+    def test_basic_information_after_creation(self):
+        self.assertEqual(len(self.eq), 0)
+        self.assertFalse(self.eq.profile)
+
+    def test_events_ordered_by_time_then_push_order(self):
+        self.eq.push(self.start + 10.0, EventType.NIGHT_END, night=1)
+        self.eq.push(self.start, EventType.VISIT, night=1)
+        self.eq.push(self.start, EventType.DAY_START, night=1)
+        self.assertEqual(len(self.eq), 3)
+        self.assertEqual(self.eq.pop().event_type, EventType.VISIT)
+        self.assertEqual(self.eq.pop().event_type, EventType.DAY_START)
+        self.assertEqual(self.eq.pop().event_type, EventType.NIGHT_END)
+
+    def test_run_jumps_time_forward_only(self):
+        timestamps = []
+        self.eq.register(EventType.VISIT, lambda event: timestamps.append(self.th.current_timestamp))
+        self.eq.push(self.start + 3600.0, EventType.VISIT, night=1)
+        self.eq.push(self.start + 7200.0, EventType.VISIT, night=1)
+        self.eq.run(self.th)
+        self.assertListEqual(timestamps, [self.start + 3600.0, self.start + 7200.0])
+        self.eq.push(self.start, EventType.VISIT, night=1)
+        self.eq.run(self.th)
+        self.assertEqual(timestamps[-1], self.start + 7200.0)
+
+    def test_handlers_schedule_events(self):
+        handler = mock.Mock()
+
+        def night_start(event):
+            self.eq.push(self.th.current_timestamp + 30.0, EventType.VISIT, night=event.night, count=1)
+
+        def visit(event):
+            handler(event)
+            if event.data["count"] < 3:
+                self.eq.push(self.th.current_timestamp + 30.0, EventType.VISIT, night=event.night,
+                             count=event.data["count"] + 1)
+
+        self.eq.register(EventType.NIGHT_START, night_start)
+        self.eq.register(EventType.VISIT, visit)
+        self.eq.push(self.start, EventType.NIGHT_START, night=1)
+        self.eq.run(self.th)
+        self.assertEqual(handler.call_count, 3)
+        self.assertEqual(self.th.current_timestamp, self.start + 90.0)
+        self.assertEqual(len(self.eq), 0)
+
+    def test_listeners_and_profile(self):
+        listener = mock.Mock()
+        eq = EventQueue(profile=True)
+        eq.add_listener(listener)
+        eq.register("plugin", mock.Mock())
+        eq.push(self.start, "plugin")
+        eq.push(self.start, EventType.VISIT)
+        eq.run(self.th)
+        self.assertEqual(listener.call_count, 2)
+        self.assertEqual(eq.counts["plugin"], 1)
+        self.assertEqual(eq.counts[EventType.VISIT], 1)
+
+    def test_event_repr(self):
+        event = Event(1.0, EventType.VISIT, night=2)
+        self.assertEqual(repr(event), "Event(1.000000, EventType.VISIT, night=2)")
@@ -0,0 +1,38 @@
+import unittest
+
+from lsst.sims.ocs.kernel.idle_skipper import IdleHistory, IdleSkipper
+
+class IdleSkipperTest(unittest.TestCase):
+
+    def setUp(self):
+        self.skipper = IdleSkipper(10.0, max_delay=100.0, backoff=2.0)
+
+    def test_basic_information_after_creation(self):
+        self.assertEqual(self.skipper.idle_delay, 10.0)
+        self.assertEqual(self.skipper.max_delay, 100.0)
+        self.assertEqual(self.skipper.consecutive, 0)
+        self.assertEqual(self.skipper.skips, 0)
+
+    def test_backoff(self):
+        delays = [self.skipper.skip(1, 1000.0).duration for i in range(6)]
+        self.assertListEqual(delays, [10.0, 20.0, 40.0, 80.0, 100.0, 100.0])
+        self.skipper.reset()
+        self.assertEqual(self.skipper.skip(1, 1000.0).duration, 10.0)
+        self.assertEqual(self.skipper.skips, 7)
+
+    def test_hint(self):
+        idle = self.skipper.skip(2, 1000.0, hint=600.0)
+        self.assertEqual(idle, IdleHistory(1, 2, 1000.0, 600.0, "hint"))
+        self.assertEqual(self.skipper.skip(2, 1600.0, hint=1.0).duration, 10.0)
+        self.assertEqual(self.skipper.skip(2, 1610.0, hint=0.0).source, "backoff")
+
+    def test_end_of_night(self):
+        self.assertEqual(self.skipper.skip(1, 1000.0, hint=600.0, remaining=200.0).duration, 200.0)
+        self.assertEqual(self.skipper.skip(1, 1000.0, hint=600.0, remaining=5.0).duration, 10.0)
+
+    def test_get_and_set_state(self):
+        for i in range(3):
+            self.skipper.skip(1, 1000.0)
+        skipper = IdleSkipper(10.0, max_delay=100.0, backoff=2.0)
+        skipper.set_state(self.skipper.get_state())
+        self.assertEqual(skipper.skip(1, 1000.0), self.skipper.skip(1, 1000.0))
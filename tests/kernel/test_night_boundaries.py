@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from lsst.sims.ocs.kernel.night_boundaries import NightBoundaries
+
+SECONDS_IN_DAY = 86400.0
+
+def night_boundaries(night_boundary):
+    """Return boundaries one day apart based on the last update time.
+    """
+    timestamp = night_boundaries.timestamp
+    day = timestamp // SECONDS_IN_DAY
+    return (day * SECONDS_IN_DAY + 80000.0, (day + 1) * SECONDS_IN_DAY + 30000.0)
+
+class NightBoundariesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.sky_model = mock.Mock()
+        self.sky_model.update.side_effect = lambda timestamp: setattr(night_boundaries, "timestamp",
+                                                                      timestamp)
+        self.sky_model.get_night_boundaries.side_effect = night_boundaries
+        self.obs_site = mock.Mock(latitude_rad=-0.5, longitude_rad=-1.2, height=2650.0)
+        self.start_timestamp = 1664582400.0
+        self.nb = NightBoundaries(self.sky_model, -12.0, self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_basic_information_after_creation(self):
+        self.assertEqual(self.nb.night_boundary, -12.0)
+        self.assertEqual(len(self.nb), 0)
+        self.assertIsNone(self.nb.get(1, self.start_timestamp))
+
+    def test_compute(self):
+        self.nb.compute(self.start_timestamp, 3)
+        self.assertEqual(len(self.nb), 3)
+        self.assertEqual(self.sky_model.get_night_boundaries.call_count, 3)
+        self.assertEqual(self.nb.get(1, self.start_timestamp),
+                         (self.start_timestamp + 80000.0, self.start_timestamp + 116400.0))
+        self.assertEqual(self.nb.get(2, self.start_timestamp + 116460.0),
+                         (self.start_timestamp + 166400.0, self.start_timestamp + 202800.0))
+
+    def test_get_outside_table(self):
+        self.nb.compute(self.start_timestamp, 2)
+        self.assertIsNone(self.nb.get(3, self.start_timestamp + 3 * SECONDS_IN_DAY))
+        self.assertIsNone(self.nb.get(2, self.start_timestamp))
+        self.assertIsNone(self.nb.get(1, self.start_timestamp + 90000.0))
+
+    def test_cached_table(self):
+        self.nb.initialize(self.obs_site, "2022-10-01", self.start_timestamp, 5)
+        key = self.nb.cache_key(self.obs_site, "2022-10-01")
+        self.assertTrue(os.path.exists(self.nb.cache_file(key)))
+        self.assertEqual(self.sky_model.get_night_boundaries.call_count, 5)
+
+        nb = NightBoundaries(self.sky_model, -12.0, self.cache_dir)
+        nb.initialize(self.obs_site, "2022-10-01", self.start_timestamp, 3)
+        self.assertEqual(self.sky_model.get_night_boundaries.call_count, 5)
+        self.assertEqual(nb.get(2, self.start_timestamp + 116460.0),
+                         self.nb.get(2, self.start_timestamp + 116460.0))
+
+        nb = NightBoundaries(self.sky_model, -18.0, self.cache_dir)
+        self.assertNotEqual(nb.cache_key(self.obs_site, "2022-10-01"), key)
@@ -1,6 +1,11 @@
 from __future__ import division
+from builtins import object
 from builtins import range
+import argparse
 from datetime import datetime
+import os
+import shutil
+import tempfile
 import unittest
 
 try:
@@ -9,7 +14,9 @@ except ImportError:
     import mock
 
 from lsst.ts.schedulerConfig.sim_config import SimulationConfig
+from lsst.sims.ocs.kernel.event_queue import Event, EventType
 from lsst.sims.ocs.kernel.simulator import Simulator
+from lsst.sims.ocs.kernel.time_handler import TimeHandler
 import SALPY_scheduler
 
 from tests.database.topic_helpers import exposure_coll1, exposure_coll2, exposure_coll3, exposure_coll4
@@ -17,6 +24,30 @@ from tests.database.topic_helpers import slew_activity_coll
 from tests.helpers import CONFIG_COMM_PUT_CALLS, NUM_GEN_PROPS, NUM_SEQ_PROPS
 from tests.helpers import MOON_SUN_INFO, SKY_BRIGHTNESS, SKY_BRIGHTNESS_PRE_HEADER, TARGET_INFO
 
+class CheckpointDriver(object):
+    """Picklable stand-in for the scheduler driver.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.targets = []
+
+class StatefulCheckpointDriver(object):
+    """Stand-in for a scheduler driver with a state hook that cannot be pickled itself.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.targets = []
+        self.callback = lambda: None
+
+    def get_state(self):
+        return {"time": self.time, "targets": list(self.targets)}
+
+    def set_state(self, state):
+        self.time = state["time"]
+        self.targets = list(state["targets"])
+
 class SimulatorTest(unittest.TestCase):
 
     def setUp(self):
@@ -35,6 +66,8 @@ class SimulatorTest(unittest.TestCase):
         patcher4 = mock.patch("lsst.sims.ocs.kernel.sequencer.AstronomicalSkyModel", spec=True)
         self.addCleanup(patcher4.stop)
         self.mock_astro_sky = patcher4.start()
+        self.mock_astro_sky.return_value.get_night_boundaries.return_value = \
+            (self.starting_timestamp, self.starting_timestamp + 360.0)
 
         import collections
 
@@ -44,6 +77,22 @@ class SimulatorTest(unittest.TestCase):
         self.options.no_scheduler = True
         self.options.scheduler_version = "v0.8"
         self.options.scheduler_timeout = 60.0
+        self.options.downtime_seed = None
+        self.options.checkpoint_dir = None
+        self.options.checkpoint_interval = 0
+        self.options.sqlite_save_dir = None
+        self.options.resume = None
+        self.options.from_night = None
+        self.options.summary_table = True
+        self.options.deferred_conditions = False
+        self.options.epoch_time = False
+        self.options.night_boundary_cache = None
+        self.options.event_kernel = False
+        self.options.event_kernel_profile = False
+        self.options.idle_skip = False
+        self.options.state_handoff = False
+        self.options.model_fallback = False
+        self.options.slew_cache = 0
 
         self.configuration = SimulationConfig()
         self.configuration.load_proposals()
@@ -181,10 +230,9 @@ class SimulatorTest(unittest.TestCase):
         self.assertEqual(mock_ss.getNextSample_filterSwap.call_count, 1)
         self.assertEqual(self.sim.seq.targets_received, self.num_visits)
         self.assertEqual(self.sim.seq.observations_made, self.num_visits)
-        self.assertEqual(self.mock_socs_db.clear_data.call_count, self.num_nights)
         self.assertEqual(self.mock_socs_db.append_data.call_count,
                          self.num_visits * DATABASE_APPEND_DATA_CALLS)
-        self.assertEqual(self.mock_socs_db.write.call_count, self.num_nights)
+        self.assertEqual(self.mock_socs_db.end_night.call_count, self.num_nights)
 
     @mock.patch("SALPY_scheduler.SAL_scheduler")
     @mock.patch("lsst.sims.ocs.sal.sal_manager.SalManager.put")
@@ -255,3 +303,142 @@ class SimulatorTest(unittest.TestCase):
         self.assertEqual(self.sim.dh.get_downtime.call_count, self.num_nights)
         self.assertEqual(mock_ss.getNextSample_target.call_count, 0)
         self.assertEqual(self.sim.seq.start_day.call_count, 1)
+
+class SimulatorCheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.save_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.save_path)
+        patcher1 = mock.patch("lsst.sims.ocs.kernel.simulator.SchedulerConfig")
+        self.addCleanup(patcher1.stop)
+        patcher1.start()
+        patcher2 = mock.patch("lsst.sims.ocs.kernel.checkpoint.get_hostname")
+        self.addCleanup(patcher2.stop)
+        patcher2.start().return_value = "tester"
+
+        self.options = argparse.Namespace(config_path=None, frac_duration=0.5, downtime_seed=None,
+                                          no_scheduler=True, scheduler_timeout=60.0,
+                                          checkpoint_dir=self.save_path, checkpoint_interval=1,
+                                          sqlite_save_dir=None, resume=None, from_night=None,
+                                          event_kernel_profile=False)
+        self.db = mock.Mock(session_id=1001, data_empty=True)
+
+    def create_simulator(self, driver_class=CheckpointDriver):
+        sim = Simulator(self.options, self.db, driver=driver_class())
+        sim.time_handler = TimeHandler("2022-10-01")
+        sim.seq = mock.Mock()
+        sim.seq.get_state.return_value = {"targets_received": 10, "targets_missed": 1,
+                                          "observatory_model": {}}
+        obs = sim.seq.observatory_model
+        obs.observations_made = 8
+        obs.slew_count = 9
+        obs.slew_activities_done = 40
+        obs.exposures_made = 16
+        sim.dh = mock.Mock()
+        sim.dh.get_state.return_value = {"downtime_days": [3, 4]}
+        return sim
+
+    def test_save_and_restore(self):
+        sim = self.create_simulator()
+        sim.time_handler.update_time(2, "days")
+        sim.observation_proposals_counted = 12
+        sim.target_proposals_counted = 20
+        sim.driver.time = sim.time_handler.current_timestamp
+        sim.driver.targets.append(5)
+        sim.write_checkpoint(2)
+
+        restored = self.create_simulator()
+        restored.restore_checkpoint(2)
+        self.assertEqual(restored.time_handler.current_timestamp, sim.time_handler.current_timestamp)
+        self.assertEqual(restored.observation_proposals_counted, 12)
+        self.assertEqual(restored.target_proposals_counted, 20)
+        restored.seq.set_state.assert_called_once_with(sim.seq.get_state.return_value)
+        restored.dh.set_state.assert_called_once_with(sim.dh.get_state.return_value)
+        self.assertIsNot(restored.driver, sim.driver)
+        self.assertIsInstance(restored.driver, CheckpointDriver)
+        self.assertEqual(restored.driver.time, sim.driver.time)
+        self.assertListEqual(restored.driver.targets, [5])
+        limits = self.db.truncate_session.call_args[0][0]
+        self.assertEqual(limits["observation_history"], ("observationId", 8))
+        self.assertEqual(limits["observation_proposal_history"], ("propHistId", 11))
+
+    def test_save_and_restore_driver_state(self):
+        sim = self.create_simulator(StatefulCheckpointDriver)
+        sim.driver.time = 100.0
+        sim.driver.targets.append(5)
+        sim.write_checkpoint(2)
+
+        restored = self.create_simulator(StatefulCheckpointDriver)
+        driver = restored.driver
+        with mock.patch.object(restored, "configure_driver") as mock_configure_driver:
+            restored.restore_checkpoint(2)
+        self.assertTrue(mock_configure_driver.called)
+        self.assertIs(restored.driver, driver)
+        self.assertEqual(restored.driver.time, 100.0)
+        self.assertListEqual(restored.driver.targets, [5])
+
+    def test_unpicklable_driver_skips_checkpoint(self):
+        sim = self.create_simulator()
+        sim.driver.callback = lambda: None
+        sim.write_checkpoint(2)
+        self.assertListEqual(os.listdir(self.save_path), [])
+
+class SimulatorEventKernelTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher1 = mock.patch("lsst.sims.ocs.kernel.simulator.SchedulerConfig")
+        self.addCleanup(patcher1.stop)
+        patcher1.start()
+
+        options = argparse.Namespace(config_path=None, frac_duration=0.5, downtime_seed=None,
+                                     no_scheduler=True, scheduler_timeout=60.0, checkpoint_dir=None,
+                                     checkpoint_interval=0, sqlite_save_dir=None, resume=None,
+                                     from_night=None, event_kernel_profile=False)
+        self.sim = Simulator(options, mock.Mock(), driver=mock.Mock())
+        self.sim.time_handler = TimeHandler("2022-10-01")
+        self.sim.open_night = mock.Mock()
+        self.start = self.sim.time_handler.current_timestamp
+        self.sim.end_of_night = self.start + 200.5
+        self.night_ends = []
+        self.sim.event_queue.register(EventType.NIGHT_END, self.record_night_end)
+        self.visits = []
+
+    def record_night_end(self, event):
+        self.night_ends.append(self.sim.time_handler.current_timestamp)
+
+    def observe_visit(self, night, forward_idle=True):
+        # Every other visit finds no target and idles.
+        self.visits.append(self.sim.time_handler.current_timestamp)
+        if len(self.visits) % 2:
+            self.sim.time_handler.update_time(40.0, "seconds")
+            return None
+        if forward_idle:
+            self.sim.time_handler.update_time(45.3, "seconds")
+            return None
+        return (45.3, "seconds")
+
+    def test_idle_intervals_as_events(self):
+        self.sim.observe_visit = self.observe_visit
+        while self.sim.time_handler.current_timestamp < self.sim.end_of_night:
+            self.sim.observe_visit(1)
+        loop_visits = self.visits
+        loop_night_end = self.sim.time_handler.current_timestamp
+
+        self.sim.time_handler = TimeHandler("2022-10-01")
+        self.visits = []
+        self.sim.event_queue.register(EventType.VISIT, self.sim.handle_visit)
+        self.sim.event_queue.push(self.start, EventType.VISIT, night=1, last_night=1)
+        self.sim.event_queue.run(self.sim.time_handler)
+        self.assertListEqual(self.visits, loop_visits)
+        self.assertListEqual(self.night_ends, [loop_night_end])
+        self.assertGreater(loop_night_end, self.sim.end_of_night)
+
+    def test_downtime_as_event(self):
+        self.sim.start_night = mock.Mock(return_value=3600.5)
+        self.sim.event_queue.register(EventType.DOWNTIME_END, self.sim.handle_downtime_end)
+        self.sim.handle_night_start(Event(self.start, EventType.NIGHT_START, 1, {"last_night": 1}))
+        self.sim.start_night.assert_called_once_with(1, forward_downtime=False)
+        self.assertEqual(self.sim.open_night.call_count, 0)
+        self.sim.event_queue.run(self.sim.time_handler)
+        self.sim.open_night.assert_called_once_with(1)
+        self.assertListEqual(self.night_ends, [self.start + 3600.5])
@@ -0,0 +1,74 @@
+import math
+import unittest
+
+from lsst.sims.ocs.kernel.state_handoff import STATE_FIELDS, STATE_LIST_FIELDS, StateHandoff
+
+class State(object):
+    """Mirror the ObservatoryState layout: stored radians with derived, read-only degrees.
+    """
+
+    def __init__(self):
+        for name in STATE_FIELDS:
+            setattr(self, name, 0.0)
+        self.filter = "r"
+        self.tracking = False
+        self.mountedfilters = ["g", "r", "i", "z", "y"]
+        self.unmountedfilters = ["u"]
+
+    @property
+    def alt(self):
+        return math.degrees(self.alt_rad)
+
+    @property
+    def telaz(self):
+        return math.degrees(self.telaz_rad)
+
+    @property
+    def domaz(self):
+        return math.degrees(self.domaz_rad)
+
+class StateHandoffTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handoff = StateHandoff()
+        self.source = State()
+
+    def test_basic_information_after_creation(self):
+        self.assertIsNone(self.handoff.state)
+        self.assertEqual(self.handoff.refreshes, 0)
+
+    def test_first_refresh(self):
+        state = self.handoff.refresh(self.source)
+        self.assertIsNot(state, self.source)
+        self.assertIsNot(state.mountedfilters, self.source.mountedfilters)
+        self.assertEqual(self.handoff.changed, STATE_FIELDS + STATE_LIST_FIELDS)
+
+    def test_only_changes_copied(self):
+        state = self.handoff.refresh(self.source)
+        self.source.time = 30.0
+        self.source.alt_rad = math.radians(60.0)
+        self.assertIs(self.handoff.refresh(self.source), state)
+        self.assertTupleEqual(self.handoff.changed, ("time", "alt_rad"))
+        self.assertAlmostEqual(state.alt, 60.0)
+        self.handoff.refresh(self.source)
+        self.assertTupleEqual(self.handoff.changed, ())
+        self.assertEqual(self.handoff.refreshes, 3)
+        self.assertEqual(self.handoff.fields_copied, len(STATE_FIELDS + STATE_LIST_FIELDS) + 2)
+
+    def test_filter_lists(self):
+        state = self.handoff.refresh(self.source)
+        self.source.mountedfilters[0] = "u"
+        self.source.unmountedfilters[0] = "g"
+        self.handoff.refresh(self.source)
+        self.assertTupleEqual(self.handoff.changed, STATE_LIST_FIELDS)
+        self.assertListEqual(state.mountedfilters, ["u", "r", "i", "z", "y"])
+        self.assertIsNot(state.mountedfilters, self.source.mountedfilters)
+
+    def test_degrees_follow_radians(self):
+        state = self.handoff.refresh(self.source)
+        self.source.telaz_rad = math.pi
+        self.source.domaz_rad = math.pi
+        self.handoff.refresh(self.source)
+        self.assertTupleEqual(self.handoff.changed, ("telaz_rad", "domaz_rad"))
+        self.assertAlmostEqual(state.telaz, 180.0)
+        self.assertAlmostEqual(state.domaz, 180.0)
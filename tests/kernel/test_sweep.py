@@ -0,0 +1,72 @@
+import argparse
+import shutil
+import tempfile
+import unittest
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from lsst.sims.ocs.database.socs_db import SocsDatabase
+from lsst.sims.ocs.kernel.sweep import SurveySweep, SweepMember
+
+class SurveySweepTest(unittest.TestCase):
+
+    def setUp(self):
+        self.options = argparse.Namespace(config_path=None, config_paths=["a", "b"], frac_duration=-1,
+                                          frac_durations=[0.1, 0.5], downtime_seed=None,
+                                          downtime_seeds=[1, 2, 3], dds_comm=True, resume=None,
+                                          from_night=None)
+        self.sweep = SurveySweep(self.options)
+
+    def test_matrix(self):
+        self.assertEqual(len(self.sweep.matrix), 12)
+        self.assertEqual(self.sweep.matrix[0], ("a", 0.1, 1))
+
+    def test_matrix_from_single_values(self):
+        self.options.config_paths = None
+        self.options.downtime_seeds = None
+        self.assertListEqual(self.sweep.matrix, [(None, 0.1, None), (None, 0.5, None)])
+
+    def test_member_options(self):
+        options = self.sweep.member_options(SweepMember(2001, "b", 0.5, 3))
+        self.assertEqual(options.session_id, 2001)
+        self.assertEqual(options.config_path, "b")
+        self.assertEqual(options.frac_duration, 0.5)
+        self.assertEqual(options.downtime_seed, 3)
+        self.assertFalse(options.dds_comm)
+        self.assertIsNone(self.options.config_path)
+
+    def test_manifest(self):
+        self.sweep.members = [SweepMember(2000, "a", 0.1, 1), SweepMember(2001, "a", 0.1, 2)]
+        manifest = self.sweep.manifest({2000: ("completed", 10.0)})
+        self.assertEqual(manifest[0]["status"], "completed")
+        self.assertEqual(manifest[1]["status"], "pending")
+        self.assertIsNone(manifest[1]["run_time"])
+
+    @mock.patch("lsst.sims.ocs.database.socs_db.get_hostname")
+    def test_allocate_sessions_with_deferred_indexes(self, mock_get_hostname):
+        mock_get_hostname.return_value = "tester"
+        save_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, save_dir)
+        self.options.config_paths = None
+        self.options.frac_durations = None
+        self.options.downtime_seeds = None
+        self.options.startup_comment = "Sweep"
+        self.options.sqlite_save_dir = save_dir
+        self.options.sqlite_session_save_dir = None
+        self.options.session_id_start = None
+        self.options.db_durability = None
+        self.options.output_format = "sqlite"
+        self.options.db_deferred_indexes = True
+        self.options.db_working_path = None
+        SocsDatabase(sqlite_save_path=save_dir).create_db()
+        self.sweep.allocate_sessions()
+        self.assertEqual(len(self.sweep.members), 1)
+
+        db = SocsDatabase(sqlite_save_path=save_dir, deferred_indexes=True)
+        db.resume_session(self.sweep.members[0].session_id)
+        db.create_indexes()
+        indexes = db._get_conn().execute("select name from sqlite_master where type = 'index' "
+                                         "and name not like 'sqlite_%'").fetchall()
+        self.assertEqual(len(indexes), len(db._get_indexes()))
@@ -1,8 +1,9 @@
 from builtins import range
 from datetime import datetime
+from datetime import timedelta
 import unittest
 
-from lsst.sims.ocs.kernel.time_handler import TimeHandler
+from lsst.sims.ocs.kernel.time_handler import EpochTimeHandler, TimeHandler
 from lsst.sims.ocs.utilities.constants import SECONDS_IN_DAY
 
 class TimeHandlerTest(unittest.TestCase):
@@ -97,3 +98,41 @@ class TimeHandlerTest(unittest.TestCase):
         self.assertEqual(self.th.time_since_given_datetime(past_given_date, reverse=True), 2937600)
         same_given_date = datetime(self.th.initial_dt.year, 5, 24)
         self.assertEqual(self.th.time_since_given_datetime(same_given_date, reverse=True), 0)
+
+    def test_get_and_set_state(self):
+        self.th.update_time(10, "days")
+        state = self.th.get_state()
+        th = TimeHandler(self.start_date)
+        th.set_state(state)
+        self.assertEqual(th.current_dt, self.th.current_dt)
+        self.assertEqual(th.current_timestamp, self.th.current_timestamp)
+
+class EpochTimeHandlerTest(TimeHandlerTest):
+
+    def setUp(self):
+        self.start_date = "2020-05-24"
+        self.th = EpochTimeHandler(self.start_date)
+
+    def test_timestamps_match_time_handler(self):
+        th = TimeHandler(self.start_date)
+        for time_increment, time_units in [(34.7, "seconds"), (0.1, "seconds"), (1e-7, "seconds"),
+                                           (2.5, "minutes"), (7.3, "hours"), (1, "days")] * 50:
+            th.update_time(time_increment, time_units)
+            self.th.update_time(time_increment, time_units)
+            self.assertEqual(self.th.current_timestamp, th.current_timestamp)
+            self.assertEqual(self.th.time_since_start, th.time_since_start)
+            timestamp = th.current_timestamp + 0.1234565
+            self.assertEqual(self.th.time_since_given(timestamp), th.time_since_given(timestamp))
+            self.assertEqual(self.th.future_timestamp(30.0, "seconds", timestamp=timestamp),
+                             th.future_timestamp(30.0, "seconds", timestamp=timestamp))
+        self.assertEqual(self.th.current_dt, th.current_dt)
+        self.assertEqual(self.th.current_timestring, th.current_timestring)
+
+    def test_increment_rounding_matches_timedelta(self):
+        for time_increment, time_units in [(1.5, "microseconds"), (2.5, "microseconds"),
+                                           (-2.5, "microseconds"), (3.5e-6, "seconds"), (4.5e-6, "seconds"),
+                                           (30.0000025, "seconds"), (1e-7, "seconds"), (1.0 / 3, "minutes"),
+                                           (-7.3, "hours"), (0.1, "days"), (2, "weeks")]:
+            delta = timedelta(**{time_units: time_increment})
+            self.assertEqual(self.th._increment_us(time_increment, time_units),
+                             EpochTimeHandler._timedelta_us(delta))
@@ -6,7 +6,7 @@ from SALPY_scheduler import scheduler_observationC
 
 from lsst.ts.schedulerConfig import Observatory, ObservingSite
 from lsst.sims.ocs.kernel import TimeHandler
-from lsst.sims.ocs.observatory import MainObservatory
+from lsst.sims.ocs.observatory import MainObservatory, snapshot_state
 
 from tests.database import topic_helpers
 
@@ -29,6 +29,21 @@ class MainObservatoryTest(unittest.TestCase):
     def test_object_has_no_attribute(self):
         with self.assertRaises(AttributeError):
             self.observatory.no_find
+        with self.assertRaises(AttributeError):
+            self.observatory.lastslew_delays_dict
+
+    def test_model_fallback(self):
+        self.observatory.model_fallback = True
+        self.assertIs(self.observatory.lastslew_delays_dict, self.observatory.model.lastslew_delays_dict)
+        with self.assertRaises(AttributeError):
+            self.observatory.no_find
+
+    def test_delegation(self):
+        self.observatory_configure()
+        self.assertIs(self.observatory.current_state, self.observatory.model.current_state)
+        self.assertIs(self.observatory.park_state, self.observatory.model.park_state)
+        self.assertEqual(self.observatory.park, self.observatory.model.park)
+        self.assertEqual(self.observatory.update_state, self.observatory.model.update_state)
 
     def test_basic_information_after_creation(self):
         self.assertIsNotNone(self.observatory.log)
@@ -111,6 +126,7 @@ class MainObservatoryTest(unittest.TestCase):
         self.assertEqual(ss.telAlt, 86.5)
         self.assertEqual(ss.domeAlt, 90.0)
         self.assertEqual(ss.filter, 'z')
+        self.assertEqual(self.observatory.get_slew_state(snapshot_state(current_state)), ss)
 
     def test_get_slew_activites(self):
         self.observatory_configure()
@@ -0,0 +1,111 @@
+import math
+import unittest
+
+from lsst.sims.ocs.observatory.slew_cache import PEAKSPEED_FIELDS, POSITION_FIELDS, SlewCache
+
+class State(object):
+    """Mirror the ObservatoryState layout: stored radians with derived, read-only degrees.
+    """
+
+    def __init__(self, telalt, filter_name="r"):
+        for name in POSITION_FIELDS:
+            setattr(self, name, 0.0)
+        for name in PEAKSPEED_FIELDS:
+            setattr(self, name, 0.0)
+        self.telalt_rad = math.radians(telalt)
+        self.filter = filter_name
+        self.tracking = False
+
+    @property
+    def telalt(self):
+        return math.degrees(self.telalt_rad)
+
+    @property
+    def telalt_peakspeed(self):
+        return math.degrees(self.telalt_peakspeed_rad)
+
+class Model(object):
+
+    def __init__(self):
+        self.calls = 0
+        self.offset = 0.0
+        self.lastslew_delays_dict = {}
+        self.lastslew_criticalpath = []
+
+    def get_slew_delay_for_state(self, targetstate, initstate, include_slew_data=False):
+        self.calls += 1
+        delay = round(abs(targetstate.telalt - initstate.telalt), 6) + self.offset
+        targetstate.telalt_peakspeed_rad = math.radians(3.5)
+        if include_slew_data:
+            self.lastslew_delays_dict = {"telalt": delay}
+            self.lastslew_criticalpath = ["telalt"]
+        return delay
+
+    def slew(self, targetstate, initstate):
+        return self.get_slew_delay_for_state(targetstate, initstate, True)
+
+class SlewCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.cache = SlewCache(self.model, max_size=2)
+        self.cache.install()
+
+    def test_basic_information_after_creation(self):
+        cache = SlewCache(Model())
+        self.assertEqual(cache.max_size, 100000)
+        self.assertEqual(cache.resolution, 1.0e-3)
+        self.assertFalse(cache.strict)
+        self.assertEqual(len(cache), 0)
+
+    def test_install_without_calculation(self):
+        cache = SlewCache(object())
+        self.assertFalse(cache.install())
+
+    def test_hit(self):
+        self.assertEqual(self.model.slew(State(60.0), State(50.0)), 10.0)
+        self.model.lastslew_delays_dict = {}
+        target = State(60.0002)
+        self.assertEqual(self.model.slew(target, State(50.0)), 10.0)
+        self.assertEqual(self.model.calls, 1)
+        self.assertAlmostEqual(target.telalt_peakspeed, 3.5)
+        self.assertDictEqual(self.model.lastslew_delays_dict, {"telalt": 10.0})
+        self.assertListEqual(self.model.lastslew_criticalpath, ["telalt"])
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_filter_in_key(self):
+        self.model.slew(State(60.0), State(50.0))
+        self.model.slew(State(60.0, "g"), State(50.0))
+        self.assertEqual(self.model.calls, 2)
+
+    def test_without_slew_data(self):
+        self.model.get_slew_delay_for_state(State(60.0), State(50.0))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_least_recently_used(self):
+        self.model.slew(State(60.0), State(50.0))
+        self.model.slew(State(70.0), State(50.0))
+        self.model.slew(State(60.0), State(50.0))
+        self.model.slew(State(80.0), State(50.0))
+        self.assertEqual(len(self.cache), 2)
+        self.model.slew(State(60.0), State(50.0))
+        self.assertEqual(self.model.calls, 3)
+        self.model.slew(State(70.0), State(50.0))
+        self.assertEqual(self.model.calls, 4)
+
+    def test_clear(self):
+        self.model.slew(State(60.0), State(50.0))
+        self.cache.clear()
+        self.model.slew(State(60.0), State(50.0))
+        self.assertEqual(self.model.calls, 2)
+
+    def test_strict(self):
+        self.cache.strict = True
+        self.model.slew(State(60.0), State(50.0))
+        self.model.offset = 1.0
+        self.assertEqual(self.model.slew(State(60.0), State(50.0)), 11.0)
+        self.assertEqual(self.model.calls, 2)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.mismatches, 1)
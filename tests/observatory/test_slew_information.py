@@ -1,6 +1,7 @@
 import unittest
 
 from lsst.sims.ocs.observatory import SlewActivity, SlewHistory, SlewMaxSpeeds, SlewState
+from lsst.sims.ocs.observatory import StateSnapshot, snapshot_state
 
 class SlewInformationTest(unittest.TestCase):
 
@@ -54,3 +55,16 @@ class SlewInformationTest(unittest.TestCase):
         self.assertEqual(sm.telAzSpeed, 1.1)
         self.assertEqual(sm.rotatorSpeed, 0.1)
         self.assertEqual(sm.SlewHistory_slewCount, 1)
+
+    def test_snapshot_state(self):
+        class State(object):
+            pass
+        state = State()
+        for i, name in enumerate(StateSnapshot._fields):
+            setattr(state, name, float(i))
+        snapshot = snapshot_state(state)
+        self.assertEqual(len(snapshot._fields), 21)
+        self.assertEqual(snapshot.time, 0.0)
+        self.assertEqual(snapshot.telrot_peakspeed, 20.0)
+        state.time = 30.0
+        self.assertEqual(snapshot.time, 0.0)
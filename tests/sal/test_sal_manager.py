@@ -63,3 +63,10 @@ class SalManagerTest(unittest.TestCase):
         self.sal.initialize()
         topic = self.sal.get_topic(self.publish_topic)
         self.assertIsNotNone(topic)
+
+    @mock.patch("lsst.sims.ocs.sal.sal_manager.SALPY_scheduler", None)
+    def test_missing_sal_package(self):
+        with self.assertRaises(ImportError):
+            self.sal.initialize()
+        with self.assertRaises(ImportError):
+            self.sal.get_topic(self.publish_topic)
@@ -0,0 +1,46 @@
+import pickle
+import unittest
+
+from lsst.sims.ocs.sal import create_topic, topic_strdict
+from lsst.sims.ocs.sal.topic_structs import MAX_PROPOSALS, TOPIC_STRUCTS
+
+class TopicStructsTest(unittest.TestCase):
+
+    def test_create_topic(self):
+        for name, cls in TOPIC_STRUCTS.items():
+            self.assertIsInstance(create_topic(name), cls)
+        with self.assertRaises(KeyError):
+            create_topic("badTopic")
+
+    def test_defaults(self):
+        target = create_topic("logevent_target")
+        self.assertEqual(target.targetId, 0)
+        self.assertEqual(target.note, "")
+        self.assertEqual(len(target.exposureTimes), 10)
+        self.assertEqual(len(target.proposalId), MAX_PROPOSALS)
+
+    def test_arrays_not_shared(self):
+        target1 = create_topic("logevent_target")
+        target2 = create_topic("logevent_target")
+        target1.exposureTimes[0] = 15
+        self.assertEqual(target2.exposureTimes[0], 0)
+
+    def test_unknown_attribute(self):
+        seeing = create_topic("seeing")
+        with self.assertRaises(AttributeError):
+            seeing.bulkCloud = 0.5
+
+    def test_pickle(self):
+        observation = create_topic("observation")
+        observation.observationId = 5
+        observation.exposureTimes[1] = 15
+        restored = pickle.loads(pickle.dumps(observation))
+        self.assertEqual(restored.observationId, 5)
+        self.assertEqual(restored.exposureTimes[1], 15)
+
+    def test_topic_strdict(self):
+        bulk_cloud = create_topic("bulkCloud")
+        bulk_cloud.bulkCloud = 0.25
+        output = topic_strdict(bulk_cloud)
+        self.assertListEqual(list(output.keys()), ["bulkCloud", "timestamp"])
+        self.assertEqual(output["bulkCloud"], "0.250")